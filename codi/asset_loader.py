@@ -0,0 +1,100 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+### VARIABLES GLOBALS ###
+# Fils de treball per a la feina de CPU (decodificació de textures, lectura dels CSV)
+ASSET_WORKERS = 4
+# Temps màxim (en segons) per frame dedicat a pujar recursos a OpenGL durant la càrrega
+ASSET_FRAME_BUDGET = 1 / 60
+
+
+class AssetLoader:
+    """Càrrega dels recursos de l'escena repartida entre frames.
+    La feina de CPU s'envia als fils de treball (submit) i la creació dels objectes d'OpenGL, que només
+    es pot fer al fil principal, és un generador de passos que s'avança fins a esgotar el pressupost del frame.
+    Un pas que retorna None espera un fil de treball: el frame acaba i es torna a provar al següent
+    """
+    __slots__ = (
+        "pool",
+        "steps",
+        "progress",
+    )
+
+    def __init__(self, workers=ASSET_WORKERS):
+        """Inicialització de la classe AssetLoader
+
+        Args:
+            workers (int, optional): Nombre de fils de treball. Defaults to ASSET_WORKERS.
+        """
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+        # Generador de passos del fil principal; cada pas retorna el progrés (0-1) o None si espera
+        self.steps = None
+        self.progress = 1.0
+
+    def submit(self, function, *args):
+        """Executar feina de CPU en un fil de treball. No pot fer crides a OpenGL
+
+        Args:
+            function (callable): Funció a executar
+            *args: Arguments de la funció
+
+        Returns:
+            Future: Resultat de la funció
+        """
+        return self.pool.submit(function, *args)
+
+    def load(self, steps):
+        """Començar una càrrega
+
+        Args:
+            steps (generator): Passos del fil principal, cadascun retorna el progrés (0-1) o None si espera
+        """
+        self.steps = steps
+        self.progress = 0.0
+
+    @property
+    def finished(self):
+        """Comprovar si s'han executat tots els passos
+
+        Returns:
+            bool: True si no queda cap pas pendent
+        """
+        return self.steps is None
+
+    def update(self, budget=ASSET_FRAME_BUDGET):
+        """Executar passos fins a esgotar el pressupost del frame (com a mínim un pas per crida)
+
+        Args:
+            budget (float, optional): Temps màxim en segons. Defaults to ASSET_FRAME_BUDGET.
+
+        Returns:
+            bool: True si la càrrega ha acabat
+        """
+        if self.steps is None:
+            return True
+
+        start = time.perf_counter()
+        try:
+            while True:
+                progress = next(self.steps)
+                if progress is None:
+                    return False
+                self.progress = progress
+                if time.perf_counter() - start >= budget:
+                    return False
+        except StopIteration:
+            self.steps = None
+            self.progress = 1.0
+            return True
+
+    def finish(self):
+        """Executar tots els passos pendents de cop (càrrega síncrona)
+        """
+        while not self.update(float("inf")):
+            # Un pas espera un fil de treball
+            time.sleep(0.001)
+
+    def shutdown(self):
+        """Aturar els fils de treball
+        """
+        self.pool.shutdown(cancel_futures=True)
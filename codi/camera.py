@@ -68,6 +68,16 @@ class Camera:
             glm.vec4: Matriu projecció 
         """
         return glm.perspective(glm.radians(45), self.aspec_ratio, 0.1, 100000)
+
+    def resize(self, win_size):
+        """Actualitzar la relació d'aspecte i la matriu de projecció amb la nova mida de la finestra.
+        Els shaders la reben del uniform buffer compartit (app.projection)
+
+        Args:
+            win_size (tuple): Amplada i alçada de la finestra
+        """
+        self.aspec_ratio = win_size[0]/win_size[1]
+        self.m_proj = self.get_projection_matrix()
     
     def get_type(self):
         return "Camera"
@@ -102,9 +112,12 @@ class Camera:
         self.m_view = self.get_view_matrix()
         # Update all shaders
         for object in self.app.objects:
-            object.shader['m_view'].write(self.m_view)
+            # Els cossos del BodyBatch no tenen programa propi
+            if object.shader is not None:
+                object.shader['m_view'].write(self.m_view)
         for orbit in self.app.orbits:
             orbit.shader['m_view'].write(self.m_view)
+        self.app.bodies.shader['m_view'].write(self.m_view)
         self.app.stars.shader['m_view'].write(self.m_view)
         self.app.stars.constellations_shader['m_view'].write(self.m_view)
 
@@ -121,28 +134,29 @@ class Camera:
         # Update the view matrix with new yaw and pitch
         self.update_shaders_m_view()
     
-    def process_keyboard(self):
+    def process_keyboard(self, keys):
         """Actualitzar la càmera segons els events de l'aplicació (WASD, Space i Ctrl)
+
+        Args:
+            keys (set): Tecles mantingudes premudes (EventBus.held)
         """
-        # Get the current key state
-        keys = pg.key.get_pressed()
 
         # Forward and backward movement (W and S)
-        if keys[pg.K_w]:
+        if pg.K_w in keys:
             self.move_forward(self.speed)
-        if keys[pg.K_s]:
+        if pg.K_s in keys:
             self.move_forward(-self.speed)
 
         # Strafe left and right (A and D)
-        if keys[pg.K_a]:
+        if pg.K_a in keys:
             self.strafe(-self.speed)
-        if keys[pg.K_d]:
+        if pg.K_d in keys:
             self.strafe(self.speed)
 
         # Move upward (Spacebar) or downward (Control key)    
-        if keys[pg.K_SPACE]:
+        if pg.K_SPACE in keys:
             self.move_upward(self.speed)
-        if keys[pg.K_LCTRL] or keys[pg.K_RCTRL]:  # Left or Right Control
+        if pg.K_LCTRL in keys or pg.K_RCTRL in keys:  # Left or Right Control
             self.move_upward(-self.speed)
     
     def move_forward(self, speed):
@@ -309,20 +323,23 @@ class FollowCamera(Camera):
         # Pitch is the vertical angle of the forward vector
         self.pitch = glm.degrees(glm.asin(forward.y / glm.length(forward)))
         
-    def process_keyboard(self):
-        # Get the current key state
-        keys = pg.key.get_pressed()
+    def process_keyboard(self, keys):
+        """Moure la càmera al voltant del target segons les tecles premudes (WASD, Q i E)
+
+        Args:
+            keys (set): Tecles mantingudes premudes (EventBus.held)
+        """
 
         # Change the elevation relative to the object. 
         # While lock_target, it takes the same time to wrap around any planet.
         increment = glm.vec3(0, 0, 0)
-        if keys[pg.K_w]:
+        if pg.K_w in keys:
             if self.lock_target:
                 self.keep_up = False
                 increment += self.up * 0.1
             else:
                 self.elevation = (self.elevation + self.speed) % 360
-        if keys[pg.K_s]:
+        if pg.K_s in keys:
             if self.lock_target:
                 self.keep_up = False
                 increment -= self.up * 0.1
@@ -330,13 +347,13 @@ class FollowCamera(Camera):
                 self.elevation = (self.elevation - self.speed) % 360
         # Change the azimuth relative to the object. 
         # While lock_target, it takes the same time to wrap around any planet.
-        if keys[pg.K_a]:
+        if pg.K_a in keys:
             if self.lock_target:
                 self.keep_up = True
                 increment -= self.right * 0.1
             else:
                 self.azimuth = (self.azimuth + self.speed) % 360
-        if keys[pg.K_d]:
+        if pg.K_d in keys:
             if self.lock_target:
                 self.keep_up = True
                 increment += self.right * 0.1
@@ -345,9 +362,9 @@ class FollowCamera(Camera):
                 # Update the relative position
 
         # Roll movement, defined by an arbitrary rotation angle in radians
-        if keys[pg.K_q]:  # Roll counterclockwise
+        if pg.K_q in keys:  # Roll counterclockwise
             self.roll(-1)
-        if keys[pg.K_e]:  # Roll clockwise
+        if pg.K_e in keys:  # Roll clockwise
             self.roll(1)
 
         self.relative_position += increment
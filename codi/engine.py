@@ -1,22 +1,32 @@
-import json
 import pygame as pg
 import moderngl as mgl
 import glm
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 # from axis import Axis
 from camera import Camera, FollowCamera
+from event_bus import EventBus
+from ephemeris import Ephemeris
+from frustum import Frustum, CullingStats
+from projection import Projection
+from asset_loader import AssetLoader
+from render_queue import RenderQueue
+from resource_tracker import TrackedContext
 from light import Light
+from metrics import Metrics
 from objects import *
 from reader import Reader
-from gui import GUIManager
+from gui import GUIManager, SliderChanged, Toggled
 import shaders as sh
 import os
-import re as regex
 
 
 ### VARIABLES GLOBALS ###
 UA_CONVERSION = 149_600_000  # 1 UA en kilómetros
 FPS = 120  # Adaptable als FPS que et pots permetre
+EPHEMERIS_RANGE = (datetime(1999, 1, 1), datetime(2010, 1, 1))  # Dates precalculades de les òrbites
+EPHEMERIS_PATH = "data/ephemeris.npz"
 
 
 class GraphicsEngine:
@@ -48,20 +58,38 @@ class GraphicsEngine:
         "key_planet_map",
         "initial_speed",
         "realistic_mode",
-        "capture_value",
-        "capture_element",
+        "events",
         "time_map",
         "step",
+        "ephemeris",
+        "simulation_pool",
+        "frustum",
+        "culling",
+        "resources",
+        "render_queue",
+        "bodies",
+        "texture_cache",
+        "assets",
+        "body_textures",
+        "texture_quality",
+        "projection",
+        "metrics",
     )
 
-    def __init__(self, testing=False, debug=False, fs=True, win_size=(1200, 800)):
+    def __init__(self, testing=False, debug=False, fs=True, win_size=(1200, 800), ephemeris_range=EPHEMERIS_RANGE,
+                 texture_quality=TEXTURE_QUALITY):
         """Inicialització de la classe GraphicsEngine
 
         Args:
             fs (bool, optional): Si es True, s'executa en full screen. Defaults to True
             win_size (tuple, optional): Tamany de finestra de l'aplicació. Defaults to (900,800).
+            ephemeris_range (tuple, optional): Dates (inici, final) que cobreixen les efemèrides. Defaults to EPHEMERIS_RANGE.
+            texture_quality (str, optional): Qualitat de les textures dels cossos ("low", "medium" o "high"). Defaults to TEXTURE_QUALITY.
         """
         self.DEBUG = debug
+        if texture_quality not in TEXTURE_TIERS:
+            raise ValueError(f"Qualitat de textures desconeguda: {texture_quality} (opcions: {', '.join(TEXTURE_TIERS)})")
+        self.texture_quality = texture_quality
 
         if testing:
             # En cas de fer unittesting, es necessita actualitzar el directori
@@ -84,8 +112,16 @@ class GraphicsEngine:
             pg.GL_CONTEXT_PROFILE_MASK, pg.GL_CONTEXT_PROFILE_CORE)
 
         # create opengl context
-        pg.display.set_mode(self.WIN_SIZE, flags=pg.OPENGL | pg.DOUBLEBUF)
-        self.ctx = mgl.create_context()
+        pg.display.set_mode(self.WIN_SIZE, flags=pg.OPENGL | pg.DOUBLEBUF | pg.RESIZABLE)
+        # Tots els recursos de la GPU es registren (self.ctx.tracker) per detectar fuites en tancar
+        self.ctx = TrackedContext(mgl.create_context())
+        # Programs i textures compartits, i cua de renderització ordenada per estat
+        self.resources = ResourceCache(self.ctx)
+        # Textures decodificades de les execucions anteriors (textures/cache)
+        self.texture_cache = TextureCache()
+        # Càrrega dels recursos en fils de treball i passos repartits entre frames
+        self.assets = AssetLoader()
+        self.render_queue = RenderQueue()
 
         # camera
         self.camera = Camera(self)
@@ -93,39 +129,48 @@ class GraphicsEngine:
         # TODO: que la classe calculi una distància entre la superfície del planeta i el seu satèl·lit més proper
         # Per a la presentació, habilitar les diferents càmeres
         self.second_cam = FollowCamera(self)
+        # Matriu de projecció compartida per tots els shaders (uniform buffer)
+        self.projection = Projection(self.ctx, self.camera.m_proj)
         # light
         self.light = Light()
+        # frustum culling
+        self.frustum = Frustum(self.camera.m_proj, self.camera.m_view)
+        self.culling = CullingStats()
 
         self.objects = []
         self.orbits = []
 
         self.aux_objects = []  # 2n mode
         self.aux_orbits = []  # 2n mode
+        # Es creen durant la càrrega (load_objects)
+        self.stars = None
+        self.bodies = None
+        self.body_textures = None
 
         self.clock = pg.time.Clock()
         self.time = 0
         self.step = 1.1574e-8  # Velocitat real
+        self.ephemeris = Ephemeris(*ephemeris_range)
+        # Fil de simulació: calcula el frame N+1 mentre el fil principal renderitza el frame N
+        self.simulation_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simulation")
 
         # gui
         self.gui = GUIManager(self)
-
-        with open("gui_layout.json", "r") as file:
-            gui_layout = json.load(file)
-
-        self.gui.batch_add_elements(gui_layout)
+        # Layout compilat (mides de la finestra i glifs dels textos) desat a data/gui_cache
+        self.gui.load_layout("gui_layout.json")
         self.gui["planet_menu"]["Mercury"].toggle()
 
-        self.capture_value = regex.compile(":([0-9.]*)")
-        self.capture_element = regex.compile("([a-zA-Z0-9_]*)")
+        self.initial_speed = self.second_cam.speed
 
-        self.create_objects()
+        # Els objectes es creen durant els primers frames (run), mentre es mostra el progrés
+        if testing:
+            # Els tests necessiten l'escena sencera en acabar la inicialització
+            self.create_objects()
+            self.gui["loading"].hide()
+        else:
+            self.assets.load(self.load_objects())
         # axis
         # self.objects.append(Axis(self))
-
-        # Establim un target a la càmera. Això hauria d'estar al check_events
-        # Aquesta línia saltarà error si la càmera inicialitzada no és del tipus "FollowCamera"
-        self.initial_speed = self.second_cam.speed
-        self.second_cam.select_target("Mercury")
         # Informació relacionada amb el context de l'aplicació
         self.info = "Visualització del sol"
         self.ellipse = True
@@ -150,6 +195,14 @@ class GraphicsEngine:
         }
         self.realistic_mode = False
 
+        # Handlers de les tecles i dels events de la GUI
+        self.events = EventBus()
+        self.register_events()
+
+        # Mètriques de rendiment (HUD de rendiment, F2)
+        self.metrics = Metrics()
+        self.register_metrics()
+
     def obtain_data_planets(self):
         """Obtenció de les dades dels planetes cridant al seu dataset
 
@@ -254,7 +307,18 @@ class GraphicsEngine:
         return normalized_radii, normalized_distances, normalized_radii_real, normalized_distances_real, ideal_dists
 
     def create_objects(self):
-        """Creació dels objectes que formaràn part de l'escena
+        """Creació dels objectes que formaràn part de l'escena, de cop
+        """
+        self.assets.load(self.load_objects())
+        self.assets.finish()
+
+    def load_objects(self):
+        """Generador que crea els objectes de l'escena pas a pas. La lectura dels CSV i la decodificació
+        de les textures s'envien als fils de treball de self.assets, i cada pas (crear un objecte, pujar
+        una capa de textura...) fa les crides a OpenGL al fil principal
+
+        Yields:
+            float | None: Progrés de la càrrega (0-1), o None mentre s'espera un fil de treball
         """
         self.objects_index = {}
         index = 0
@@ -275,8 +339,33 @@ class GraphicsEngine:
                                     "Uranus": "textures/satellites/ariel.jpg",
                                     "Neptune": "textures/satellites/triton.jpg"}
 
-        self.planets_data = self.obtain_data_planets()
+        # Feina de CPU en paral·lel: dades dels planetes, estrelles i textures
+        planets_data = self.assets.submit(self.obtain_data_planets)
+        stars_data = self.assets.submit(Reader.read_stars, "data/stars.csv")
+        # Variants reduïdes de les textures dels cossos, de la mida que correspon a la qualitat escollida
+        texture_size, _ = TEXTURE_TIERS[self.texture_quality]
+        # Les textures dels asteroides i els anells es necessiten abans que les capes dels cossos
+        self.texture_cache.prefetch(self.assets.pool, "textures/asteroids.jpg", 3)
+        for texture in ("textures/saturn_rings.png", "textures/uranus_rings.png"):
+            self.texture_cache.prefetch(self.assets.pool, texture, 4, mirror=False)
+        body_textures = ["textures/sun.jpg", *self.planets_textures, *self.satellites_textures.values()]
+        for texture in body_textures:
+            self.texture_cache.prefetch(self.assets.pool, texture, 3, texture_size)
+
+        satellites_data = self.assets.submit(Reader.read_satellites, "data/satellites.csv")
+
+        # Sense bloquejar el fil principal mentre els fils de treball llegeixen els CSV
+        while not (planets_data.done() and satellites_data.done()):
+            yield None
+        self.planets_data = planets_data.result()
         radius_objects, distance_objects, real_radius, real_distance, self.ideal_dists = self.radius_distance_objects()
+        satellites_reader = satellites_data.result()
+
+        # Passos de la càrrega: capes de textura, cossos, òrbites, efemèrides, asteroides, anells, estrelles i batch
+        self.body_textures = TextureArray(self.ctx, body_textures, texture_size)
+        total = (len(self.body_textures) + 2 + 2 * len(self.planets_list) + 2 + len(satellites_reader.data)
+                 + 1 + 3 + 2 + 1 + 2)
+        done = 0
 
         #! IMPORTANT ANNOTATION:
         ### MODE 1 - Visualització realista ###
@@ -287,24 +376,28 @@ class GraphicsEngine:
         self.objects.append(Sun(
             self,
             [sh.vertex_shader_SUN, sh.fragment_shader_SUN],
-            "textures/sun.jpg",
+            self.body_textures.layer("textures/sun.jpg"),
             [radius_objects["Sun"], 25, 25],
         ))
         self.objects_index["Sun"] = index
         index += 1
+        yield (done := done + 1) / total
         self.aux_objects.append(Sun(
             self,
             [sh.vertex_shader_SUN, sh.fragment_shader_SUN],
-            "textures/sun.jpg",
+            self.body_textures.layer("textures/sun.jpg"),
             [real_radius["Sun"], 25, 25],
         ))
+        yield (done := done + 1) / total
 
-        # Llista de planetes i òrbites
+        # Llista de planetes i òrbites (semieix major, excentricitat, color)
+        orbits = []
+        real_orbits = []
         for planet, texture in zip(self.planets_list, self.planets_textures):
             self.objects.append(Planet(
                 self,
                 [sh.vertex_shader_PLANET, sh.fragment_shader_PLANET],
-                texture,
+                self.body_textures.layer(texture),
                 [radius_objects[planet], 20, 20],
                 glm.vec3(1, 1, 1),
                 glm.vec3(distance_objects[planet], 0,
@@ -315,10 +408,12 @@ class GraphicsEngine:
             ))
             self.objects_index[planet] = index
             index += 1
+            self.objects[-1].register_ephemeris(self.ephemeris, planet)
+            yield (done := done + 1) / total
             self.aux_objects.append(Planet(
                 self,
                 [sh.vertex_shader_PLANET, sh.fragment_shader_PLANET],
-                texture,
+                self.body_textures.layer(texture),
                 [real_radius[planet], 15, 15],
                 glm.vec3(1, 1, 1),
                 glm.vec3(real_distance[planet], 0, real_distance[planet]),
@@ -326,32 +421,26 @@ class GraphicsEngine:
                 self.planets_data[planet].data["Orbital Inclination (degrees)"],
                 self.planets_data[planet].data["Orbital Eccentricity"],
             ))
+            self.aux_objects[-1].register_ephemeris(self.ephemeris, planet + "_real")
+            yield (done := done + 1) / total
 
-            self.orbits.append(Orbit(
-                self,
-                [sh.vertex_shader_ELLIPSE, sh.fragment_shader_ELLIPSE],
-                texture,
-                [radius_objects[planet], 15, 15],
-                glm.vec3(distance_objects[planet], 0,
-                         distance_objects[planet]),
-                self.planets_data[planet].data["Orbital Eccentricity"]
-            ))
+            eccentricity = self.planets_data[planet].data["Orbital Eccentricity"]
+            orbits.append((glm.length(glm.vec2(distance_objects[planet], distance_objects[planet])),
+                           eccentricity, ORBIT_COLOR))
+            real_orbits.append((glm.length(glm.vec2(real_distance[planet], real_distance[planet])),
+                                eccentricity, ORBIT_COLOR))
 
-            self.aux_objects.append(Orbit(
-                self,
-                [sh.vertex_shader_ELLIPSE, sh.fragment_shader_ELLIPSE],
-                texture,
-                [real_radius[planet], 15, 15],
-                glm.vec3(real_distance[planet], 0, real_distance[planet]),
-                self.planets_data[planet].data["Orbital Eccentricity"]
-            ))
+        # Totes les òrbites de cada mode es dibuixen amb una sola crida instanciada
+        self.orbits.append(OrbitBatch(self, [sh.vertex_shader_ELLIPSE, sh.fragment_shader_ELLIPSE], orbits))
+        yield (done := done + 1) / total
+        self.aux_orbits.append(OrbitBatch(self, [sh.vertex_shader_ELLIPSE, sh.fragment_shader_ELLIPSE], real_orbits))
+        yield (done := done + 1) / total
 
-        satellites_reader = Reader.read_satellites("data/satellites.csv")
         for _, row in satellites_reader.data.iterrows():
             name = row['name']
             planet = row['planet']
             velocity = row['Velocity (km/s)']
-            texture = self.satellites_textures[planet]
+            texture = self.body_textures.layer(self.satellites_textures[planet])
 
             self.objects.append(Satellite(
                 self,
@@ -370,8 +459,16 @@ class GraphicsEngine:
                     "Orbital Inclination (degrees)"],
                 eccentricity=self.planets_data[planet].data["Orbital Eccentricity"],
             ))
+            self.objects[-1].register_ephemeris(self.ephemeris, name, planet)
+            yield (done := done + 1) / total
+
+        # Precàlcul (o càrrega de la memòria cau) de les efemèrides de planetes i satèl·lits
+        self.ephemeris.build(EPHEMERIS_PATH)
+        yield (done := done + 1) / total
 
         # Add asteroids
+        while not self.texture_cache.ready("textures/asteroids.jpg", 3):
+            yield None
         speed_asteroids = (self.planets_data["Mars"].data["Orbital Velocity (km/s)"] +
                            self.planets_data["Jupiter"].data["Orbital Velocity (km/s)"])/(FPS*2)
         # Main asteroid Belt
@@ -388,6 +485,7 @@ class GraphicsEngine:
             type="Belt",
             enable_collision=True
         ))
+        yield (done := done + 1) / total
         # Trojan Asteroids
         self.objects.append(AsteroidBatch(
             self,
@@ -402,6 +500,7 @@ class GraphicsEngine:
             eccentricity=self.planets_data["Jupiter"].data["Orbital Eccentricity"],
             type="Trojan Right"
         ))
+        yield (done := done + 1) / total
         self.objects.append(AsteroidBatch(
             self,
             [sh.vertex_shader_ASTEROID, sh.fragment_shader_ASTEROID],
@@ -415,8 +514,12 @@ class GraphicsEngine:
             eccentricity=self.planets_data["Jupiter"].data["Orbital Eccentricity"],
             type="Trojan Left"
         ))
+        yield (done := done + 1) / total
 
         # Saturn rings
+        while not all(self.texture_cache.ready(texture, 4, mirror=False)
+                      for texture in ("textures/saturn_rings.png", "textures/uranus_rings.png")):
+            yield None
         self.objects.append(RingBatch(
             self,
             [sh.vertex_shader_RING, sh.fragment_shader_RING],
@@ -429,6 +532,7 @@ class GraphicsEngine:
             FPS,
             eccentricity=self.planets_data["Saturn"].data["Orbital Eccentricity"]
         ))
+        yield (done := done + 1) / total
 
         # Uranus rings
         self.objects.append(RingBatch(
@@ -443,9 +547,10 @@ class GraphicsEngine:
             FPS,
             eccentricity=self.planets_data["Uranus"].data["Orbital Eccentricity"]
         ))
+        yield (done := done + 1) / total
 
         # Implement stars
-        star_reader = Reader.read_stars("data/stars.csv")
+        star_reader = stars_data.result()
         self.stars = star_reader.make_stars(
             StarBatch,
             self,
@@ -456,13 +561,83 @@ class GraphicsEngine:
             constellations_shaders=[
                 sh.vertex_shader_CONSTELLATION, sh.fragment_shader_CONSTELLATION]
         )
+        yield (done := done + 1) / total
+
+        # Capes de textura dels cossos, a mesura que els fils de treball les tenen decodificades.
+        # Cada cos només guarda la capa de la seva imatge dins del TextureArray
+        for texture in self.body_textures.layers:
+            while not self.texture_cache.ready(texture, 3, texture_size):
+                yield None
+            self.body_textures.load_layer(self.texture_cache, texture)
+            yield (done := done + 1) / total
+        self.body_textures.build()
+        yield (done := done + 1) / total
+
+        # Sol, planetes i satèl·lits (dels dos modes) es dibuixen junts amb una geometria compartida
+        self.bodies = BodyBatch(
+            self,
+            [sh.vertex_shader_BODY, sh.fragment_shader_BODY],
+            [objecte for objecte in self.objects + self.aux_objects if isinstance(objecte, (Sun, Planet, Satellite))],
+            self.body_textures
+        )
 
-    def check_events(self):
-        """Funcionalitat per controlar els events durant el temps de vida del programa.
+        # Establim un target a la càmera. Això hauria d'estar al check_events
+        # Aquesta línia saltarà error si la càmera inicialitzada no és del tipus "FollowCamera"
+        self.second_cam.select_target("Mercury")
+        yield (done := done + 1) / total
+
+    @property
+    def date(self):
+        """Data del calendari corresponent al temps actual de la simulació
+
+        Returns:
+            datetime: Data actual de la simulació
         """
-        mouse_pos = pg.mouse.get_pos()
-        self.gui.check_hover(mouse_pos)
+        return self.ephemeris.time_to_date(self.time)
 
+    def register_events(self):
+        """Registrar al bus d'events els handlers de cada tecla i de cada element de la GUI
+        """
+        not_realistic = lambda: not self.realistic_mode
+        following = lambda: isinstance(self.camera, FollowCamera)
+
+        self.events.on_key(pg.K_p, self.event_change_ellipse, when=not_realistic)
+        self.events.on_key(pg.K_k, self.event_change_camera, when=not_realistic)
+        self.events.on_key(pg.K_m, self.event_change_mode, when=lambda: not following())
+        self.events.on_key(pg.K_l, lambda: self.camera.change_lock())
+        self.events.on_key(pg.K_F2, self.event_toggle_performance)
+        if self.DEBUG:
+            self.events.on_key(pg.K_F3, lambda: print(self.ctx.tracker.report()))
+        self.events.on_key(pg.K_r, self.event_reset_camera)
+        self.events.on_key(pg.K_MINUS, lambda: self.event_change_speed(1 / 1.25))
+        self.events.on_key(pg.K_PLUS, lambda: self.event_change_speed(1.25))
+        for key, planet in self.key_planet_map.items():
+            self.events.on_key(key, lambda planet=planet: self.event_change_planet(planet), when=following)
+
+        self.events.subscribe(Toggled, lambda event: self.event_change_ellipse(), "elipses")
+        self.events.subscribe(Toggled, lambda event: self.event_change_camera(), "canvi_camera")
+        self.events.subscribe(Toggled, lambda event: self.event_change_mode(), "escala")
+        for planet in self.key_planet_map.values():
+            self.events.subscribe(Toggled, lambda event: self.event_change_planet(event.uuid), planet)
+        self.events.subscribe(SliderChanged, self.event_change_step, "time")
+
+    def register_metrics(self):
+        """Registrar les mètriques del HUD de rendiment. Només es calculen quan el HUD és visible
+        """
+        self.metrics.register("draw_calls", lambda: (
+            self.render_queue.draws + 1 + bool(self.stars.constellations) + self.gui.renderer.draw_calls))
+        self.metrics.register("instances_drawn", lambda: self.culling.instances_drawn)
+        self.metrics.register("instances_culled", lambda: self.culling.instances_culled)
+        self.metrics.register("collision_pairs", lambda: sum(
+            objecte.collision_pairs for objecte in self.objects if isinstance(objecte, AsteroidBatch)))
+        self.metrics.register("gpu_memory", lambda: sum(
+            size for _, size in self.ctx.tracker.totals().values()) / 2**20)
+
+    def check_events(self):
+        """Funcionalitat per controlar els events durant el temps de vida del programa. Si no hi ha
+        input no es fa cap feina: el hover de la GUI es comprova quan es mou o es prem el ratolí, i al frame
+        següent si s'amaga o es mostra algun element (update_hover)
+        """
         for event in pg.event.get():
             if event.type == pg.QUIT or (
                     event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE
@@ -470,85 +645,51 @@ class GraphicsEngine:
                 raise KeyboardInterrupt("Exit game via click.")
 
             if event.type == pg.KEYDOWN:
-                if event.key == pg.K_p and (not self.realistic_mode):
-                    self.event_change_ellipse()
-
-                elif event.key == pg.K_k and (not self.realistic_mode):
-                    self.event_change_camera()
-
-                elif event.key == pg.K_m and not (isinstance(self.camera, FollowCamera)):
-                    self.event_change_mode()
-
-                elif event.key == pg.K_l:
-                    self.camera.change_lock()
+                self.events.press(event.key)
 
-                elif event.key == pg.K_r:
-                    self.camera.position = glm.vec3(
-                        66.8807,      66.8807,      66.8807)
-                    self.camera.yaw, self.camera.pitch = self.camera.calculate_initial_orientation(
-                        self.camera.position, glm.vec3(0, 0, 0))
+            elif event.type == pg.KEYUP:
+                self.events.release(event.key)
 
-                elif event.key == pg.K_MINUS:
-                    self.camera.speed /= 1.25
-                    if self.camera.speed < self.camera.minimum_speed:
-                        self.camera.speed = self.camera.minimum_speed
+            elif event.type == pg.WINDOWFOCUSLOST:
+                # Els KEYUP de les tecles premudes ja no arribaran
+                self.events.release_all()
 
-                elif event.key == pg.K_PLUS:
-                    self.camera.speed *= 1.25
-                    if self.camera.speed > self.camera.maximum_speed:
-                        self.camera.speed = self.camera.maximum_speed
+            elif event.type == pg.VIDEORESIZE:
+                self.resize(event.size)
 
-                elif event.key in self.key_planet_map and isinstance(self.camera, FollowCamera):
-                    self.event_change_planet(self.key_planet_map[event.key])
-
-            if event.type == pg.MOUSEBUTTONDOWN:
-                element_event = self.gui.check_click(mouse_pos)
+            elif event.type == pg.MOUSEBUTTONDOWN:
+                self.gui.check_hover(event.pos)
+                element_event = self.gui.check_click(event.pos)
 
                 if element_event is not None:
-                    if element_event == "elipses":
-                        self.event_change_ellipse()
-                    elif element_event == "canvi_camera":
-                        self.event_change_camera()
-                    elif element_event == "escala":
-                        self.event_change_mode()
-                    elif element_event in self.key_planet_map.values():
-                        self.event_change_planet(element_event)
-                else:
-                    if event.button == 1:  # Left click
-                        self.camera.left_button_held = True
-                        self.camera.last_mouse_pos = mouse_pos
+                    self.events.emit(element_event)
+                elif event.button == 1:  # Left click
+                    self.camera.left_button_held = True
+                    self.camera.last_mouse_pos = event.pos
 
             # Mouse button released
             elif event.type == pg.MOUSEBUTTONUP:
                 if event.button == 1:  # Left click
                     self.camera.left_button_held = False
 
-                element_event = self.gui.check_unclick(
-                    mouse_pos)
+                self.gui.check_hover(event.pos)
+                self.events.emit(self.gui.check_unclick(event.pos))
 
             elif event.type == pg.MOUSEMOTION:
-
-                current_mouse_pos = pg.mouse.get_pos()
-                element_event = self.gui.check_motion(current_mouse_pos)
-
-                if element_event is not None:
-                    if self.capture_element.search(element_event)[1] == "time":
-                        value = float(
-                            self.capture_value.search(element_event)[1])
-                        self.step = self.time_map[value]
-                        if self.DEBUG:
-                            print(f"Current step rate: {self.step}")
+                self.gui.check_hover(event.pos)
+                element_event = self.gui.check_motion(event.pos)
+                self.events.emit(element_event)
 
                 if self.camera.left_button_held and element_event is None:
                     # Calculate difference in mouse movement
-                    dx = current_mouse_pos[0] - self.camera.last_mouse_pos[0]
-                    dy = current_mouse_pos[1] - self.camera.last_mouse_pos[1]
+                    dx = event.pos[0] - self.camera.last_mouse_pos[0]
+                    dy = event.pos[1] - self.camera.last_mouse_pos[1]
 
                     # Process the mouse movement to update camera rotation
                     self.camera.process_mouse_movement(dx, dy)
 
                     # Update last mouse position
-                    self.camera.last_mouse_pos = current_mouse_pos
+                    self.camera.last_mouse_pos = event.pos
 
     def event_change_camera(self):
         """
@@ -568,6 +709,7 @@ class GraphicsEngine:
         else:
             self.gui["escala"].unhide()
             self.gui["planet_menu"].hide()
+        self.stream_target_texture()
 
     def event_change_ellipse(self):
         """
@@ -600,7 +742,12 @@ class GraphicsEngine:
         # Update the view matrix
         m_view = self.camera.get_view_matrix()
         for object in self.objects:
-            object.shader['m_view'].write(m_view)
+            # Els cossos del BodyBatch no tenen programa propi
+            if object.shader is not None:
+                object.shader['m_view'].write(m_view)
+        for orbit in self.orbits:
+            orbit.shader['m_view'].write(m_view)
+        self.bodies.shader['m_view'].write(m_view)
         self.stars.shader['m_view'].write(m_view)
 
         if self.realistic_mode:
@@ -628,6 +775,73 @@ class GraphicsEngine:
         self.camera.select_target(target_planet)
         self.gui["planet_menu"].untoggle()
         self.gui["planet_menu"][target_planet].toggle()
+        self.stream_target_texture()
+
+    def event_change_step(self, event):
+        """Canviar la velocitat de la simulació amb el lliscador del temps
+
+        Args:
+            event (gui.SliderChanged): Posició del lliscador (0-6)
+        """
+        self.step = self.time_map[event.value]
+        if self.DEBUG:
+            print(f"Current step rate: {self.step}")
+
+    def event_change_speed(self, factor):
+        """Canviar la velocitat de moviment de la càmera, dins dels seus límits
+
+        Args:
+            factor (float): Factor pel qual es multiplica la velocitat
+        """
+        self.camera.speed = min(max(self.camera.speed * factor, self.camera.minimum_speed),
+                                self.camera.maximum_speed)
+
+    def event_reset_camera(self):
+        """Tornar la càmera a la posició inicial, mirant al Sol
+        """
+        self.camera.position = glm.vec3(66.8807, 66.8807, 66.8807)
+        self.camera.yaw, self.camera.pitch = self.camera.calculate_initial_orientation(
+            self.camera.position, glm.vec3(0, 0, 0))
+
+    def event_toggle_performance(self):
+        """Mostrar o amagar el HUD de rendiment
+        """
+        if self.gui["performance"].is_hidden:
+            self.gui["performance"].unhide()
+        else:
+            self.gui["performance"].hide()
+
+    def resize(self, win_size):
+        """Redimensionar la finestra: només es refan el viewport, les projeccions de les càmeres
+        (un sol uniform buffer compartit per tots els shaders) i la geometria de la GUI. Els objectes,
+        textures i atlas de glifs es conserven
+
+        Args:
+            win_size (tuple[int, int]): Amplada i alçada noves de la finestra
+        """
+        if 0 in win_size or tuple(win_size) == tuple(self.WIN_SIZE):
+            # Finestra minimitzada o sense canvis
+            return
+
+        self.WIN_SIZE = tuple(win_size)
+        # El framebuffer de la pantalla recorda el viewport quan es torna a fer servir (GUI)
+        self.ctx.fbo.viewport = (0, 0, *self.WIN_SIZE)
+
+        self.camera.resize(self.WIN_SIZE)
+        self.second_cam.resize(self.WIN_SIZE)
+        self.projection.write(self.camera.m_proj)
+
+        self.gui.fit_window()
+
+    def stream_target_texture(self):
+        """Amb la qualitat alta, la textura del cos que segueix la FollowCamera es carrega a resolució
+        completa en un fil de treball. La resta de cossos (i aquest, mentre es carrega) fan servir la
+        variant reduïda del TextureArray
+        """
+        _, full_resolution = TEXTURE_TIERS[self.texture_quality]
+        target = self.camera.target if isinstance(self.camera, FollowCamera) else None
+        layer = target.layer if full_resolution and target is not None else None
+        self.body_textures.stream(self.texture_cache, self.assets.pool, layer)
 
     def end(self):
         """
@@ -650,7 +864,22 @@ class GraphicsEngine:
         for aux_orbit in self.aux_orbits:
             aux_orbit.destroy()
 
-        self.stars.destroy()
+        # Si es surt durant la càrrega, alguns objectes encara no existeixen
+        if self.stars is not None:
+            self.stars.destroy()
+        if self.bodies is not None:
+            self.bodies.destroy()
+        elif self.body_textures is not None:
+            self.body_textures.release()
+
+        self.projection.release()
+
+        self.simulation_pool.shutdown()
+        self.assets.shutdown()
+
+        # Qualsevol recurs de la GPU que quedi viu és una fuita
+        if self.DEBUG and self.ctx.tracker.live():
+            print(self.ctx.tracker.report("Recursos de la GPU no alliberats"))
 
         pg.quit()
         sys.exit()
@@ -665,7 +894,23 @@ class GraphicsEngine:
         """
         for objecte in self.objects:
             objecte.move()
-        
+
+    @staticmethod
+    def simulate(objects):
+        """Etapa de simulació a la CPU (òrbites, col·lisions i matrius d'instàncies).
+        S'executa en el fil de simulació i no pot fer crides a OpenGL
+
+        Args:
+            objects (list): Objectes a actualitzar
+        """
+        for objecte in objects:
+            objecte.update()
+
+    def upload(self):
+        """Pujada a la GPU de l'estat calculat pel fil de simulació
+        """
+        for objecte in self.objects:
+            objecte.upload()
 
     def render(self):
         """Renderització dels objectes 
@@ -675,15 +920,32 @@ class GraphicsEngine:
         # clear framebuffer
         self.ctx.clear(color=(0, 0, 0))
 
+        # Frustum de la càmera activa per descartar els objectes fora de pantalla
+        self.frustum.update(self.camera.m_proj, self.camera.m_view)
+        self.culling.reset()
+        self.render_queue.reset()
+
         # render scene + axis
         for objecte in self.objects:
-            objecte.render()
+            sphere = objecte.bounding_sphere()
+            if sphere is not None and not self.frustum.sphere_visible(*sphere):
+                self.culling.objects_culled += 1
+                continue
+            if objecte in self.bodies:
+                self.bodies.add(objecte)
+            else:
+                objecte.enqueue(self.render_queue)
+            self.culling.objects_drawn += 1
+        self.bodies.enqueue(self.render_queue)
+        self.render_queue.flush()
 
         self.stars.render()
 
-        if self.ellipse:
+        # En mode realista les òrbites sempre es mostren (el botó d'el·lipses està amagat)
+        if self.ellipse or self.realistic_mode:
             for orbit in self.orbits:
-                orbit.render()
+                orbit.enqueue(self.render_queue)
+            self.render_queue.flush()
 
         self.ctx.disable(flags=mgl.DEPTH_TEST | mgl.BLEND)
 
@@ -691,18 +953,65 @@ class GraphicsEngine:
         self.gui.render()
 
         # Swap buffers + display caption
-        pg.display.set_caption(self.info)
+        if self.DEBUG:
+            pg.display.set_caption(f"{self.info} | {self.culling} | {self.render_queue} | {self.ctx.tracker}")
+        else:
+            pg.display.set_caption(self.info)
         pg.display.flip()
 
+    def check_loading_events(self):
+        """Events durant la càrrega: només es pot sortir de l'aplicació o redimensionar la finestra
+        """
+        for event in pg.event.get():
+            if event.type == pg.QUIT or (
+                    event.type == pg.KEYDOWN and event.key == pg.K_ESCAPE
+            ):
+                raise KeyboardInterrupt("Exit game via click.")
+            if event.type == pg.VIDEORESIZE:
+                self.resize(event.size)
+
+    def load(self):
+        """Pantalla de càrrega: cada frame s'avancen els passos de self.assets durant el pressupost
+        del frame i es mostra el progrés amb la GUI
+        """
+        while not self.assets.update():
+            self.check_loading_events()
+            self.gui["loading"].progress = self.assets.progress
+
+            self.ctx.clear(color=(0, 0, 0))
+            self.gui.render()
+            pg.display.set_caption(f"Carregant... {self.assets.progress:.0%}")
+            pg.display.flip()
+            self.clock.tick(FPS)
+
+        self.gui["loading"].hide()
+
     def run(self):
         """Funció per fer anar el programa.
         """
+        self.load()
+
+        # Primer frame: cal tenir l'estat simulat abans de renderitzar
+        self.move()
+        self.camera.follow_target()
+
         while True:
             self.set_time()
             self.check_events()
-            self.camera.process_keyboard()
-            self.move()
-            self.camera.follow_target()
+            # Hover dels elements amagats o mostrats des del teclat, sense moure el ratolí
+            self.gui.update_hover()
+            # Moviment continu de la càmera només mentre hi ha tecles premudes
+            if self.events.held:
+                self.camera.process_keyboard(self.events.held)
+            # Simulació del frame N+1 en paral·lel al render del frame N
+            simulation = self.simulation_pool.submit(self.simulate, self.objects)
             self.render()
+            simulation.result()
+            self.upload()
+            # Textura a resolució completa del cos seguit, quan el fil de treball l'ha decodificada
+            self.body_textures.update(self.texture_cache)
+            self.camera.follow_target()
             # Frame rate: Màxim podem anar a 120 FPS, és a dir, que podem realitzar el loop 120 cops per segon
-            self.clock.tick(FPS)
+            self.metrics.record_frame(self.clock.tick(FPS))
+            # Amagat, el HUD de rendiment no consulta les mètriques
+            self.gui["performance"].update(self.metrics)
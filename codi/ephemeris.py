@@ -0,0 +1,246 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+
+import glm
+import numpy as np
+from numpy.polynomial import chebyshev
+
+
+### VARIABLES GLOBALS ###
+# Unitats de temps de l'engine que equivalen a un dia (0.0191 per frame a 120 FPS = 1 dia per segon)
+TIME_PER_DAY = 0.0191 * 120
+# Data que correspon a GraphicsEngine.time = 0
+EPOCH = datetime(2000, 1, 1, 12)
+
+
+class Ephemeris:
+    """Classe que precalcula les posicions dels cossos en òrbita mitjançant segments de Chebyshev
+    """
+    __slots__ = (
+        "epoch",
+        "start",
+        "end",
+        "degree",
+        "segments_per_revolution",
+        "elements",
+        "keys",
+        "index",
+        "starts",
+        "lengths",
+        "offsets",
+        "counts",
+        "coefficients",
+    )
+
+    def __init__(self, start, end, epoch=EPOCH, degree=8, segments_per_revolution=4):
+        """Inicialització de la classe Ephemeris
+
+        Args:
+            start (datetime): Primera data coberta per les efemèrides
+            end (datetime): Última data coberta per les efemèrides
+            epoch (datetime, optional): Data que correspon al temps 0 de l'engine. Defaults to EPOCH.
+            degree (int, optional): Grau dels polinomis de Chebyshev. Defaults to 8.
+            segments_per_revolution (int, optional): Segments mínims per cada volta de l'òrbita. Defaults to 4.
+        """
+        assert end > start, "ERROR: The ephemeris range must end after it starts"
+        self.epoch = epoch
+        self.start = start
+        self.end = end
+        self.degree = degree
+        self.segments_per_revolution = segments_per_revolution
+
+        # Elements orbitals de cada cos (a, e, velocitat angular, y)
+        self.elements = {}
+
+        # Taules de coeficients (es creen amb fit() o load())
+        self.keys = []
+        self.index = {}
+        self.starts = None
+        self.lengths = None
+        self.offsets = None
+        self.counts = None
+        self.coefficients = None
+
+    def time_to_date(self, time):
+        """Conversió del temps de l'engine a una data del calendari
+
+        Args:
+            time (float): Temps de l'engine
+
+        Returns:
+            datetime: Data corresponent
+        """
+        return self.epoch + timedelta(days=time / TIME_PER_DAY)
+
+    def date_to_time(self, date):
+        """Conversió d'una data del calendari al temps de l'engine
+
+        Args:
+            date (datetime): Data a convertir
+
+        Returns:
+            float: Temps de l'engine corresponent
+        """
+        return (date - self.epoch).total_seconds() / 86400 * TIME_PER_DAY
+
+    def add_orbit(self, key, semi_major, eccentricity, angular_velocity, height=0.0):
+        """Registrar una òrbita el·líptica per precalcular-la
+
+        Args:
+            key (str): Identificador del cos
+            semi_major (float): Semieix major de l'òrbita
+            eccentricity (float): Excentricitat de l'òrbita
+            angular_velocity (float): Angle recorregut per unitat de temps de l'engine
+            height (float, optional): Altura (eix Y) constant de l'òrbita. Defaults to 0.0.
+        """
+        self.elements[key] = (float(semi_major), float(eccentricity), float(angular_velocity), float(height))
+
+    @staticmethod
+    def orbit(elements, times):
+        """Posicions analítiques d'una òrbita el·líptica (mateixa fórmula que Planet i Satellite)
+
+        Args:
+            elements (tuple): Elements orbitals (a, e, velocitat angular, y)
+            times (np.array): Temps de l'engine a avaluar
+
+        Returns:
+            np.array: Posicions (x, y, z) amb forma times.shape + (3,)
+        """
+        a, e, angular_velocity, height = elements
+        b = a * (1 - e ** 2) ** 0.5
+        theta = times * angular_velocity
+        positions = np.empty(np.shape(times) + (3,), dtype='f8')
+        positions[..., 0] = a * np.cos(theta) - a * e
+        positions[..., 1] = height
+        positions[..., 2] = b * np.sin(theta)
+        return positions
+
+    def signature(self):
+        """Signatura de les dades d'entrada, per invalidar la memòria cau
+
+        Returns:
+            str: Hash de les dates, el grau i els elements orbitals
+        """
+        meta = [self.epoch.isoformat(), self.start.isoformat(), self.end.isoformat(),
+                self.degree, self.segments_per_revolution, sorted(self.elements.items())]
+        return hashlib.sha1(json.dumps(meta).encode()).hexdigest()
+
+    def fit(self):
+        """Ajust dels segments de Chebyshev de tots els cossos registrats
+        """
+        t_start = self.date_to_time(self.start)
+        t_end = self.date_to_time(self.end)
+        span = t_end - t_start
+
+        # Nodes de Chebyshev i matriu de la transformada (coeficients = T @ valors)
+        nodes = self.degree + 1
+        k = np.arange(nodes)
+        u = np.cos(np.pi * (k + 0.5) / nodes)
+        transform = 2 / nodes * np.cos(np.outer(np.arange(nodes), np.pi * (k + 0.5) / nodes))
+        transform[0] /= 2
+
+        self.keys = list(self.elements.keys())
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.starts = np.full(len(self.keys), t_start, dtype='f8')
+        self.lengths = np.empty(len(self.keys), dtype='f8')
+        self.counts = np.empty(len(self.keys), dtype='i8')
+
+        coefficients = []
+        for i, key in enumerate(self.keys):
+            angular_velocity = self.elements[key][2]
+            # Cada segment cobreix com a molt una fracció de volta
+            if angular_velocity != 0:
+                period = 2 * np.pi / abs(angular_velocity)
+                count = max(1, int(np.ceil(span * self.segments_per_revolution / period)))
+            else:
+                count = 1
+            length = span / count
+            self.lengths[i] = length
+            self.counts[i] = count
+
+            # Temps dels nodes de tots els segments: (segments, nodes)
+            middles = t_start + length * (np.arange(count) + 0.5)
+            times = middles[:, None] + 0.5 * length * u[None, :]
+            values = self.orbit(self.elements[key], times)
+            coefficients.append(np.einsum('jk,skc->sjc', transform, values))
+
+        self.offsets = np.concatenate(([0], np.cumsum(self.counts)[:-1])).astype('i8')
+        self.coefficients = np.concatenate(coefficients) if coefficients else np.empty((0, nodes, 3))
+
+    def save(self, path):
+        """Desar les efemèrides en un fitxer binari
+
+        Args:
+            path (str): Path del fitxer (.npz)
+        """
+        np.savez(path,
+                 signature=np.array(self.signature()),
+                 keys=np.array(self.keys, dtype=str),
+                 starts=self.starts,
+                 lengths=self.lengths,
+                 offsets=self.offsets,
+                 counts=self.counts,
+                 coefficients=self.coefficients)
+
+    def load(self, path):
+        """Carregar les efemèrides d'un fitxer binari si corresponen a les dades actuals
+
+        Args:
+            path (str): Path del fitxer (.npz)
+
+        Returns:
+            bool: True si s'ha pogut carregar, False si no existeix o està desactualitzat
+        """
+        if not os.path.exists(path):
+            return False
+
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["signature"]) != self.signature():
+                return False
+            self.keys = [str(key) for key in data["keys"]]
+            self.starts = data["starts"]
+            self.lengths = data["lengths"]
+            self.offsets = data["offsets"]
+            self.counts = data["counts"]
+            self.coefficients = data["coefficients"]
+
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        return True
+
+    def build(self, path=None):
+        """Carregar les efemèrides de la memòria cau o ajustar-les i desar-les
+
+        Args:
+            path (str, optional): Path del fitxer de memòria cau. Defaults to None (sense memòria cau).
+        """
+        if path is not None and self.load(path):
+            return
+        self.fit()
+        if path is not None:
+            self.save(path)
+
+    def position(self, key, time):
+        """Posició d'un cos en un instant de temps
+
+        Args:
+            key (str): Identificador del cos
+            time (float): Temps de l'engine
+
+        Returns:
+            glm.vec3 | None: Posició del cos, o None si el cos o el temps no estan coberts
+        """
+        i = self.index.get(key)
+        if i is None:
+            return None
+
+        length = self.lengths[i]
+        segment = int((time - self.starts[i]) // length)
+        if segment < 0 or segment >= self.counts[i]:
+            return None
+
+        # Temps local del segment en l'interval [-1, 1]
+        u = 2 * (time - self.starts[i] - segment * length) / length - 1
+        x, y, z = chebyshev.chebval(u, self.coefficients[self.offsets[i] + segment])
+        return glm.vec3(x, y, z)
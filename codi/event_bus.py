@@ -0,0 +1,79 @@
+class EventBus:
+    """Bus d'events tipats. Els handlers es registren per tipus d'event de la GUI (i, opcionalment,
+    per l'uuid de l'element que l'emet) o per tecla, de manera que cada event es despatxa amb una
+    consulta a un diccionari. També porta el registre de les tecles mantingudes premudes
+    """
+    __slots__ = (
+        "handlers",
+        "key_handlers",
+        "held",
+    )
+
+    def __init__(self):
+        """Inicialització de la classe EventBus
+        """
+        # (tipus d'event, uuid o None): [handler, ...]
+        self.handlers = {}
+        # tecla: [(handler, condició o None), ...]
+        self.key_handlers = {}
+        self.held = set()
+
+    def subscribe(self, event_type, handler, uuid=None):
+        """Registrar un handler per a un tipus d'event
+
+        Args:
+            event_type (type): Classe de l'event (gui.Toggled, gui.SliderChanged...)
+            handler (callable): Funció que rep l'event
+            uuid (str, optional): Només els events de l'element amb aquest uuid. Defaults to None (tots).
+        """
+        self.handlers.setdefault((event_type, uuid), []).append(handler)
+
+    def on_key(self, key, handler, when=None):
+        """Registrar un handler per a una tecla
+
+        Args:
+            key (int): Tecla de Pygame (pg.K_*)
+            handler (callable): Funció sense arguments que es crida en prémer la tecla
+            when (callable, optional): Condició sense arguments; el handler només es crida si és certa. Defaults to None.
+        """
+        self.key_handlers.setdefault(key, []).append((handler, when))
+
+    def emit(self, event):
+        """Despatxar un event als handlers del seu tipus
+
+        Args:
+            event (gui.GUIEvent | None): Event a despatxar
+
+        Returns:
+            bool: True si algun handler l'ha rebut
+        """
+        if event is None:
+            return False
+        handlers = self.handlers.get((type(event), event.uuid), []) + self.handlers.get((type(event), None), [])
+        for handler in handlers:
+            handler(event)
+        return bool(handlers)
+
+    def press(self, key):
+        """Tecla premuda: es marca com a mantinguda i es criden els seus handlers
+
+        Args:
+            key (int): Tecla de Pygame (pg.K_*)
+        """
+        self.held.add(key)
+        for handler, when in self.key_handlers.get(key, ()):
+            if when is None or when():
+                handler()
+
+    def release(self, key):
+        """Tecla deixada anar
+
+        Args:
+            key (int): Tecla de Pygame (pg.K_*)
+        """
+        self.held.discard(key)
+
+    def release_all(self):
+        """Deixar anar totes les tecles (p. ex. quan la finestra perd el focus i no arribaran els KEYUP)
+        """
+        self.held.clear()
@@ -0,0 +1,89 @@
+import numpy as np
+
+class Frustum:
+    """Classe que representa el volum de visió de la càmera per descartar objectes fora de pantalla
+    """
+    __slots__ = ["planes"]
+
+    def __init__(self, m_proj=None, m_view=None):
+        """Inicialització de la classe Frustum
+
+        Args:
+            m_proj (glm.mat4, optional): Matriu de projecció. Defaults to None.
+            m_view (glm.mat4, optional): Matriu view. Defaults to None.
+        """
+        # Plans (a, b, c, d) normalitzats: esquerra, dreta, baix, dalt, near, far
+        self.planes = np.zeros((6, 4), dtype='f8')
+        if m_proj is not None and m_view is not None:
+            self.update(m_proj, m_view)
+
+    def update(self, m_proj, m_view):
+        """Extracció dels plans del frustum a partir de la matriu m_proj * m_view (Gribb-Hartmann)
+
+        Args:
+            m_proj (glm.mat4): Matriu de projecció
+            m_view (glm.mat4): Matriu view
+        """
+        # np.array d'una matriu glm retorna les files de la matriu
+        clip = np.array(m_proj * m_view, dtype='f8')
+        self.planes[0] = clip[3] + clip[0]
+        self.planes[1] = clip[3] - clip[0]
+        self.planes[2] = clip[3] + clip[1]
+        self.planes[3] = clip[3] - clip[1]
+        self.planes[4] = clip[3] + clip[2]
+        self.planes[5] = clip[3] - clip[2]
+        self.planes /= np.linalg.norm(self.planes[:, :3], axis=1)[:, None]
+
+    def sphere_visible(self, center, radius):
+        """Comprovar si una esfera és (parcialment) dins del frustum
+
+        Args:
+            center (glm.vec3): Centre de l'esfera
+            radius (float): Radi de l'esfera
+
+        Returns:
+            bool: True si l'esfera és visible
+        """
+        distances = self.planes[:, :3] @ (center.x, center.y, center.z) + self.planes[:, 3]
+        return bool((distances >= -radius).all())
+
+    def spheres_visible(self, centers, radii):
+        """Comprovar quines esferes són (parcialment) dins del frustum
+
+        Args:
+            centers (np.array): Centres de les esferes, forma (N, 3)
+            radii (np.array): Radis de les esferes, forma (N,)
+
+        Returns:
+            np.array: Màscara booleana de les esferes visibles
+        """
+        distances = centers @ self.planes[:, :3].T + self.planes[:, 3]
+        return (distances >= -np.reshape(radii, (-1, 1))).all(axis=1)
+
+
+class CullingStats:
+    """Estadístiques del frustum culling del darrer frame
+    """
+    __slots__ = ["objects_drawn", "objects_culled", "instances_drawn", "instances_culled"]
+
+    def __init__(self):
+        """Inicialització de la classe CullingStats
+        """
+        self.reset()
+
+    def reset(self):
+        """Reiniciar els comptadors (a l'inici de cada frame)
+        """
+        self.objects_drawn = 0
+        self.objects_culled = 0
+        self.instances_drawn = 0
+        self.instances_culled = 0
+
+    def __str__(self):
+        """Resum de les estadístiques
+
+        Returns:
+            str: Objectes i instàncies dibuixats i descartats
+        """
+        return (f"Objectes: {self.objects_drawn} dibuixats, {self.objects_culled} descartats | "
+                f"Instàncies: {self.instances_drawn} dibuixades, {self.instances_culled} descartades")
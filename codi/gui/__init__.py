@@ -6,6 +6,7 @@ Created on Tue Oct 22 15:55:23 2024
 """
 import sys
 
+from .events import Clicked, GUIEvent, MovedOver, Released, SliderChanged, Toggled
 from .gui_manager import GUIManager
 
 if sys.version_info[0] < 3:
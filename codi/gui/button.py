@@ -12,9 +12,9 @@ if __name__ == "__main__":
 
 
 from abc import abstractmethod
-import moderngl as mgl
 
 from .element import Element
+from .events import Clicked, MovedOver, Released
 from .text_label import TextLabel
 
 
@@ -22,15 +22,13 @@ class Button(Element):
     """Button Element."""
 
     __slots__ = (
+        "__color",
         "__default_color",
         "__hover_color",
         "__is_hovered",
         "__locked_color",
         "__radius",
-        "__shader_programs",
         "__text",
-        "__vao",
-        "__vbo",
         "__vertexes",
         "__x",
         "__y",
@@ -60,11 +58,8 @@ class Button(Element):
         # Inicialize attributes
         self._set_attributes(app, uuid, **kwargs)
 
-        # Write the shader
-        self._set_shader_programs()
-
-        # Create all ModernGL objects
-        self._set_vao()
+        # Create the geometry
+        self._set_vertexes()
 
 ###############################################################################
 
@@ -132,12 +127,36 @@ class Button(Element):
         None.
 
         """
-        # Render button (draw quad as two triangles)
-        self.__vao.render(mgl.TRIANGLE_STRIP)
+        # Render button (add its triangles to the GUI batch)
+        self._render_shape(self.app.gui.renderer)
 
         # Render possible text on button
         self.__text.render()
 
+    @abstractmethod
+    def _render_shape(self, renderer):
+        """
+        Add the shape of the button to the batched renderer.
+
+        Parameters
+        ----------
+        renderer : GUIRenderer
+            Batched renderer of the GUI.
+
+        Raises
+        ------
+        NotImplementedError
+            Method not implemented, child class must implement it.
+
+        Returns
+        -------
+        None.
+
+        """
+        raise NotImplementedError(
+            "Method not implemented, child class must implement it."
+        )
+
     def _set_attributes(self, app, uuid: str, **kwargs):
         """
         Set attributes only without the initialization logic.
@@ -179,6 +198,7 @@ class Button(Element):
 
         # Color information
         self.__default_color = kwargs["default_color"]
+        self.__color = kwargs["default_color"]
 
         if kwargs["hover_color"] is None:
             self.__hover_color = kwargs["default_color"]
@@ -216,73 +236,6 @@ class Button(Element):
             **kwargs['text'],
         )
 
-    def _set_shader_programs(self):
-        """
-        Set the shader program.
-
-        Returns
-        -------
-        None.
-
-        """
-        self.__shader_programs = self.app.ctx.program(
-            vertex_shader='''
-            #version 330
-
-            layout (location = 0) in vec3 in_vert;
-
-            uniform vec3 in_colour;
-
-            out vec3 frag_color;
-
-            void main() {
-                frag_color = in_colour;
-                gl_Position = vec4(in_vert, 1.0);
-            }
-            ''',
-            fragment_shader='''
-            #version 330
-
-            in vec3 frag_color;
-
-            out vec4 f_color;
-
-            void main() {
-                f_color = vec4(frag_color, 1.0);
-            }
-            '''
-        )
-
-        if self.app.DEBUG:
-            print("Shader program compiled and linked successfully.")
-
-    def _set_vao(self):
-        """
-        Set the vertex array object.
-
-        Returns
-        -------
-        None.
-
-        """
-        self._set_vbo()
-
-        self.__vao = self.app.ctx.vertex_array(
-            self.__shader_programs, [(self.__vbo, '3f', 'in_vert')])
-
-    def _set_vbo(self):
-        """
-        Set the vertex buffer object.
-
-        Returns
-        -------
-        None.
-
-        """
-        self._set_vertexes()
-
-        self.__vbo = self.app.ctx.buffer(self.vertexes.tobytes())
-
     @abstractmethod
     def _set_vertexes(self):
         raise NotImplementedError
@@ -293,7 +246,7 @@ class Button(Element):
 ###############################################################################
 #                                Public Methods                               #
 
-    def check_click(self, mouse_position: tuple[int, int]) -> str | None:  # noqa
+    def check_click(self, mouse_position: tuple[int, int]) -> Clicked | None:  # noqa
         """
         Check if a click has been on the button,
 
@@ -304,8 +257,8 @@ class Button(Element):
 
         Returns
         -------
-        string or None
-            UUID of the Element if clicked or None if not.
+        Clicked or None
+            Event of the Element if clicked or None if not.
 
         """
         # Cannot be clicked if is locked
@@ -315,9 +268,9 @@ class Button(Element):
         # Get mouse coordinates
         mx, my = mouse_position
 
-        # Return UUID if button is clicked
+        # Return event if button is clicked
         if self._containing(mx, my):
-            return self.uuid
+            return Clicked(self.uuid)
 
         return None
 
@@ -335,17 +288,20 @@ class Button(Element):
         None.
 
         """
-        # Cannot be hovered if is locked
-        if self.is_locked or self.is_hidden:
-            return None
-
         # Get mouse coordinates
         mx, my = mouse_position
 
-        # Update hover state
-        self.__is_hovered = self._containing(mx, my)
+        # Update hover state, lost if is locked or hidden
+        is_hovered = (
+            not (self.is_locked or self.is_hidden)
+            and self._containing(mx, my)
+        )
+
+        if is_hovered != self.__is_hovered:
+            self.__is_hovered = is_hovered
+            self.mark_dirty()
 
-    def check_motion(self, mouse_position: tuple[int, int]) -> str | None:
+    def check_motion(self, mouse_position: tuple[int, int]) -> MovedOver | None:
         """
         Check if when moving the mouse is inside the button when moved.
 
@@ -361,8 +317,8 @@ class Button(Element):
 
         Returns
         -------
-        string or None
-            UUID of the Element if moved on or None if not.
+        MovedOver or None
+            Event of the Element if moved on or None if not.
 
         """
         # Cannot be moved on if is locked
@@ -372,13 +328,13 @@ class Button(Element):
         # Get mouse coordinates
         mx, my = mouse_position
 
-        # Return UUID if button is unclicked
+        # Return event if button is unclicked
         if self._containing(mx, my):
-            return self.uuid
+            return MovedOver(self.uuid)
 
         return None
 
-    def check_unclick(self, mouse_position: tuple[int, int]) -> str | None:
+    def check_unclick(self, mouse_position: tuple[int, int]) -> Released | None:
         """
         Check if it has been unclicked on the Element.
 
@@ -389,8 +345,8 @@ class Button(Element):
 
         Returns
         -------
-        None.
-            UUID of the Element if unclicked or None if not.
+        Released or None
+            Event of the Element if unclicked or None if not.
 
         """
         # Cannot be unclicked if is locked
@@ -400,9 +356,9 @@ class Button(Element):
         # Get mouse coordinates
         mx, my = mouse_position
 
-        # Return UUID if button is unclicked
+        # Return event if button is unclicked
         if self._containing(mx, my):
-            return self.uuid
+            return Released(self.uuid)
 
         return None
 
@@ -415,11 +371,7 @@ class Button(Element):
         None.
 
         """
-        self.__vbo.release()
-
-        self.__vao.release()
-
-        self.__shader_programs.release()
+        self.__text.destroy()
 
     def render(self):
         """
@@ -468,7 +420,7 @@ class Button(Element):
     @property  # noqa
     def color(self) -> tuple[float, float, float]:
         """
-        Get OpenGL color from the shader.
+        Get current color of the button.
 
         Returns
         -------
@@ -476,12 +428,12 @@ class Button(Element):
             Tuple describing the RGB color as floats from 0 to 1.
 
         """
-        return self.__shader_programs['in_colour'].value
+        return self.__color
 
     @color.setter
     def color(self, new_color: tuple[float, float, float]):
         """
-        Set OpenGL color from the shader.
+        Set current color of the button.
 
         Parameters
         ----------
@@ -493,7 +445,9 @@ class Button(Element):
         None.
 
         """
-        self.__shader_programs['in_colour'].value = new_color
+        if new_color != self.__color:
+            self.__color = new_color
+            self.mark_dirty()
 
     @property
     def default_color(self) -> tuple[float, float, float]:
@@ -511,6 +465,7 @@ class Button(Element):
     @default_color.setter
     def default_color(self, new_default_color: tuple[float, float, float]):
         self.__default_color = new_default_color
+        self.mark_dirty()
 
     @property
     def hover_color(self) -> tuple[float, float, float]:
@@ -519,6 +474,7 @@ class Button(Element):
     @hover_color.setter
     def hover_color(self, new_hover_color: tuple[float, float, float]):
         self.__hover_color = new_hover_color
+        self.mark_dirty()
 
     @property
     def locked_color(self) -> tuple[float, float, float]:
@@ -527,6 +483,7 @@ class Button(Element):
     @locked_color.setter
     def locked_color(self, new_locked_color: tuple[float, float, float]):
         self.__locked_color = new_locked_color
+        self.mark_dirty()
 
     @property
     def is_hovered(self):
@@ -551,7 +508,9 @@ class Button(Element):
 
         self.__text.x = new_x
 
-        self._set_vao()
+        self._set_vertexes()
+
+        self._layout_changed()
 
     @property
     def y(self) -> int:
@@ -563,6 +522,8 @@ class Button(Element):
 
         self.__text.y = new_y
 
-        self._set_vao()
+        self._set_vertexes()
+
+        self._layout_changed()
 
 ###############################################################################
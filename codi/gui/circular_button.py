@@ -12,12 +12,55 @@ if __name__ == "__main__":
 
 
 import numpy as np
-import moderngl as mgl
 
-from math import acos, ceil, cos, pi, sin
+from functools import lru_cache
+from math import acos, ceil, pi
 
 from .button import Button
 
+# Maximum distance in pixels between the circle and its polygon
+CIRCLE_ERROR = 0.5
+
+
+@lru_cache(maxsize=None)
+def unit_circle(segments: int) -> np.ndarray:
+    """
+    Return the triangles of a unit circle centred at the origin.
+
+    The fan (centre and circumference vertexes) is indexed into a triangle
+    list once per number of segments and shared by every circular button.
+
+    Parameters
+    ----------
+    segments : integer
+        Number of segments of the circumference.
+
+    Returns
+    -------
+    numpy array
+        Read-only array (segments * 3, 2) with the x and y of the vertexes.
+
+    """
+    angles = np.arange(segments) * (2 * pi / segments)
+    fan = np.zeros((segments + 1, 2), dtype='f8')
+    fan[1:, 0] = np.cos(angles)
+    fan[1:, 1] = np.sin(angles)
+
+    circumference = np.arange(segments)
+    indexes = np.stack(
+        (
+            np.zeros(segments, dtype='i4'),
+            circumference + 1,
+            (circumference + 1) % segments + 1,
+        ),
+        axis=1,
+    ).ravel()
+
+    triangles = fan[indexes]
+    triangles.setflags(write=False)
+
+    return triangles
+
 
 class CircularButton(Button):
 
@@ -34,11 +77,8 @@ class CircularButton(Button):
         super()._set_attributes(app, uuid, **kwargs)
         self._set_attributes(app, uuid, **kwargs)
 
-        # Write the shader
-        super()._set_shader_programs()
-
-        # Create all ModernGL objects
-        super()._set_vao()
+        # Create the geometry
+        self._set_vertexes()
 
 ###############################################################################
 
@@ -51,6 +91,22 @@ class CircularButton(Button):
             (pos_x - self.x) ** 2 + (pos_y - self.y) ** 2
         ) <= self.radius ** 2
 
+    def _render_shape(self, renderer):
+        """
+        Add the circle (list of triangles) to the GUI batch.
+
+        Parameters
+        ----------
+        renderer : GUIRenderer
+            Batched renderer of the GUI.
+
+        Returns
+        -------
+        None.
+
+        """
+        renderer.add_triangles(self.__vertexes, self.color)
+
     def _set_attributes(self, app, uuid: str, **kwargs):
         default_kwargs = {
             "radius": 1,
@@ -65,52 +121,18 @@ class CircularButton(Button):
         self.__radius = kwargs["radius"]
 
     def _set_vertexes(self):
-        # Vertex data (circle for the button)
-
-        error = 0.5
-
-        tolerance = acos(2 * (1 - error / self.radius) ** 2 - 1)
-
-        number_circumference_vertexes = ceil(2 * pi / tolerance)
-
-        angle = 2 * pi / number_circumference_vertexes
-
-        origin_vertex = [2 * (
-            (self.x - (self.app.WIN_SIZE[0] / 2)
-             ) / (
-                self.app.WIN_SIZE[0]
-            )), - 2 * ((
-                self.y - (self.app.WIN_SIZE[1] / 2)
-            ) / (
-                self.app.WIN_SIZE[1]
-            )), 0.0]
-
-        circumference_vertexes = [
-            [2 * (
-                (self.x + self.radius *
-                 cos(angle * i) - (self.app.WIN_SIZE[0] / 2)
-                 ) / (
-                    self.app.WIN_SIZE[0]
-                )), - 2 * ((
-                    self.y + self.radius *
-                    sin(angle * i) - (self.app.WIN_SIZE[1] / 2)
-                ) / (
-                    self.app.WIN_SIZE[1]
-                )), 0.0
-             ] for i in range(number_circumference_vertexes)]
-
-        gl = [
-            [
-                origin_vertex,
-                circumference_vertexes[i % number_circumference_vertexes],
-                circumference_vertexes[(i + 1) % number_circumference_vertexes]
-            ] for i in range(number_circumference_vertexes)
-        ]
-
-        self.__vertexes = np.array(
-            gl,
-            dtype='f4'
-        ).flatten('C')
+        # Vertex data (circle for the button): the shared unit circle scaled by
+        # the radius and moved to the centre, in NDC
+        tolerance = acos(2 * (1 - CIRCLE_ERROR / self.radius) ** 2 - 1)
+
+        triangles = unit_circle(ceil(2 * pi / tolerance))
+
+        width, height = self.app.WIN_SIZE
+
+        self.__vertexes = (
+            triangles * (2 * self.radius / width, - 2 * self.radius / height)
+            + (2 * self.x / width - 1, 1 - 2 * self.y / height)
+        ).astype('f4')
 
 ###############################################################################
 
@@ -120,6 +142,24 @@ class CircularButton(Button):
 
 
     @property  # noqa
+    def bounds(self) -> tuple[float, float, float, float]:
+        """
+        Return the bounding box of the button used for hit-testing.
+
+        Returns
+        -------
+        tuple[float, float, float, float]
+            Left, top, right and bottom in window pixels.
+
+        """
+        return (
+            self.x - self.__radius,
+            self.y - self.__radius,
+            self.x + self.__radius,
+            self.y + self.__radius,
+        )
+
+    @property
     def radius(self) -> int:
         """
         Get Radius.
@@ -149,7 +189,9 @@ class CircularButton(Button):
         """
         self.__radius = new_radius
 
-        self._set_vao()
+        self._set_vertexes()
+
+        self._layout_changed()
 
     @property
     def vertexes(self) -> np.ndarray:
@@ -159,7 +201,8 @@ class CircularButton(Button):
         Returns
         -------
         Numpy array.
-            Array with vertexes positions.
+            Array (number of vertexes, 2) with the positions of the triangles
+            vertexes in NDC.
 
         """
         return self.__vertexes
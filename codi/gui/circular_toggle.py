@@ -12,6 +12,7 @@ if __name__ == "__main__":
 
 
 from .circular_button import CircularButton
+from .events import Toggled
 
 
 class CircularToggle(CircularButton):
@@ -68,7 +69,7 @@ class CircularToggle(CircularButton):
 ###############################################################################
 #                                Public Methods                               #
 
-    def check_click(self, mouse_pos: tuple[int, int]) -> bool:
+    def check_click(self, mouse_pos: tuple[int, int]) -> Toggled | None:
         click = super().check_click(mouse_pos)
 
         if click:
@@ -77,7 +78,9 @@ class CircularToggle(CircularButton):
             else:
                 self.toggle()
 
-        return click
+            return Toggled(self.uuid, self.is_toggled)
+
+        return None
 
     def render(self):
         if self.is_hidden:
@@ -92,9 +95,11 @@ class CircularToggle(CircularButton):
 
     def toggle(self):
         self.__is_toggled = True
+        self.mark_dirty()
 
     def untoggle(self):
         self.__is_toggled = False
+        self.mark_dirty()
 
 ###############################################################################
 
@@ -12,6 +12,12 @@ if __name__ == "__main__":
 
 
 from abc import ABC, abstractmethod
+from typing import Any
+
+from .events import GUIEvent
+
+# Properties of the layout autosized to the window: they change on a resize
+GEOMETRY_PROPERTIES = ("x", "y", "width", "height", "radius")
 
 
 class Element(ABC):
@@ -24,6 +30,14 @@ class Element(ABC):
         "__uuid",
     )
 
+    # Incremented every time an Element moves, is hidden or is unhidden, so
+    # the GUI Managers know their hit-testing grids must be rebuilt
+    layout_version = 0
+
+    # Incremented every time anything drawn by the GUI changes (state, color,
+    # text...), so the GUI overlay is redrawn
+    render_version = 0
+
 ###############################################################################
 #                             Overloaded Operators                            #
 
@@ -66,11 +80,30 @@ class Element(ABC):
 ###############################################################################
 
 
+###############################################################################
+#                               Private Methods                               #
+
+    def _layout_changed(self):  # noqa
+        """
+        Notify that the Element has moved, been hidden or been unhidden.
+
+        Returns
+        -------
+        None.
+
+        """
+        Element.layout_version += 1
+
+        Element.mark_dirty()
+
+###############################################################################
+
+
 ###############################################################################
 #                                Public Methods                               #
 
     @abstractmethod  # noqa
-    def check_click(self, mouse_position: tuple[int, int]) -> str | None:
+    def check_click(self, mouse_position: tuple[int, int]) -> GUIEvent | None:
         """
         Template Element.
 
@@ -88,8 +121,8 @@ class Element(ABC):
 
         Returns
         -------
-        string or None
-            UUID of the Element if clicked or None if not.
+        GUIEvent or None
+            Event of the Element if clicked or None if not.
 
         """
         raise NotImplementedError(
@@ -123,7 +156,7 @@ class Element(ABC):
         )
 
     @abstractmethod
-    def check_motion(self, mouse_position: tuple[int, int]) -> str | None:
+    def check_motion(self, mouse_position: tuple[int, int]) -> GUIEvent | None:
         """
         Template Element.
 
@@ -141,8 +174,8 @@ class Element(ABC):
 
         Returns
         -------
-        string or None
-            UUID of the Element if clicked or None if not.
+        GUIEvent or None
+            Event of the Element if moved on or None if not.
 
         """
         raise NotImplementedError(
@@ -150,7 +183,7 @@ class Element(ABC):
         )
 
     @abstractmethod
-    def check_unclick(self, mouse_position: tuple[int, int]) -> str | None:
+    def check_unclick(self, mouse_position: tuple[int, int]) -> GUIEvent | None:
         """
         Template Element.
 
@@ -168,8 +201,8 @@ class Element(ABC):
 
         Returns
         -------
-        string or None
-            UUID of the Element if clicked or None if not.
+        GUIEvent or None
+            Event of the Element if unclicked or None if not.
 
         """
         raise NotImplementedError(
@@ -208,6 +241,8 @@ class Element(ABC):
         """
         self.__is_hidden = True
 
+        self._layout_changed()
+
     def lock(self):
         """
         Lock Element.
@@ -219,6 +254,22 @@ class Element(ABC):
         """
         self.__is_locked = True
 
+        Element.mark_dirty()
+
+    @staticmethod
+    def mark_dirty():
+        """
+        Mark the GUI to be redrawn on the next frame.
+
+        Must be called whenever something drawn by an Element changes.
+
+        Returns
+        -------
+        None.
+
+        """
+        Element.render_version += 1
+
     @abstractmethod
     def render(self):
         """
@@ -240,6 +291,28 @@ class Element(ABC):
             "Method not implemented, child class must implement it."
         )
 
+    def resize(self, kwargs: dict[str, Any]):
+        """
+        Set the position and size of the Element after a window resize.
+
+        Only the geometry is changed (through the setters, which rebuild the
+        vertexes); state, colours and text are kept.
+
+        Parameters
+        ----------
+        kwargs : dict[string, Any]
+            Keyword arguments of the Element in the layout, already autosized
+            to the new window size.
+
+        Returns
+        -------
+        None.
+
+        """
+        for name in GEOMETRY_PROPERTIES:
+            if name in kwargs:
+                setattr(self, name, kwargs[name])
+
     @abstractmethod
     def toggle(self):
         """
@@ -272,6 +345,8 @@ class Element(ABC):
         """
         self.__is_hidden = False
 
+        self._layout_changed()
+
     def unlock(self):
         """
         Un-lock Element.
@@ -283,6 +358,8 @@ class Element(ABC):
         """
         self.__is_locked = False
 
+        Element.mark_dirty()
+
     @abstractmethod
     def untoggle(self):
         """
@@ -323,6 +400,22 @@ class Element(ABC):
         """
         return self.__app
 
+    @property
+    def bounds(self) -> tuple[float, float, float, float] | None:
+        """
+        Return the bounding box of the Element used for hit-testing.
+
+        Elements that can react to the mouse anywhere (or contain other
+        Elements, like Menus) return None and are always checked.
+
+        Returns
+        -------
+        tuple[float, float, float, float] or None
+            Left, top, right and bottom in window pixels, or None.
+
+        """
+        return None
+
     @property
     def is_hidden(self) -> bool:
         """
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*- noqa
+
+if __name__ == "__main__":
+    raise SystemExit(
+        'You are executing a package-module file.' +
+        ' Execute a main instead and import the module.')
+
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class GUIEvent:
+    """
+    Event emitted by a GUI Element.
+
+    Returned by the check methods of the Elements (and of the GUI Manager) so
+    the application can dispatch on the type of the event and the uuid of the
+    Element instead of parsing strings.
+    """
+
+    uuid: str
+
+
+@dataclass(frozen=True, slots=True)
+class Clicked(GUIEvent):
+    """Element clicked."""
+
+
+@dataclass(frozen=True, slots=True)
+class Toggled(GUIEvent):
+    """Toggle Element (or Menu) clicked, with its state after the click."""
+
+    toggled: bool
+
+
+@dataclass(frozen=True, slots=True)
+class Released(GUIEvent):
+    """Mouse button released on the Element."""
+
+
+@dataclass(frozen=True, slots=True)
+class MovedOver(GUIEvent):
+    """Mouse moved over the Element."""
+
+
+@dataclass(frozen=True, slots=True)
+class SliderChanged(GUIEvent):
+    """Slider dragged, with its value after the motion."""
+
+    value: float
@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*- noqa
+
+if __name__ == "__main__":
+    raise SystemExit(
+        'You are executing a package-module file.' +
+        ' Execute a main instead and import the module.')
+
+
+import moderngl as mgl
+import numpy as np
+import pygame as pg
+
+from math import ceil
+
+# Width in pixels of the atlas texture
+ATLAS_WIDTH = 1024
+
+# Empty pixels around each glyph so mipmaps do not bleed into the neighbours
+GLYPH_PADDING = 4
+
+# Glyphs rasterized when the atlas is created: printable ASCII
+INITIAL_CHARACTERS = "".join(chr(code) for code in range(0x20, 0x7F))
+
+# Free rows reserved for glyphs outside the initial characters (accents...)
+SPARE_ROWS = 2
+
+# Glyph used for characters that can not be rasterized or do not fit
+MISSING_GLYPH = "?"
+
+
+class GlyphAtlas:
+    """
+    Texture with the glyphs of a font and size.
+
+    The glyphs are rasterized once and only their coverage (alpha) is kept in
+    a single channel texture, so any text of the font is a list of quads from
+    the same texture, coloured by the renderer.
+    Characters missing from the atlas are added on demand to the spare rows.
+    The rasterized glyphs can be saved (state) and restored without loading
+    the font, which is only loaded if a missing character must be added.
+    """
+
+    __slots__ = (
+        "__app",
+        "__coverage",
+        "__cursor",
+        "__font",
+        "__font_size",
+        "__glyphs",
+        "__line_height",
+        "__scale_factor",
+        "__sys_font",
+        "__texture",
+    )
+
+###############################################################################
+#                             Overloaded Operators                            #
+
+    def __init__(
+            self,
+            app,
+            sys_font: str,
+            font_size: int,
+            scale_factor: int,
+            state: dict[str, np.ndarray] | None = None,
+    ):
+        """
+        Initialize Glyph Atlas.
+
+        Parameters
+        ----------
+        app : TYPE
+            The GraphicsEngine instance.
+        sys_font : string
+            Name of the system font.
+        font_size : integer
+            Size of the font in window pixels.
+        scale_factor : integer
+            The glyphs are rasterized this many times bigger and minified
+            when drawn, for smoother text.
+        state : dict[string, numpy array], optional
+            Glyphs rasterized before (state property of an atlas of the same
+            font and size) to restore instead of rasterizing them. The default
+            is None.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__app = app
+
+        self.__sys_font = sys_font
+        self.__font_size = font_size
+        self.__scale_factor = scale_factor
+
+        # Pygame font object, loaded only when a glyph must be rasterized
+        self.__font = None
+
+        # Character: (advance, u left, v top, u right, v bottom)
+        self.__glyphs: dict[str, tuple[int, float, float, float, float]] = {}
+
+        if state is None:
+            self.__line_height = self._get_font().get_height()
+            self._set_coverage()
+        else:
+            self._restore(state)
+
+        self.__texture = None
+        self._set_texture()
+
+###############################################################################
+
+
+###############################################################################
+#                               Private Methods                               #
+
+    def _add_glyph(self, character: str) -> bool:  # noqa
+        """
+        Rasterize a glyph in the first free place of the atlas surface.
+
+        Parameters
+        ----------
+        character : string
+            Character to add.
+
+        Returns
+        -------
+        bool
+            False if the glyph can not be rasterized or does not fit.
+
+        """
+        try:
+            glyph = self._get_font().render(character, True, (255, 255, 255))
+        except (pg.error, ValueError):
+            return False
+
+        width = glyph.get_width()
+        atlas_height, atlas_width = self.__coverage.shape
+        x, y = self.__cursor
+
+        # Next row
+        if x + width + GLYPH_PADDING > atlas_width:
+            x = GLYPH_PADDING
+            y += self.__line_height + GLYPH_PADDING
+
+        if y + self.__line_height + GLYPH_PADDING > atlas_height:
+            return False
+
+        # Only the coverage (alpha) of the glyph is kept, rows from the top
+        coverage = pg.surfarray.array_alpha(glyph).T[:self.__line_height]
+        self.__coverage[y:y + coverage.shape[0], x:x + width] = coverage
+
+        self.__glyphs[character] = (
+            width,
+            x / atlas_width,
+            y / atlas_height,
+            (x + width) / atlas_width,
+            (y + self.__line_height) / atlas_height,
+        )
+
+        self.__cursor = (x + width + GLYPH_PADDING, y)
+
+        return True
+
+    def _get_font(self) -> pg.font.Font:
+        """
+        Return the Pygame font, loading it from the system font the first time.
+
+        Returns
+        -------
+        pygame Font
+            Font rasterized scale factor times bigger.
+
+        """
+        if self.__font is None:
+            self.__font = pg.font.SysFont(
+                self.__sys_font, self.__font_size * self.__scale_factor)
+
+        return self.__font
+
+    def _restore(self, state: dict[str, np.ndarray]):
+        """
+        Restore the glyphs of a saved state.
+
+        Parameters
+        ----------
+        state : dict[string, numpy array]
+            State property of an atlas of the same font and size.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__coverage = np.array(state["coverage"], dtype='u1')
+
+        cursor_x, cursor_y, self.__line_height = (
+            int(value) for value in state["info"])
+        self.__cursor = (cursor_x, cursor_y)
+
+        self.__glyphs = {
+            character: (int(metrics[0]), *(float(uv) for uv in metrics[1:]))
+            for character, metrics in zip(
+                str(state["characters"]), state["metrics"])
+        }
+
+    def _set_coverage(self):
+        """
+        Rasterize the initial characters in a new atlas coverage.
+
+        The height is the rows needed by the initial characters and the spare
+        rows.
+
+        Returns
+        -------
+        None.
+
+        """
+        advances = sum(
+            self._get_font().size(character)[0] + GLYPH_PADDING
+            for character in INITIAL_CHARACTERS
+        )
+        rows = ceil(advances / (ATLAS_WIDTH - GLYPH_PADDING)) + 1 + SPARE_ROWS
+
+        # Alpha of the glyphs, first row (top) is v = 0
+        self.__coverage = np.zeros(
+            (GLYPH_PADDING + rows * (self.__line_height + GLYPH_PADDING),
+             ATLAS_WIDTH),
+            dtype='u1',
+        )
+        self.__cursor = (GLYPH_PADDING, GLYPH_PADDING)
+
+        for character in INITIAL_CHARACTERS:
+            self._add_glyph(character)
+
+    def _set_texture(self):
+        """
+        Upload the atlas coverage to the texture.
+
+        Returns
+        -------
+        None.
+
+        """
+        bytes_atlas = self.__coverage.tobytes()
+
+        if self.__texture is None:
+            self.__texture = self.app.ctx.texture(
+                self.__coverage.shape[::-1], 1, bytes_atlas)
+
+            # Use linear filtering for smoother text
+            self.__texture.filter = (mgl.LINEAR, mgl.LINEAR)
+        else:
+            self.__texture.write(bytes_atlas)
+
+        self.__texture.build_mipmaps()
+
+###############################################################################
+
+
+###############################################################################
+#                                Public Methods                               #
+
+    def destroy(self):
+        """
+        Destroy the atlas texture and release memory.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__texture.release()
+
+    def layout(self, text: str) -> tuple[np.ndarray, float, float]:
+        """
+        Build the quads of a text.
+
+        Parameters
+        ----------
+        text : string
+            Text to build.
+
+        Returns
+        -------
+        quads : numpy array
+            One quad per character, four vertexes in triangle strip order
+            with position (x, y) in window pixels from the bottom-left corner
+            of the text and texture coordinates (u, v) of the atlas.
+        width : float
+            Width of the text in window pixels.
+        height : float
+            Height of the text in window pixels.
+
+        """
+        # Characters outside the atlas are added and the texture uploaded
+        missing = sorted(set(text).difference(self.__glyphs))
+        if any([self._add_glyph(character) for character in missing]):
+            self._set_texture()
+
+        glyphs = np.array(
+            [
+                self.__glyphs.get(character, self.__glyphs[MISSING_GLYPH])
+                for character in text
+            ],
+            dtype='f4',
+        ).reshape(-1, 5)
+
+        right = np.cumsum(glyphs[:, 0]) / self.__scale_factor
+        left = right - glyphs[:, 0] / self.__scale_factor
+        height = self.__line_height / self.__scale_factor
+
+        quads = np.zeros((len(glyphs), 4, 4), dtype='f4')
+
+        # Bottom-left, bottom-right, top-left, top-right
+        quads[:, 0::2, 0] = left[:, None]
+        quads[:, 1::2, 0] = right[:, None]
+        quads[:, 2:, 1] = height
+        quads[:, 0::2, 2] = glyphs[:, 1, None]
+        quads[:, 1::2, 2] = glyphs[:, 3, None]
+        quads[:, 2:, 3] = glyphs[:, 2, None]
+        quads[:, :2, 3] = glyphs[:, 4, None]
+
+        return quads, float(right[-1]) if len(right) else 0.0, height
+
+###############################################################################
+
+
+###############################################################################
+#                                  Properties                                 #
+
+    @property  # noqa
+    def app(self):
+        """
+        Return app engine.
+
+        Returns
+        -------
+        TYPE
+            The GraphicsEngine instance.
+
+        """
+        return self.__app
+
+    @property
+    def state(self) -> dict[str, np.ndarray]:
+        """
+        Return the rasterized glyphs, to restore the atlas without the font.
+
+        Returns
+        -------
+        dict[string, numpy array]
+            Coverage of the atlas, characters, their metrics and the cursor
+            and line height (info).
+
+        """
+        return {
+            "coverage": self.__coverage,
+            "characters": np.array("".join(self.__glyphs)),
+            "metrics": np.array(list(self.__glyphs.values()), dtype='f8'),
+            "info": np.array(
+                [*self.__cursor, self.__line_height], dtype='i8'),
+        }
+
+    @property
+    def texture(self) -> mgl.Texture:
+        """
+        Return the atlas texture.
+
+        Returns
+        -------
+        moderngl Texture
+            Texture with the glyphs.
+
+        """
+        return self.__texture
+
+###############################################################################
@@ -11,9 +11,16 @@ if __name__ == "__main__":
         ' Execute a main instead and import the module.')
 
 
+import json
+
+from copy import deepcopy
 from typing import Any
 
-from .element import Element
+from .element import GEOMETRY_PROPERTIES, Element
+from .events import GUIEvent
+from .gui_renderer import GUIRenderer
+from .layout_cache import LAYOUT_CACHE_DIR, LayoutCache
+from .spatial_grid import SpatialGrid
 
 
 class GUIManager(Element):
@@ -21,22 +28,74 @@ class GUIManager(Element):
     __slots__ = (
         "__app",
         "__elements_buffer",
+        "__grid",
+        "__grid_version",
+        "__hover_version",
+        "__hovered",
+        "__is_owner",
+        "__layout_cache",
+        "__layout_source",
+        "__mouse_position",
+        "__renderer",
+        "__rendered_version",
         "__types_elements",
     )
 
 ###############################################################################
 #                             Overloaded Operators                            #
 
-    def __init__(self, app):
+    def __init__(self, app, renderer: GUIRenderer = None):
+        """
+        Initialize GUI Manager.
+
+        Parameters
+        ----------
+        app : TYPE
+            The GraphicsEngine instance.
+        renderer : GUIRenderer, optional
+            Batched renderer of the GUI this manager is part of (Menus). The
+            default is None, creating a new one owned by this manager.
+
+        Returns
+        -------
+        None.
+
+        """
         self.__app = app
 
         self.__elements_buffer: dict[str, type[Element]] = {}
 
+        # Hit-testing grid of the visible Elements, rebuilt when the layout
+        # version of the Elements changes (None forces a rebuild)
+        self.__grid = SpatialGrid()
+        self.__grid_version = None
+
+        # Elements hovered on the last hover check, with the mouse position
+        # and the layout version of the Elements of that check
+        self.__hovered: list[type[Element]] = []
+        self.__mouse_position = None
+        self.__hover_version = None
+
+        # Only the manager that creates the renderer draws and destroys it
+        self.__is_owner = renderer is None
+        self.__renderer = GUIRenderer(app) if renderer is None else renderer
+
+        # Render version of the Elements drawn in the overlay (None forces a
+        # redraw)
+        self.__rendered_version = None
+
+        # Layout file loaded (load_layout) and its compiled layouts, to fit
+        # the Elements to a new window size
+        self.__layout_cache = None
+        self.__layout_source = None
+
         # !!! This imports are put here to avoid Circular ImportError !!!
         # !!! DON'T MOVE !!!
         from .circular_button import CircularButton
         from .circular_toggle import CircularToggle
         from .menu import Menu
+        from .performance_hud import PerformanceHUD
+        from .progress_bar import ProgressBar
         from .rectangular_button import RectangularButton
         from .rectangular_toggle import RectangularToggle
         from .slider import Slider
@@ -46,6 +105,8 @@ class GUIManager(Element):
             "circular_button": CircularButton,
             "circular_toggle": CircularToggle,
             "menu": Menu,
+            "performance_hud": PerformanceHUD,
+            "progress_bar": ProgressBar,
             "rectangular_button": RectangularButton,
             "rectangular_toggle": RectangularToggle,
             "slider": Slider,
@@ -120,6 +181,8 @@ class GUIManager(Element):
 
         except KeyError:
             self.__elements_buffer[new_element.uuid] = new_element
+            self.__grid_version = None
+            self.mark_dirty()
 
 ###############################################################################
 
@@ -156,11 +219,62 @@ class GUIManager(Element):
             element_property_value *= self.app.WIN_SIZE[0]
         elif element_property_name == 'y':
             element_property_value *= self.app.WIN_SIZE[1]
-        elif element_property_name in ('radius', 'height', 'width', 'x', 'y'):
+        elif element_property_name in GEOMETRY_PROPERTIES:
             element_property_value *= min(self.app.WIN_SIZE)
 
         return element_property_value
 
+    def _candidates(
+            self,
+            mouse_position: tuple[int, int]
+    ) -> list[type[Element]]:
+        """
+        Return the visible Elements that can contain the mouse position.
+
+        Rebuilds the hit-testing grid first if any Element has moved, been
+        hidden or unhidden since the last time.
+
+        Parameters
+        ----------
+        mouse_position : tuple[integer, integer]
+            Tuple with the (x, y) coordinate of the mouse in the window.
+
+        Returns
+        -------
+        list[type[Element]]
+            Candidate Elements in order of addition.
+
+        """
+        if self.__grid_version != Element.layout_version:
+            self.__grid.build([
+                element for element in self.__elements_buffer.values()
+                if not element.is_hidden
+            ])
+            self.__grid_version = Element.layout_version
+
+        return self.__grid.query(mouse_position)
+
+    def _compile_layout(self, source: bytes) -> dict[str, dict[str, Any]]:
+        """
+        Compile a layout file, autosizing its properties to the window.
+
+        Parameters
+        ----------
+        source : bytes
+            Content of the JSON layout file.
+
+        Returns
+        -------
+        dict[string, dict[string, Any]]
+            Layout with the properties autosized to the window.
+
+        """
+        layout = json.loads(source)
+        for meta in layout.values():
+            meta["kwargs"] = self._parse_kwargs(meta["kwargs"])
+
+        return layout
+
     def _parse_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
         """
         Parse a dictionary of keywords arguments.
@@ -189,6 +303,30 @@ class GUIManager(Element):
                     element_property_name, kwargs[element_property_name])
         return kwargs
 
+    def _save_layout(self, layout: dict[str, dict[str, Any]]):
+        """
+        Save a compiled layout with the glyph atlases of the renderer.
+
+        Parameters
+        ----------
+        layout : dict[string, dict[string, Any]]
+            Layout with the properties autosized to the window.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__layout_cache.save(
+            self.__layout_source,
+            self.app.WIN_SIZE,
+            layout,
+            {
+                key: atlas.state
+                for key, atlas in self.__renderer.glyph_atlases.items()
+            },
+        )
+
 
 ###############################################################################
 
@@ -295,13 +433,13 @@ class GUIManager(Element):
 
             self.add_element(meta['class'], uuid, meta['kwargs'])
 
-    def check_click(self, mouse_position: tuple[int, int]) -> str | None:
+    def check_click(self, mouse_position: tuple[int, int]) -> GUIEvent | None:
         """
         Check actions when click event.
 
-        Checks action when clicked and returns the uuid of the element that
+        Checks action when clicked and returns the event of the element that
         recived an action with the click or None if no element recived an
-        action. Will return only one string of the first Element in order of
+        action. Will return only the event of the first Element in order of
         addition found with an action.
 
         Parameters
@@ -311,12 +449,12 @@ class GUIManager(Element):
 
         Returns
         -------
-        string or None
-            Returns the UUID of the element that recived an action with the
+        GUIEvent or None
+            Returns the event of the element that recived an action with the
             click or None if no element recived an action.
 
         """
-        for element in self.__elements_buffer.values():
+        for element in self._candidates(mouse_position):
             click = element.check_click(mouse_position)
             if click:
                 return click
@@ -337,25 +475,54 @@ class GUIManager(Element):
         None.
 
         """
-        for element in self.__elements_buffer.values():
+        candidates = self._candidates(mouse_position)
+
+        # Elements hovered before also get the check to lose the hover state
+        elements = candidates + [
+            element for element in self.__hovered
+            if element not in candidates
+        ]
+
+        for element in elements:
             element.check_hover(mouse_position)
 
-    def check_motion(self, mouse_position: tuple[int, int]):
-        for element in self.__elements_buffer.values():
+        self.__hovered = [element for element in elements if element.is_hovered]
+        self.__mouse_position = mouse_position
+        self.__hover_version = Element.layout_version
+
+    def check_motion(self, mouse_position: tuple[int, int]) -> GUIEvent | None:
+        """
+        Check actions when mouse motion event.
+
+        Parameters
+        ----------
+        mouse_position : tuple[integer, integer]
+            Tuple with the (x, y) coordinate of the mouse in the window.
+
+        Returns
+        -------
+        GUIEvent or None
+            Returns the event of the first element in order of addition that
+            recived an action with the motion or None if no element did.
+
+        """
+        for element in self._candidates(mouse_position):
             motion = element.check_motion(mouse_position)
             if motion:
                 return motion
 
         return None
 
-    def check_unclick(self, mouse_position: tuple[int, int]) -> str | None:
+    def check_unclick(self, mouse_position: tuple[int, int]) -> GUIEvent | None:
         """
         Check actions when unclick event.
 
-        Checks action when unclicked and returns the uuid of the element that
+        Checks action when unclicked and returns the event of the element that
         recived an action with the unclick or None if no element recived an
-        action. Will return only one string of the first Element in order of
+        action. Will return only the event of the first Element in order of
         addition found with an action.
+        All the Elements are checked, not only the ones under the mouse: an
+        Element being dragged (Slider) is released wherever the mouse is.
 
         Parameters
         ----------
@@ -364,8 +531,8 @@ class GUIManager(Element):
 
         Returns
         -------
-        None.
-            Returns the UUID of the element that recived an action with the
+        GUIEvent or None
+            Returns the event of the element that recived an action with the
             unclick or None if no element recived an action.
 
         """
@@ -389,6 +556,43 @@ class GUIManager(Element):
             element.destroy()
             del self.__elements_buffer[element.uuid]
 
+        self.__grid_version = None
+        self.__hovered = []
+
+        if self.__is_owner:
+            self.__renderer.destroy()
+
+    def fit_window(self):
+        """
+        Fit the GUI to a new window size (app WIN_SIZE).
+
+        The Elements of the loaded layout get the position and size compiled
+        for the new window and keep their state. The overlay is recreated;
+        shader programs, buffers and glyph atlases are kept. The layout is
+        compiled in memory: a drag-resize goes through many sizes, so they
+        are not saved to the layout cache.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.__layout_source is not None:
+            compiled = self.__layout_cache.load(
+                self.__layout_source, self.app.WIN_SIZE)
+
+            if compiled is None:
+                layout = self._compile_layout(self.__layout_source)
+            else:
+                layout = compiled[0]
+
+            self.resize({"elements": layout})
+
+        if self.__is_owner:
+            self.__renderer.resize()
+
+        self.mark_dirty()
+
     def hide(self):
         """
         Hides all Elements of the GUI.
@@ -401,6 +605,58 @@ class GUIManager(Element):
         for element in self.__elements_buffer.values():
             element.hide()
 
+    def load_layout(
+            self,
+            path: str,
+            cache_directory: str | None = LAYOUT_CACHE_DIR,
+    ) -> bool:
+        """
+        Add the Elements of a layout file, compiled once per window size.
+
+        The first time a layout file is loaded with a window size, the
+        properties are autosized and the layout is saved with the glyph
+        atlases of its texts. Later runs load the compiled layout and the
+        rasterized glyphs instead.
+
+        Parameters
+        ----------
+        path : string
+            Path of the JSON layout file.
+        cache_directory : string or None, optional
+            Directory of the compiled layouts, None disables the cache. The
+            default is LAYOUT_CACHE_DIR.
+
+        Returns
+        -------
+        bool
+            True if the compiled layout has been loaded from the cache.
+
+        """
+        with open(path, "rb") as file:
+            self.__layout_source = file.read()
+
+        self.__layout_cache = LayoutCache(cache_directory)
+        compiled = self.__layout_cache.load(
+            self.__layout_source, self.app.WIN_SIZE)
+
+        if compiled is not None:
+            layout, atlases = compiled
+
+            for key, state in atlases.items():
+                self.__renderer.glyph_atlas(*key, state)
+
+            self.batch_add_elements(layout, parse=False)
+
+            return True
+
+        layout = self._compile_layout(self.__layout_source)
+
+        self.batch_add_elements(deepcopy(layout), parse=False)
+
+        self._save_layout(layout)
+
+        return False
+
     def lock(self):
         """
         Locks all the Elements of the GUI.
@@ -439,11 +695,43 @@ class GUIManager(Element):
 
         self.__elements_buffer[uuid].destroy()
         del self.__elements_buffer[uuid]
+        self.__grid_version = None
+        self.__hovered = []
+        self.mark_dirty()
 
     def render(self):
         """
         Render all visible Elements of the GUI.
 
+        The Elements add their geometry to the batched renderer, which draws
+        the whole GUI at once into the overlay when the manager owns it. The
+        overlay is only redrawn if an Element has changed since the last
+        frame, otherwise the cached one is composited.
+
+        Returns
+        -------
+        None.
+
+        """
+        if not self.__is_owner:
+            self.render_elements()
+            return None
+
+        if self.__rendered_version != Element.render_version:
+            self.__renderer.begin_overlay()
+            self.render_elements()
+            self.__renderer.flush()
+            self.__renderer.end_overlay()
+
+            # Changes made while rendering (state colors) are already drawn
+            self.__rendered_version = Element.render_version
+
+        self.__renderer.composite()
+
+    def render_elements(self):
+        """
+        Add all visible Elements of the GUI to the batched renderer.
+
         Returns
         -------
         None.
@@ -452,6 +740,26 @@ class GUIManager(Element):
         for element in self.__elements_buffer.values():
             element.render()
 
+    def resize(self, kwargs: dict[str, Any]):
+        """
+        Set the position and size of the Elements after a window resize.
+
+        Parameters
+        ----------
+        kwargs : dict[string, Any]
+            Keyword arguments of the GUI Manager with its Elements (as in the
+            layout) in "elements", already autosized to the new window size.
+
+        Returns
+        -------
+        None.
+
+        """
+        for uuid, meta in kwargs["elements"].items():
+            # Elements removed since the layout was loaded are skipped
+            if uuid in self.__elements_buffer:
+                self.__elements_buffer[uuid].resize(meta["kwargs"])
+
     def toggle(self):
         """
         Toggle all Elements of GUI.
@@ -500,6 +808,25 @@ class GUIManager(Element):
         for element in self.__elements_buffer.values():
             element.untoggle()
 
+    def update_hover(self):
+        """
+        Check the hover again if an Element has moved, been hidden or been
+        unhidden since the last hover check.
+
+        Called every frame, so the hover state follows the Elements shown or
+        hidden under a still mouse (keyboard toggles) without mouse motion.
+
+        Returns
+        -------
+        None.
+
+        """
+        if (
+            self.__mouse_position is not None
+            and self.__hover_version != Element.layout_version
+        ):
+            self.check_hover(self.__mouse_position)
+
 ###############################################################################
 
 
@@ -510,6 +837,19 @@ class GUIManager(Element):
     def app(self):
         return self.__app
 
+    @property
+    def renderer(self) -> GUIRenderer:
+        """
+        Return the batched renderer shared by the Elements.
+
+        Returns
+        -------
+        GUIRenderer
+            Batched renderer.
+
+        """
+        return self.__renderer
+
     @property
     def is_hidden(self) -> bool:
         """
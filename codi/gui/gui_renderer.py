@@ -0,0 +1,596 @@
+# -*- coding: utf-8 -*- noqa
+
+if __name__ == "__main__":
+    raise SystemExit(
+        'You are executing a package-module file.' +
+        ' Execute a main instead and import the module.')
+
+
+import moderngl as mgl
+import numpy as np
+
+from .glyph_atlas import GlyphAtlas
+
+# Floats per vertex: position (x, y), texture coordinates (u, v), colour (r, g, b)
+VERTEX_FLOATS = 7
+
+# Triangles of a quad given as a triangle strip (bottom-left, bottom-right,
+# top-left, top-right)
+QUAD_STRIP_INDEXES = np.array([0, 1, 2, 2, 1, 3], dtype='i4')
+
+# Vertexes reserved the first time, the buffer doubles when it is full
+INITIAL_CAPACITY = 1024
+
+
+class GUIRenderer:
+    """
+    Batched renderer shared by all the GUI Elements.
+
+    Elements do not own any OpenGL object: when rendered they add their
+    triangles to the batch of the frame and the GUIManager flushes it. All the
+    vertexes go into a single dynamic vertex buffer, coloured geometry
+    (buttons, sliders, bars...) is drawn with one call and textured quads
+    (text) with one call per texture. The glyph atlases of the text are shared
+    by all the labels with the same font and size.
+
+    The GUI is drawn into an overlay texture the size of the window, which is
+    composited over the scene every frame and only redrawn when an Element
+    changes.
+    """
+
+    __slots__ = (
+        "__app",
+        "__capacity",
+        "__colour_count",
+        "__colour_program",
+        "__colour_vao",
+        "__colour_vertexes",
+        "__composite_program",
+        "__composite_vao",
+        "__draw_calls",
+        "__flush_calls",
+        "__glyph_atlases",
+        "__overlay",
+        "__overlay_texture",
+        "__screen",
+        "__texture_batches",
+        "__texture_program",
+        "__texture_vao",
+        "__vbo",
+    )
+
+###############################################################################
+#                             Overloaded Operators                            #
+
+    def __init__(self, app):
+        """
+        Initialize GUI Renderer.
+
+        Parameters
+        ----------
+        app : TYPE
+            The GraphicsEngine instance.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__app = app
+
+        # CPU staging of the frame: coloured vertexes and textured vertexes
+        # grouped by texture
+        self.__colour_vertexes = np.zeros(
+            (INITIAL_CAPACITY, VERTEX_FLOATS), dtype='f4')
+        self.__colour_count = 0
+        self.__texture_batches: dict = {}
+
+        # (system font, font size, scale factor): GlyphAtlas
+        self.__glyph_atlases: dict[tuple[str, int, int], GlyphAtlas] = {}
+
+        self.__draw_calls = 0
+        self.__flush_calls = 0
+
+        # Framebuffer bound before drawing the overlay
+        self.__screen = None
+
+        # Write the shaders
+        self._set_shader_programs()
+
+        # Create all ModernGL objects
+        self.__capacity = INITIAL_CAPACITY
+        self._set_vao()
+        self._set_overlay()
+
+###############################################################################
+
+
+###############################################################################
+#                               Private Methods                               #
+
+    def _reserve(self, count: int):  # noqa
+        """
+        Grow the vertex buffer (and CPU staging) to hold count vertexes.
+
+        Parameters
+        ----------
+        count : integer
+            Number of vertexes needed.
+
+        Returns
+        -------
+        None.
+
+        """
+        if count <= self.__capacity:
+            return None
+
+        while self.__capacity < count:
+            self.__capacity *= 2
+
+        # Same buffer object with new storage, the VAOs remain valid
+        self.__vbo.orphan(self.__capacity * VERTEX_FLOATS * 4)
+
+    def _set_overlay(self):
+        """
+        Set the overlay texture and framebuffer, the size of the window.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__overlay_texture = self.app.ctx.texture(self.app.WIN_SIZE, 4)
+        self.__overlay_texture.filter = (mgl.NEAREST, mgl.NEAREST)
+
+        self.__overlay = self.app.ctx.framebuffer(
+            color_attachments=[self.__overlay_texture])
+
+    def _set_shader_programs(self):
+        """
+        Set the shared colour and texture shader programs.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__colour_program = self.app.ctx.program(
+            vertex_shader='''
+            #version 330
+
+            layout (location = 0) in vec2 in_vert;
+            layout (location = 1) in vec3 in_colour;
+
+            out vec3 frag_color;
+
+            void main() {
+                frag_color = in_colour;
+                gl_Position = vec4(in_vert, 0.0, 1.0);
+            }
+            ''',
+            fragment_shader='''
+            #version 330
+
+            in vec3 frag_color;
+
+            out vec4 f_color;
+
+            void main() {
+                f_color = vec4(frag_color, 1.0);
+            }
+            '''
+        )
+
+        self.__texture_program = self.app.ctx.program(
+            vertex_shader='''
+            #version 330
+
+            in vec2 in_position;
+            in vec2 in_texcoord;
+            in vec3 in_colour;
+
+            out vec2 v_texcoord;
+            out vec3 v_colour;
+
+            void main() {
+                v_texcoord = in_texcoord;
+                v_colour = in_colour;
+                gl_Position = vec4(in_position, 0.0, 1.0);
+            }
+            ''',
+            fragment_shader='''
+            #version 330
+
+            in vec2 v_texcoord;
+            in vec3 v_colour;
+
+            uniform sampler2D text_texture;
+
+            out vec4 frag_color;
+
+            void main() {
+                float coverage = texture(text_texture, v_texcoord).r;
+                if (coverage < 0.1) {
+                   discard; // Discard transparent pixels
+                }
+
+                frag_color = vec4(v_colour, coverage);
+            }
+            '''
+        )
+
+        # Full window quad from the vertex index (no vertex buffer), copying
+        # the overlay pixels that have been drawn
+        self.__composite_program = self.app.ctx.program(
+            vertex_shader='''
+            #version 330
+
+            void main() {
+                vec2 corner = vec2(gl_VertexID % 2, gl_VertexID / 2);
+                gl_Position = vec4(corner * 2.0 - 1.0, 0.0, 1.0);
+            }
+            ''',
+            fragment_shader='''
+            #version 330
+
+            uniform sampler2D overlay;
+
+            out vec4 frag_color;
+
+            void main() {
+                vec4 color = texelFetch(overlay, ivec2(gl_FragCoord.xy), 0);
+                if (color.a == 0.0) {
+                   discard; // Nothing of the GUI in this pixel
+                }
+
+                frag_color = vec4(color.rgb, 1.0);
+            }
+            '''
+        )
+
+        if self.app.DEBUG:
+            print("GUI shader programs compiled and linked successfully.")
+
+    def _set_vao(self):
+        """
+        Set the dynamic vertex buffer and one vertex array for each program.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__vbo = self.app.ctx.buffer(
+            reserve=self.__capacity * VERTEX_FLOATS * 4, dynamic=True)
+
+        self.__colour_vao = self.app.ctx.vertex_array(
+            self.__colour_program,
+            [(self.__vbo, '2f 2x4 3f', 'in_vert', 'in_colour')],
+        )
+
+        self.__texture_vao = self.app.ctx.vertex_array(
+            self.__texture_program,
+            [(self.__vbo, '2f 2f 3f', 'in_position', 'in_texcoord',
+              'in_colour')],
+        )
+
+        self.__composite_vao = self.app.ctx.vertex_array(
+            self.__composite_program, [])
+
+###############################################################################
+
+
+###############################################################################
+#                                Public Methods                               #
+
+    def add_quad(self, vertexes: np.ndarray, color: tuple[float, float, float]):
+        """
+        Add a coloured quad to the frame.
+
+        Parameters
+        ----------
+        vertexes : numpy array
+            Four vertexes in triangle strip order (bottom-left, bottom-right,
+            top-left, top-right), with x and y in NDC as first components.
+        color : tuple[float, float, float]
+            Tuple describing the RGB color as floats from 0 to 1.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.add_triangles(
+            np.reshape(vertexes, (4, -1))[QUAD_STRIP_INDEXES], color)
+
+    def add_triangles(
+            self,
+            vertexes: np.ndarray,
+            color: tuple[float, float, float]
+    ):
+        """
+        Add coloured triangles to the frame.
+
+        Parameters
+        ----------
+        vertexes : numpy array
+            Vertexes of the triangles (three per triangle), with x and y in NDC
+            as first components.
+        color : tuple[float, float, float]
+            Tuple describing the RGB color as floats from 0 to 1.
+
+        Returns
+        -------
+        None.
+
+        """
+        vertexes = np.reshape(vertexes, (len(vertexes), -1))
+        start = self.__colour_count
+        end = start + len(vertexes)
+
+        if end > len(self.__colour_vertexes):
+            staging = np.zeros(
+                (max(end, 2 * len(self.__colour_vertexes)), VERTEX_FLOATS),
+                dtype='f4')
+            staging[:start] = self.__colour_vertexes[:start]
+            self.__colour_vertexes = staging
+
+        self.__colour_vertexes[start:end, 0:2] = vertexes[:, 0:2]
+        self.__colour_vertexes[start:end, 4:7] = color
+        self.__colour_count = end
+
+    def add_text_quads(
+            self,
+            texture: mgl.Texture,
+            quads: np.ndarray,
+            color: tuple[float, float, float]
+    ):
+        """
+        Add text quads to the frame.
+
+        Parameters
+        ----------
+        texture : moderngl Texture
+            Single channel texture with the coverage of the glyphs (a
+            GlyphAtlas texture).
+        quads : numpy array
+            Quads of four vertexes in triangle strip order with position
+            (x, y) in NDC and texture coordinates (u, v).
+        color : tuple[float, float, float]
+            Tuple describing the RGB color of the text as floats from 0 to 1.
+
+        Returns
+        -------
+        None.
+
+        """
+        quads = np.reshape(quads, (-1, 4, 4))
+
+        if len(quads) == 0:
+            return None
+
+        vertexes = np.empty((len(quads) * 6, VERTEX_FLOATS), dtype='f4')
+        vertexes[:, 0:4] = quads[:, QUAD_STRIP_INDEXES].reshape(-1, 4)
+        vertexes[:, 4:7] = color
+
+        self.__texture_batches.setdefault(texture, []).append(vertexes)
+
+    def begin_overlay(self):
+        """
+        Start redrawing the overlay: bind and clear it.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__screen = self.app.ctx.fbo
+
+        self.__overlay.use()
+        self.__overlay.clear(0.0, 0.0, 0.0, 0.0)
+
+    def composite(self):
+        """
+        Draw the overlay over the bound framebuffer.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__overlay_texture.use()
+        self.__composite_vao.render(mgl.TRIANGLE_STRIP, vertices=4)
+
+        # Draw calls of the frame: the overlay redraw (if any) and this one
+        self.__draw_calls = self.__flush_calls + 1
+        self.__flush_calls = 0
+
+    def destroy(self):
+        """
+        Destroy all OpenGL objects and release memory.
+
+        Returns
+        -------
+        None.
+
+        """
+        for atlas in self.__glyph_atlases.values():
+            atlas.destroy()
+
+        self.__colour_vao.release()
+
+        self.__texture_vao.release()
+
+        self.__composite_vao.release()
+
+        self.__overlay.release()
+
+        self.__overlay_texture.release()
+
+        self.__vbo.release()
+
+        self.__colour_program.release()
+
+        self.__texture_program.release()
+
+        self.__composite_program.release()
+
+    def end_overlay(self):
+        """
+        Finish redrawing the overlay, binding back the previous framebuffer.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__screen.use()
+        self.__screen = None
+
+    def flush(self):
+        """
+        Upload the vertexes of the frame and draw them.
+
+        Coloured geometry is drawn first and text afterwards, so the text of
+        an Element is always on top of its shape.
+
+        Returns
+        -------
+        None.
+
+        """
+        batches = [
+            (texture, np.concatenate(quads))
+            for texture, quads in self.__texture_batches.items()
+        ]
+        total = self.__colour_count + sum(len(vertexes) for _, vertexes in batches)
+
+        self.__flush_calls = 0
+
+        if total == 0:
+            return None
+
+        self._reserve(total)
+
+        # Upload the whole frame with a single write
+        frame = np.concatenate(
+            [self.__colour_vertexes[:self.__colour_count]] +
+            [vertexes for _, vertexes in batches]
+        )
+        self.__vbo.write(frame.tobytes())
+
+        if self.__colour_count:
+            self.__colour_vao.render(
+                mgl.TRIANGLES, vertices=self.__colour_count, first=0)
+            self.__flush_calls += 1
+
+        first = self.__colour_count
+        for texture, vertexes in batches:
+            texture.use()
+            self.__texture_vao.render(
+                mgl.TRIANGLES, vertices=len(vertexes), first=first)
+            self.__flush_calls += 1
+            first += len(vertexes)
+
+        self.__colour_count = 0
+        self.__texture_batches.clear()
+
+    def glyph_atlas(
+            self,
+            sys_font: str,
+            font_size: int,
+            scale_factor: int,
+            state: dict[str, np.ndarray] | None = None,
+    ) -> GlyphAtlas:
+        """
+        Return the glyph atlas of a font and size, creating it the first time.
+
+        Parameters
+        ----------
+        sys_font : string
+            Name of the system font.
+        font_size : integer
+            Size of the font in window pixels.
+        scale_factor : integer
+            Rasterization scale of the glyphs.
+        state : dict[string, numpy array], optional
+            Glyphs rasterized before to restore if the atlas is created. The
+            default is None.
+
+        Returns
+        -------
+        GlyphAtlas
+            Shared glyph atlas.
+
+        """
+        key = (sys_font, font_size, scale_factor)
+
+        if key not in self.__glyph_atlases:
+            self.__glyph_atlases[key] = GlyphAtlas(self.app, *key, state)
+
+        return self.__glyph_atlases[key]
+
+    def resize(self):
+        """
+        Recreate the overlay with the new size of the window.
+
+        Shader programs, buffers and glyph atlases are kept.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__overlay.release()
+
+        self.__overlay_texture.release()
+
+        self._set_overlay()
+
+###############################################################################
+
+
+###############################################################################
+#                                  Properties                                 #
+
+    @property  # noqa
+    def app(self):
+        """
+        Return app engine.
+
+        Returns
+        -------
+        TYPE
+            The GraphicsEngine instance.
+
+        """
+        return self.__app
+
+    @property
+    def draw_calls(self) -> int:
+        """
+        Return the draw calls issued by the GUI on the last frame.
+
+        Returns
+        -------
+        int
+            Number of draw calls.
+
+        """
+        return self.__draw_calls
+
+    @property
+    def glyph_atlases(self) -> dict[tuple[str, int, int], GlyphAtlas]:
+        """
+        Return the glyph atlases created, by font, size and scale factor.
+
+        Returns
+        -------
+        dict[tuple[string, integer, integer], GlyphAtlas]
+            Copy of the glyph atlases of the renderer.
+
+        """
+        return dict(self.__glyph_atlases)
+
+###############################################################################
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*- noqa
+
+if __name__ == "__main__":
+    raise SystemExit(
+        'You are executing a package-module file.' +
+        ' Execute a main instead and import the module.')
+
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pygame as pg
+
+# Directory of the compiled layouts (generated on the first run)
+LAYOUT_CACHE_DIR = "data/gui_cache"
+
+# Changed when the format of the compiled layouts changes
+LAYOUT_CACHE_VERSION = 1
+
+
+class LayoutCache:
+    """
+    Disk cache of compiled GUI layouts.
+
+    A compiled layout is the layout file with every size and position already
+    scaled to the window, and the glyph atlases rasterized for its texts. It
+    is saved in a .npz file named after the hash of the layout file and the
+    window size, so later runs build the GUI without autosizing the
+    properties or loading the fonts.
+    """
+
+    __slots__ = (
+        "__directory",
+    )
+
+###############################################################################
+#                             Overloaded Operators                            #
+
+    def __init__(self, directory: str | None = LAYOUT_CACHE_DIR):
+        """
+        Initialize Layout Cache.
+
+        Parameters
+        ----------
+        directory : string or None, optional
+            Directory of the compiled layouts, None disables the cache. The
+            default is LAYOUT_CACHE_DIR.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__directory = directory
+
+###############################################################################
+
+
+###############################################################################
+#                               Private Methods                               #
+
+    def _path(  # noqa
+            self,
+            source: bytes,
+            window_size: tuple[int, int],
+    ) -> str:
+        """
+        Return the path of the compiled layout of a layout file and window.
+
+        Parameters
+        ----------
+        source : bytes
+            Content of the layout file.
+        window_size : tuple[integer, integer]
+            Width and height of the window.
+
+        Returns
+        -------
+        string
+            Path of the .npz file.
+
+        """
+        signature = hashlib.sha1(source)
+        # The rasterized glyphs depend on the Pygame (FreeType) version
+        signature.update(json.dumps(
+            [list(window_size), LAYOUT_CACHE_VERSION, pg.version.ver]
+        ).encode())
+
+        return os.path.join(
+            self.__directory, f"layout-{signature.hexdigest()[:16]}.npz")
+
+###############################################################################
+
+
+###############################################################################
+#                                Public Methods                               #
+
+    def load(  # noqa
+            self,
+            source: bytes,
+            window_size: tuple[int, int],
+    ) -> tuple[dict, dict] | None:
+        """
+        Load the compiled layout of a layout file and window.
+
+        Parameters
+        ----------
+        source : bytes
+            Content of the layout file.
+        window_size : tuple[integer, integer]
+            Width and height of the window.
+
+        Returns
+        -------
+        tuple[dict, dict] or None
+            Layout with the properties scaled to the window and the states of
+            the glyph atlases by (font, size, scale factor), or None if it is
+            not compiled yet.
+
+        """
+        if self.__directory is None:
+            return None
+
+        path = self._path(source, window_size)
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as blob:
+                layout = json.loads(str(blob["layout"]))
+                atlases = {
+                    tuple(key): {
+                        name: blob[f"{index}_{name}"]
+                        for name in ("coverage", "characters", "metrics", "info")
+                    }
+                    for index, key in enumerate(
+                        json.loads(str(blob["atlases"])))
+                }
+        except (OSError, ValueError, KeyError):
+            # Incomplete or corrupt file: the layout is compiled again
+            return None
+
+        return layout, atlases
+
+    def save(
+            self,
+            source: bytes,
+            window_size: tuple[int, int],
+            layout: dict,
+            atlases: dict,
+    ):
+        """
+        Save the compiled layout of a layout file and window.
+
+        Parameters
+        ----------
+        source : bytes
+            Content of the layout file.
+        window_size : tuple[integer, integer]
+            Width and height of the window.
+        layout : dict
+            Layout with the properties scaled to the window.
+        atlases : dict[tuple[string, integer, integer], dict]
+            States of the glyph atlases by (font, size, scale factor).
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.__directory is None:
+            return
+
+        arrays = {
+            "layout": np.array(json.dumps(layout)),
+            "atlases": np.array(json.dumps(list(atlases))),
+        }
+
+        for index, state in enumerate(atlases.values()):
+            for name, array in state.items():
+                arrays[f"{index}_{name}"] = array
+
+        path = self._path(source, window_size)
+        os.makedirs(self.__directory, exist_ok=True)
+
+        # Written to a temporary file so an interrupted run leaves no half file
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(temporary, path)
+
+###############################################################################
+
+
+###############################################################################
+#                                  Properties                                 #
+
+    @property  # noqa
+    def directory(self) -> str | None:
+        """
+        Return the directory of the compiled layouts.
+
+        Returns
+        -------
+        string or None
+            Directory, None if the cache is disabled.
+
+        """
+        return self.__directory
+
+###############################################################################
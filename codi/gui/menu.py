@@ -8,6 +8,7 @@ if __name__ == "__main__":
 
 from typing import Any, Optional
 
+from .events import GUIEvent, Toggled
 from .gui_manager import GUIManager
 from .circular_toggle import CircularToggle
 from .rectangular_toggle import RectangularToggle
@@ -48,7 +49,7 @@ class Menu(GUIManager):
         None.
 
         """
-        super().__init__(app)
+        super().__init__(app, app.gui.renderer)
 
         self._set_attributes(app, uuid, **kwargs)
 
@@ -161,7 +162,7 @@ class Menu(GUIManager):
 ###############################################################################
 #                                Public Methods                               #
 
-    def check_click(self, mouse_position: tuple[int, int]) -> str | None:  # noqa
+    def check_click(self, mouse_position: tuple[int, int]) -> GUIEvent | None:  # noqa
         """
         Check if a click has been on the button,
 
@@ -172,8 +173,9 @@ class Menu(GUIManager):
 
         Returns
         -------
-        string or None
-            UUID of the Element if clicked or None if not.
+        GUIEvent or None
+            Toggled event of the Menu if its button is clicked, event of the
+            Element of the Menu if clicked or None if not.
 
         """
         if self.is_locked or self.is_hidden:
@@ -184,7 +186,7 @@ class Menu(GUIManager):
                 self.unvisualize()
             else:
                 self.visualize()
-            return self.uuid
+            return Toggled(self.uuid, self.is_visible)
 
         if self.is_visible:
             click = super().check_click(mouse_position)
@@ -209,13 +211,10 @@ class Menu(GUIManager):
         None.
 
         """
-        if self.is_locked or self.is_hidden:
-            return None
-
+        # Hidden or locked button and Elements lose their hover state
         self.__menu_button.check_hover(mouse_position)
 
-        if self.is_visible:
-            super().check_hover(mouse_position)
+        super().check_hover(mouse_position)
 
     def destroy(self):
         """
@@ -270,10 +269,29 @@ class Menu(GUIManager):
         if self.is_hidden:
             return None
 
-        super().render()
+        super().render_elements()
 
         self.__menu_button.render()
 
+    def resize(self, kwargs: dict[str, Any]):
+        """
+        Set the position and size of the menu button and Elements.
+
+        Parameters
+        ----------
+        kwargs : dict[string, Any]
+            Keyword arguments of the menu in the layout, already autosized to
+            the new window size.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__menu_button.resize(kwargs["toggle_button"]["kwargs"])
+
+        super().resize(kwargs)
+
     def unhide(self):
         """
         Unhide menu button.
@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*- noqa
+
+if __name__ == "__main__":
+    raise SystemExit(
+        'You are executing a package-module file.' +
+        ' Execute a main instead and import the module.')
+
+
+import time
+
+import numpy as np
+
+from typing import Any
+
+from .element import Element
+from .gui_renderer import QUAD_STRIP_INDEXES
+from .text_label import TextLabel
+
+# Lines of the HUD: label and metric shown (formatted with the sampled values)
+HUD_LINES = (
+    "FPS: {fps:.0f} ({frame_time:.1f} ms)",
+    "Draw calls: {draw_calls}",
+    "Instances: {instances_drawn} ({instances_culled} culled)",
+    "Collision pairs: {collision_pairs}",
+    "GPU memory: {gpu_memory:.1f} MB",
+)
+
+
+class PerformanceHUD(Element):
+    """
+    Performance HUD Element.
+
+    Panel with the FPS, a graph of the last frame times and the metrics of the
+    application (draw calls, instances, collision pairs and GPU memory). It is
+    fed by a metrics registry (update) and only samples it, rebuilds its text
+    and redraws the GUI every refresh interval while it is visible.
+    """
+
+    __slots__ = (
+        "__background_color",
+        "__budget",
+        "__graph",
+        "__graph_color",
+        "__height",
+        "__labels",
+        "__refresh",
+        "__refreshed",
+        "__values",
+        "__vertexes",
+        "__width",
+        "__x",
+        "__y",
+    )
+
+###############################################################################
+#                             Overloaded Operators                            #
+
+    def __init__(self, app, uuid: str, **kwargs):
+        """
+        Initialize Performance HUD Element.
+
+        Parameters
+        ----------
+        app : TYPE
+            The GraphicsEngine instance.
+        uuid : string
+            Unique identifier for the HUD.
+        **kwargs : Optional[dict[str, Any]]
+            Dictionary containing the HUD layout, colors and text properties.
+
+        Returns
+        -------
+        None.
+
+        """
+        # Inicialize attributes
+        self._set_attributes(app, uuid, **kwargs)
+
+        # Create the geometry
+        self._set_vertexes()
+
+###############################################################################
+
+
+###############################################################################
+#                               Private Methods                               #
+
+    def _set_attributes(self, app, uuid: str, **kwargs):  # noqa
+        """
+        Set attributes only without the initialization logic.
+
+        Parameters
+        ----------
+        app : TYPE
+            The GraphicsEngine instance.
+        uuid : string
+            Unique identifier for the HUD.
+        **kwargs : Optional[dict[str, Any]]
+            Dictionary containing the HUD layout, colors and text properties.
+
+        Returns
+        -------
+        None.
+
+        """
+        super().__init__(app, uuid, **kwargs)
+
+        default_kwargs = {
+            "x": 0,
+            "y": 0,
+            "width": 1,
+            "height": 1,
+            "background_color": (0.1, 0.1, 0.1),
+            "graph_color": (0.53, 0.81, 0.98),
+            "budget": 1000 / 60,
+            "refresh": 0.25,
+            "text": {},
+        }
+
+        kwargs = default_kwargs | kwargs  # NOTE: Works for python 3.9+
+
+        if self.app.DEBUG:
+            print("Performance HUD")
+            print(kwargs)
+
+        # Position information
+        self.__x = kwargs["x"]
+        self.__y = kwargs["y"]
+        self.__width = kwargs["width"]
+        self.__height = kwargs["height"]
+
+        # Color information
+        self.__background_color = kwargs["background_color"]
+        self.__graph_color = kwargs["graph_color"]
+
+        # Frame time (ms) at half the height of the graph
+        self.__budget = kwargs["budget"]
+
+        # Seconds between samples of the metrics
+        self.__refresh = kwargs["refresh"]
+        self.__refreshed = None
+
+        # Last sampled metrics and frame times
+        self.__values = None
+        self.__graph = np.zeros((0, 2), dtype='f4')
+
+        # One label per line, left aligned in _set_labels
+        self.__labels = [
+            TextLabel(self.app, f"{self.uuid}_line_{index}", **kwargs["text"])
+            for index in range(len(HUD_LINES))
+        ]
+
+    def _set_graph(self, frame_times: np.ndarray):
+        """
+        Set the triangles of the bars of the frame time graph.
+
+        Parameters
+        ----------
+        frame_times : numpy array
+            Frame times in ms, from the oldest to the newest.
+
+        Returns
+        -------
+        None.
+
+        """
+        left, top, right, bottom = self.bounds
+        # Bottom third of the panel, twice the budget at the top
+        graph_top = bottom - self.__height / 3
+
+        count = len(frame_times)
+        bar_width = (right - left) / max(count, 1)
+        fill = np.minimum(frame_times / (2 * self.__budget), 1.0)
+
+        corners = np.empty((count, 4, 2), dtype='f8')
+        corners[:, 0::2, 0] = (left + np.arange(count) * bar_width)[:, None]
+        corners[:, 1::2, 0] = corners[:, 0::2, 0] + bar_width
+        corners[:, 0:2, 1] = bottom
+        corners[:, 2:4, 1] = (bottom - fill * (bottom - graph_top))[:, None]
+
+        # Window pixels to NDC
+        corners[:, :, 0] = 2 * corners[:, :, 0] / self.app.WIN_SIZE[0] - 1
+        corners[:, :, 1] = 1 - 2 * corners[:, :, 1] / self.app.WIN_SIZE[1]
+
+        self.__graph = corners[:, QUAD_STRIP_INDEXES].reshape(-1, 2).astype(
+            'f4')
+
+    def _set_labels(self):
+        """
+        Set the text of the lines with the last sampled metrics.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.__values is None:
+            return
+
+        left, top, _, bottom = self.bounds
+        # Top two thirds of the panel
+        line_height = (self.__height * 2 / 3) / len(HUD_LINES)
+        margin = line_height / 2
+
+        for index, (label, line) in enumerate(zip(self.__labels, HUD_LINES)):
+            label.place(
+                line.format(**self.__values),
+                left + margin,
+                top + (index + 0.5) * line_height,
+                anchor="left",
+            )
+
+    def _set_vertexes(self):
+        """
+        Set the vertexes of the background quad and the texts and graph.
+
+        Returns
+        -------
+        None.
+
+        """
+        left, top, right, bottom = self.bounds
+
+        gl_x = (
+            2 * left / self.app.WIN_SIZE[0] - 1,
+            2 * right / self.app.WIN_SIZE[0] - 1,
+        )
+
+        gl_y = (
+            1 - 2 * top / self.app.WIN_SIZE[1],
+            1 - 2 * bottom / self.app.WIN_SIZE[1],
+        )
+
+        self.__vertexes = np.array(
+            [
+                gl_x[0], gl_y[0], 0.0,
+                gl_x[1], gl_y[0], 0.0,
+                gl_x[0], gl_y[1], 0.0,
+                gl_x[1], gl_y[1], 0.0,
+            ],
+            dtype='f4'
+        )
+
+        if self.__values is not None:
+            self._set_labels()
+            self._set_graph(self.__values["frame_times"])
+
+###############################################################################
+
+
+###############################################################################
+#                                Public Methods                               #
+
+    def check_click(self, mouse_position: tuple[int, int]):  # noqa
+        """
+        Performance HUD can not be clicked, return None always.
+
+        Parameters
+        ----------
+        mouse_position : tuple[integer, integer]
+            Mouse position in x and y coordinates of the window.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def check_hover(self, mouse_position: tuple[int, int]):
+        """
+        Performance HUD has no hover state, return None always.
+
+        Parameters
+        ----------
+        mouse_position : tuple[integer, integer]
+            Mouse position in x and y coordinates of the window.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def check_motion(self, mouse_position: tuple[int, int]):
+        """
+        Performance HUD can not be moved on, return None always.
+
+        Parameters
+        ----------
+        mouse_position : tuple[integer, integer]
+            Mouse position in x and y coordinates of the window.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def check_unclick(self, mouse_position: tuple[int, int]):
+        """
+        Performance HUD can not be unclicked, return None always.
+
+        Parameters
+        ----------
+        mouse_position : tuple[integer, integer]
+            Mouse position in x and y coordinates of the window.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def destroy(self):
+        """
+        Performance HUD owns no OpenGL object, return None always.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def render(self):
+        """
+        Render the panel, the frame time graph and the metrics.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.is_hidden:
+            return None
+
+        renderer = self.app.gui.renderer
+
+        renderer.add_quad(self.__vertexes, self.__background_color)
+
+        if self.__values is None:
+            return None
+
+        renderer.add_triangles(self.__graph, self.__graph_color)
+
+        for label in self.__labels:
+            label.render()
+
+    def resize(self, kwargs: dict[str, Any]):
+        """
+        Set the position and size of the HUD after a window resize.
+
+        Parameters
+        ----------
+        kwargs : dict[string, Any]
+            Keyword arguments of the HUD in the layout, already autosized to
+            the new window size.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__x = kwargs.get("x", self.__x)
+        self.__y = kwargs.get("y", self.__y)
+        self.__width = kwargs.get("width", self.__width)
+        self.__height = kwargs.get("height", self.__height)
+
+        self._set_vertexes()
+
+        self._layout_changed()
+
+    def toggle(self):
+        """
+        Performance HUD has no toggle position, return None always.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def unhide(self):
+        """
+        Un-hide the HUD, sampling the metrics on the next update.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__refreshed = None
+
+        super().unhide()
+
+    def untoggle(self):
+        """
+        Performance HUD has no toggle position, return None always.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def update(self, metrics):
+        """
+        Sample the metrics registry if the refresh interval has passed.
+
+        Called every frame. While the HUD is hidden (or between refreshes) it
+        does not touch the metrics nor redraw the GUI.
+
+        Parameters
+        ----------
+        metrics : Metrics
+            Metrics registry of the application, with the frame times and the
+            sources of the values of the HUD lines.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.is_hidden:
+            return None
+
+        now = time.perf_counter()
+
+        if (
+            self.__refreshed is not None
+            and now - self.__refreshed < self.__refresh
+        ):
+            return None
+
+        self.__refreshed = now
+
+        frame_times = metrics.history()
+
+        self.__values = metrics.sample() | {
+            "fps": metrics.fps(),
+            "frame_time": float(frame_times[-1]) if len(frame_times) else 0.0,
+            "frame_times": frame_times,
+        }
+
+        self._set_labels()
+        self._set_graph(frame_times)
+
+        self.mark_dirty()
+
+###############################################################################
+
+
+###############################################################################
+#                                  Properties                                 #
+
+    @property  # noqa
+    def bounds(self) -> tuple[float, float, float, float]:
+        """
+        Return the bounding box of the HUD.
+
+        The width is autosized to the smallest window dimension, so on narrow
+        windows the HUD is moved left (and narrowed if needed) to keep its
+        right edge inside the window.
+
+        Returns
+        -------
+        tuple[float, float, float, float]
+            Left, top, right and bottom in window pixels.
+
+        """
+        width = min(self.__width, self.app.WIN_SIZE[0])
+        right = min(self.__x + width / 2, self.app.WIN_SIZE[0])
+
+        return (
+            right - width,
+            self.__y - self.__height / 2,
+            right,
+            self.__y + self.__height / 2,
+        )
+
+    @property
+    def is_hovered(self) -> bool:
+        """
+        Performance HUD has no hover state.
+
+        Returns
+        -------
+        bool
+            Is hovered, always False.
+
+        """
+        return False
+
+    @property
+    def values(self) -> dict[str, Any] | None:
+        """
+        Return the last sampled metrics.
+
+        Returns
+        -------
+        dict[string, Any] or None
+            Metrics by name, None if the HUD has not been updated yet.
+
+        """
+        return self.__values
+
+###############################################################################
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*- noqa
+
+if __name__ == "__main__":
+    raise SystemExit(
+        'You are executing a package-module file.' +
+        ' Execute a main instead and import the module.')
+
+
+import numpy as np
+
+from typing import Any
+
+from .element import Element
+
+
+class ProgressBar(Element):
+    """Progress Bar Element."""
+
+    __slots__ = (
+        "__bar_color",
+        "__height",
+        "__progress",
+        "__track_color",
+        "__vertexes",
+        "__width",
+        "__x",
+        "__y",
+    )
+
+###############################################################################
+#                             Overloaded Operators                            #
+
+    def __init__(self, app, uuid: str, **kwargs):
+        """
+        Initialize Progress Bar Element.
+
+        Parameters
+        ----------
+        app : TYPE
+            The GraphicsEngine instance.
+        uuid : string
+            Unique identifier for the progress bar.
+        **kwargs : Optional[dict[str, Any]]
+            Dictionary containing the progress bar layout and colors.
+
+        Returns
+        -------
+        None.
+
+        """
+        # Inicialize attributes
+        self._set_attributes(app, uuid, **kwargs)
+
+        # Create the geometry
+        self._set_vertexes()
+
+###############################################################################
+
+
+###############################################################################
+#                               Private Methods                               #
+
+    def _set_attributes(self, app, uuid: str, **kwargs):  # noqa
+        """
+        Set attributes only without the initialization logic.
+
+        Parameters
+        ----------
+        app : TYPE
+            The GraphicsEngine instance.
+        uuid : string
+            Unique identifier for the progress bar.
+        **kwargs : Optional[dict[str, Any]]
+            Dictionary containing the progress bar layout and colors.
+
+        Returns
+        -------
+        None.
+
+        """
+        super().__init__(app, uuid, **kwargs)
+
+        default_kwargs = {
+            "x": 0,
+            "y": 0,
+            "width": 1,
+            "height": 1,
+            "progress": 0.0,
+            "track_color": (0.5, 0.5, 0.5),
+            "bar_color": (1.0, 1.0, 1.0),
+        }
+
+        kwargs = default_kwargs | kwargs  # NOTE: Works for python 3.9+
+
+        if self.app.DEBUG:
+            print("Progress Bar")
+            print(kwargs)
+
+        # Position information
+        self.__x = kwargs["x"]
+        self.__y = kwargs["y"]
+        self.__width = kwargs["width"]
+        self.__height = kwargs["height"]
+
+        # Progress information
+        self.__progress = kwargs["progress"]
+
+        # Color information
+        self.__track_color = kwargs["track_color"]
+        self.__bar_color = kwargs["bar_color"]
+
+    def _set_vertexes(self):
+        """
+        Set the vertexes of the track quad.
+
+        Returns
+        -------
+        None.
+
+        """
+        gl_x = (
+            2 * ((self.__x - (self.__width / 2) -
+                 (self.app.WIN_SIZE[0] / 2)) / (self.app.WIN_SIZE[0])),
+            2 * ((self.__x + (self.__width / 2) -
+                 (self.app.WIN_SIZE[0] / 2)) / (self.app.WIN_SIZE[0]))
+        )
+
+        gl_y = (
+            -2 * ((self.__y - (self.__height / 2) -
+                  (self.app.WIN_SIZE[1] / 2)) / (self.app.WIN_SIZE[1])),
+            -2 * ((self.__y + (self.__height / 2) -
+                  (self.app.WIN_SIZE[1] / 2)) / (self.app.WIN_SIZE[1]))
+        )
+
+        self.__vertexes = np.array(
+            [
+                gl_x[0], gl_y[0], 0.0,
+                gl_x[1], gl_y[0], 0.0,
+                gl_x[0], gl_y[1], 0.0,
+                gl_x[1], gl_y[1], 0.0,
+            ],
+            dtype='f4'
+        )
+
+###############################################################################
+
+
+###############################################################################
+#                                Public Methods                               #
+
+    def check_click(self, mouse_position: tuple[int, int]):  # noqa
+        """
+        Progress bar can not be clicked, return None always.
+
+        Parameters
+        ----------
+        mouse_position : tuple[integer, integer]
+            Mouse position in x and y coordinates of the window.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def check_hover(self, mouse_position: tuple[int, int]):
+        """
+        Progress bar has no hover state, return None always.
+
+        Parameters
+        ----------
+        mouse_position : tuple[integer, integer]
+            Mouse position in x and y coordinates of the window.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def check_motion(self, mouse_position: tuple[int, int]):
+        """
+        Progress bar can not be moved on, return None always.
+
+        Parameters
+        ----------
+        mouse_position : tuple[integer, integer]
+            Mouse position in x and y coordinates of the window.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def check_unclick(self, mouse_position: tuple[int, int]):
+        """
+        Progress bar can not be unclicked, return None always.
+
+        Parameters
+        ----------
+        mouse_position : tuple[integer, integer]
+            Mouse position in x and y coordinates of the window.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def destroy(self):
+        """
+        Progress bar owns no OpenGL object, return None always.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def render(self):
+        """
+        Render the track and the filled part of the bar.
+
+        Returns
+        -------
+        None.
+
+        """
+        if self.is_hidden:
+            return None
+
+        renderer = self.app.gui.renderer
+
+        # Render track
+        renderer.add_quad(self.__vertexes, self.__track_color)
+
+        # Render filled part: the track with the right edge moved towards the
+        # left edge
+        filled = self.__vertexes.reshape(4, 3).copy()
+        left = filled[0, 0]
+        filled[1::2, 0] = left + (filled[1::2, 0] - left) * self.__progress
+        renderer.add_quad(filled, self.__bar_color)
+
+    def resize(self, kwargs: dict[str, Any]):
+        """
+        Set the position and size of the progress bar after a window resize.
+
+        Parameters
+        ----------
+        kwargs : dict[string, Any]
+            Keyword arguments of the progress bar in the layout, already
+            autosized to the new window size.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__x = kwargs.get("x", self.__x)
+        self.__y = kwargs.get("y", self.__y)
+        self.__width = kwargs.get("width", self.__width)
+        self.__height = kwargs.get("height", self.__height)
+
+        self._set_vertexes()
+
+        self._layout_changed()
+
+    def toggle(self):
+        """
+        Progress bar has no toggle position, return None always.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+    def untoggle(self):
+        """
+        Progress bar has no toggle position, return None always.
+
+        Returns
+        -------
+        None.
+
+        """
+        return None
+
+###############################################################################
+
+
+###############################################################################
+#                                  Properties                                 #
+
+    @property  # noqa
+    def bounds(self) -> tuple[float, float, float, float]:
+        """
+        Return the bounding box of the progress bar used for hit-testing.
+
+        Returns
+        -------
+        tuple[float, float, float, float]
+            Left, top, right and bottom in window pixels.
+
+        """
+        return (
+            self.__x - self.__width / 2,
+            self.__y - self.__height / 2,
+            self.__x + self.__width / 2,
+            self.__y + self.__height / 2,
+        )
+
+    @property
+    def is_hovered(self) -> bool:
+        """
+        Progress bar has no hover state.
+
+        Returns
+        -------
+        bool
+            Is hovered, always False.
+
+        """
+        return False
+
+    @property
+    def progress(self) -> float:
+        """
+        Fraction of the bar that is filled.
+
+        Returns
+        -------
+        float
+            Progress from 0 to 1.
+
+        """
+        return self.__progress
+
+    @progress.setter
+    def progress(self, new_progress: float):
+        new_progress = min(max(float(new_progress), 0.0), 1.0)
+
+        if new_progress != self.__progress:
+            self.__progress = new_progress
+            self.mark_dirty()
+
+###############################################################################
@@ -32,11 +32,8 @@ class RectangularButton(Button):
         super()._set_attributes(app, uuid, **kwargs)
         self._set_attributes(app, uuid, **kwargs)
 
-        # Write the shader
-        super()._set_shader_programs()
-
-        # Create all ModernGL objects
-        super()._set_vao()
+        # Create the geometry
+        self._set_vertexes()
 
 ###############################################################################
 
@@ -51,6 +48,22 @@ class RectangularButton(Button):
             self.y - self.height / 2 <= pos_y <= self.y + self.height / 2
         )
 
+    def _render_shape(self, renderer):
+        """
+        Add the rectangle to the GUI batch.
+
+        Parameters
+        ----------
+        renderer : GUIRenderer
+            Batched renderer of the GUI.
+
+        Returns
+        -------
+        None.
+
+        """
+        renderer.add_quad(self.__vertexes, self.color)
+
     def _set_attributes(self, app, uuid, **kwargs):
         default_kwargs = {
             "width": 1,
@@ -126,6 +139,24 @@ class RectangularButton(Button):
 
 
     @property  # noqa
+    def bounds(self) -> tuple[float, float, float, float]:
+        """
+        Return the bounding box of the button used for hit-testing.
+
+        Returns
+        -------
+        tuple[float, float, float, float]
+            Left, top, right and bottom in window pixels.
+
+        """
+        return (
+            self.x - self.__width / 2,
+            self.y - self.__height / 2,
+            self.x + self.__width / 2,
+            self.y + self.__height / 2,
+        )
+
+    @property
     def height(self) -> int:
         return self.__height
 
@@ -133,7 +164,9 @@ class RectangularButton(Button):
     def height(self, new_height: int):
         self.__height = new_height
 
-        self._set_vao()
+        self._set_vertexes()
+
+        self._layout_changed()
 
     @property
     def width(self) -> int:
@@ -143,7 +176,9 @@ class RectangularButton(Button):
     def width(self, new_width: int):
         self.__width = new_width
 
-        self._set_vao()
+        self._set_vertexes()
+
+        self._layout_changed()
 
     @property
     def vertexes(self):
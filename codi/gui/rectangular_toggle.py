@@ -11,6 +11,7 @@ if __name__ == "__main__":
         ' Execute a main instead and import the module.')
 
 
+from .events import Toggled
 from .rectangular_button import RectangularButton
 
 
@@ -67,7 +68,7 @@ class RectangularToggle(RectangularButton):
 ###############################################################################
 #                                Public Methods                               #
 
-    def check_click(self, mouse_pos: tuple[int, int]) -> bool:
+    def check_click(self, mouse_pos: tuple[int, int]) -> Toggled | None:
         click = super().check_click(mouse_pos)
 
         if click:
@@ -76,7 +77,9 @@ class RectangularToggle(RectangularButton):
             else:
                 self.toggle()
 
-        return click
+            return Toggled(self.uuid, self.is_toggled)
+
+        return None
 
     def render(self):
         if self.is_hidden:
@@ -91,9 +94,11 @@ class RectangularToggle(RectangularButton):
 
     def toggle(self):
         self.__is_toggled = True
+        self.mark_dirty()
 
     def untoggle(self):
         self.__is_toggled = False
+        self.mark_dirty()
 
 ###############################################################################
 
@@ -6,10 +6,13 @@ if __name__ == "__main__":
         ' Execute a main instead and import the module.')
 
 
-import moderngl as mgl
 import numpy as np
 
+from math import ceil
+from typing import Any
+
 from .element import Element
+from .events import Released, SliderChanged
 
 
 class Slider(Element):
@@ -18,17 +21,12 @@ class Slider(Element):
         "__height",
         "__handle_color",
         "__handle_values",
-        "__handle_vao",
-        "__handle_vbo",
         "__handle_vertices",
         "__is_dragging",
         "__min_value",
         "__max_value",
-        "__shader_programs",
         "__slices",
         "__track_color",
-        "__track_vao",
-        "__track_vbo",
         "__track_vertices",
         "__width",
         "__x",
@@ -76,11 +74,9 @@ class Slider(Element):
         self.track_vao = self.__create_track_vao()
         self.handle_vao = self.__create_handle_vao()"""
         self._set_attributes(app, uuid, **kwargs)
-        # Write the shader
-        self._set_shader_programs()
-        # Create all ModernGL objects
-        self._set_track_vao()
-        self._set_handle_vao()
+        # Create the geometry
+        self._set_track_vertices()
+        self._set_handle_vertices()
 
     def _containing(self, mx, my):
         handle_x = self._value_to_position()
@@ -140,55 +136,6 @@ class Slider(Element):
         self.__track_color = kwargs["track_color"]
         self.__handle_color = kwargs["handle_color"]
 
-    def _set_shader_programs(self):
-        """
-        Set the shader program.
-
-        Returns
-        -------
-        None.
-
-        """
-        self.__shader_programs = self.app.ctx.program(
-            vertex_shader='''
-            #version 330
-            layout (location = 0) in vec3 in_vert;
-            void main() {
-                gl_Position = vec4(in_vert, 1.0);
-            }
-            ''',
-            fragment_shader='''
-            #version 330
-            uniform vec3 in_color;
-            out vec4 frag_color;
-            void main() {
-                frag_color = vec4(in_color, 1.0);
-            }
-            '''
-        )
-
-        if self.app.DEBUG:
-            print("Shader program compiled and linked successfully.")
-
-    def _set_track_vao(self):
-        self._set_track_vbo()
-        self.__track_vao = self.app.ctx.vertex_array(
-            self.__shader_programs, [(self.__track_vbo, '3f', 'in_vert')])
-
-    def _set_handle_vao(self):
-        self._set_handle_vbo()
-        self.__handle_vao = self.app.ctx.vertex_array(
-            self.__shader_programs, [(self.__handle_vbo, '3f', 'in_vert')])
-
-    def _set_track_vbo(self):
-        self._set_track_vertices()
-        self.__track_vbo = self.app.ctx.buffer(self.__track_vertices.tobytes())
-
-    def _set_handle_vbo(self):
-        self._set_handle_vertices()
-        self.__handle_vbo = self.app.ctx.buffer(
-            self.__handle_vertices.tobytes())
-
     def _set_track_vertices(self):
         gl_x = (
             2 * ((self.__x - (self.__width / 2) -
@@ -215,7 +162,18 @@ class Slider(Element):
         )
 
     def _set_handle_vertices(self):
-        handle_x = self._value_to_position()
+        """
+        Set the handle quads of all the slices.
+
+        The quad of the first slice is moved to each slice position once, so
+        dragging the handle only changes the slice that is drawn.
+
+        Returns
+        -------
+        None.
+
+        """
+        handle_x = self.__x - self.__width / 2
         gl_x = (
             2*((handle_x - self.__width / self.__slices) -
                self.app.WIN_SIZE[0] / 2) / (self.app.WIN_SIZE[0]),
@@ -230,7 +188,7 @@ class Slider(Element):
                 self.app.WIN_SIZE[1] / 2) / (self.app.WIN_SIZE[1])
         )
 
-        self.__handle_vertices = np.array(
+        handle = np.array(
             [
                 gl_x[0], gl_y[0], 0.0,
                 gl_x[1], gl_y[0], 0.0,
@@ -240,6 +198,15 @@ class Slider(Element):
             dtype='f4'
         )
 
+        # NDC distance from the first slice to each slice
+        offsets = np.zeros((self.__slices, 12), dtype='f4')
+        offsets[:, 0::3] = (
+            2 * np.arange(self.__slices) * self.__width /
+            (self.__slices - 1) / self.app.WIN_SIZE[0]
+        )[:, None]
+
+        self.__handle_vertices = handle + offsets
+
     def _value_to_position(self):
         """
         Map a slider value to a screen position.
@@ -249,6 +216,27 @@ class Slider(Element):
     def check_hover(self, mouse_position: tuple[int, int]):
         pass
 
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """
+        Return the bounding box of the slider used for hit-testing.
+
+        The handle can be grabbed half the slider width around its position,
+        anywhere along the track.
+
+        Returns
+        -------
+        tuple[float, float, float, float]
+            Left, top, right and bottom in window pixels.
+
+        """
+        return (
+            self.__x - self.__width,
+            self.__y - self.__height / 2,
+            self.__x + self.__width,
+            self.__y + self.__height / 2,
+        )
+
     def is_hovered(self):
         pass
 
@@ -265,19 +253,14 @@ class Slider(Element):
         if self.is_hidden:
             return None
         # Render track
-        self.__shader_programs['in_color'].value = self.__track_color
-        self.__track_vao.render(mgl.TRIANGLE_STRIP)
+        self.app.gui.renderer.add_quad(self.__track_vertices, self.__track_color)
 
         # Render handle
-        self.__shader_programs['in_color'].value = self.__handle_color
-        self.__handle_vao.render(mgl.TRIANGLE_STRIP)
+        self.app.gui.renderer.add_quad(
+            self.__handle_vertices[self.__current_slice], self.__handle_color)
 
     def destroy(self) -> None:
-        self.__handle_vao.release()
-
-        self.__track_vao.release()
-
-        self.__shader_programs.release()
+        return None
 
     def check_click(self, mouse_position):
         """
@@ -289,35 +272,64 @@ class Slider(Element):
         if self._containing(mx, my):
             self.__is_dragging = True
 
-    def check_motion(self, mouse_position: tuple[int, int]):
+    def check_motion(self, mouse_position: tuple[int, int]) -> SliderChanged | None:
         if self.is_locked or self.is_hidden:
             return None
         mx, my = mouse_position
 
         if self._containing(mx, my):
             if self.__is_dragging:
-                value = self.update_value(mx)
-                return self.uuid + ":" + str(value)
+                return SliderChanged(self.uuid, self.update_value(mx))
 
         return None
 
-    def check_unclick(self, mouse_position):
+    def check_unclick(self, mouse_position) -> Released | None:
         if self.is_locked or self.is_hidden:
             return None
 
         self.__is_dragging = False
-        return self.uuid
+        return Released(self.uuid)
+
+    def resize(self, kwargs: dict[str, Any]):
+        """
+        Set the position and size of the slider after a window resize.
+
+        The current slice is kept.
+
+        Parameters
+        ----------
+        kwargs : dict[string, Any]
+            Keyword arguments of the slider in the layout, already autosized
+            to the new window size.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__x = kwargs.get("x", self.__x)
+        self.__y = kwargs.get("y", self.__y)
+        self.__width = kwargs.get("width", self.__width)
+        self.__height = kwargs.get("height", self.__height)
+
+        self._set_track_vertices()
+        self._set_handle_vertices()
+
+        self._layout_changed()
 
     def update_value(self, mouse_x):
         """
         Update the slider value based on mouse x position.
         """
-        new_value = self.__min_value + \
-            (mouse_x - (self.__x - self.__width / 2)) / \
-            self.__width * (self.__max_value - self.__min_value)
-        self.__current_slice = min(range(len(self.__handle_values)), key=lambda i: abs(
-            self.__handle_values[i] - new_value))
-        self._set_handle_vao()
+        # Slices are evenly spaced: the nearest one is the rounded fraction
+        # of the track (the lower one when halfway, as a nearest search)
+        position = (mouse_x - (self.__x - self.__width / 2)) / \
+            self.__width * (self.__slices - 1)
+        current_slice = min(max(ceil(position - 0.5), 0), self.__slices - 1)
+
+        if current_slice != self.__current_slice:
+            self.__current_slice = current_slice
+            self.mark_dirty()
 
         return self.__handle_values[self.__current_slice]
 
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*- noqa
+
+if __name__ == "__main__":
+    raise SystemExit(
+        'You are executing a package-module file.' +
+        ' Execute a main instead and import the module.')
+
+
+from math import floor
+
+# Side in pixels of the square cells of the grid
+GRID_CELL_SIZE = 64
+
+
+class SpatialGrid:
+    """
+    Screen-space grid of the bounding boxes of the GUI Elements.
+
+    Each cell keeps the Elements whose bounding box overlaps it, so a hit test
+    only checks the Elements of the cell under the mouse. Elements without a
+    bounding box (they can react anywhere, like Menus) are candidates of every
+    cell. Candidates are returned in order of addition to the GUI.
+    """
+
+    __slots__ = (
+        "__anywhere",
+        "__cell_size",
+        "__cells",
+    )
+
+###############################################################################
+#                             Overloaded Operators                            #
+
+    def __init__(self, cell_size: int = GRID_CELL_SIZE):
+        """
+        Initialize Spatial Grid.
+
+        Parameters
+        ----------
+        cell_size : integer, optional
+            Side in pixels of the cells. The default is GRID_CELL_SIZE.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__cell_size = cell_size
+
+        # (column, row): [(order, Element), ...]
+        self.__cells: dict[tuple[int, int], list] = {}
+
+        # [(order, Element), ...] of the Elements without bounding box
+        self.__anywhere: list = []
+
+###############################################################################
+
+
+###############################################################################
+#                                Public Methods                               #
+
+    def build(self, elements: list):
+        """
+        Rebuild the grid with the bounding boxes of the Elements.
+
+        Parameters
+        ----------
+        elements : list[Element]
+            Elements in order of addition. Each one gives its bounding box
+            (left, top, right, bottom) in window pixels, or None if it must
+            always be checked.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.__cells.clear()
+        self.__anywhere = []
+
+        for order, element in enumerate(elements):
+            bounds = element.bounds
+
+            if bounds is None:
+                self.__anywhere.append((order, element))
+                continue
+
+            left, top, right, bottom = bounds
+
+            for column in range(
+                    floor(left / self.__cell_size),
+                    floor(right / self.__cell_size) + 1
+            ):
+                for row in range(
+                        floor(top / self.__cell_size),
+                        floor(bottom / self.__cell_size) + 1
+                ):
+                    self.__cells.setdefault(
+                        (column, row), []).append((order, element))
+
+    def query(self, position: tuple[int, int]) -> list:
+        """
+        Return the Elements that can contain a position.
+
+        Parameters
+        ----------
+        position : tuple[integer, integer]
+            Tuple with the (x, y) coordinate in the window.
+
+        Returns
+        -------
+        list[Element]
+            Candidate Elements in order of addition.
+
+        """
+        cell = self.__cells.get(
+            (
+                floor(position[0] / self.__cell_size),
+                floor(position[1] / self.__cell_size),
+            ),
+            [],
+        )
+
+        if not self.__anywhere:
+            return [element for _, element in cell]
+
+        return [element for _, element in sorted(
+            cell + self.__anywhere, key=lambda entry: entry[0])]
+
+###############################################################################
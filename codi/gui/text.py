@@ -11,10 +11,10 @@ if __name__ == "__main__":
         ' Execute a main instead and import the module.')
 
 
-import moderngl as mgl
 import numpy as np
 
 from .element import Element
+from .events import Clicked, MovedOver, Released
 from .empty import Empty
 from .text_label import TextLabel
 
@@ -23,12 +23,10 @@ class Text(Element):
 
     __slots__ = (
         "__background_color",
+        "__color",
         "__height",
         "__is_hovered",
-        "__shader_programs",
         "__text",
-        "__vao",
-        "__vbo",
         "__vertexes",
         "__width",
         "__x",
@@ -42,11 +40,8 @@ class Text(Element):
         # Inicialize attributes
         self._set_attributes(app, uuid, **kwargs)
 
-        # Write the shader
-        self._set_shader_programs()
-
-        # Create all ModernGL objects
-        self._set_vao()
+        # Create the geometry
+        self._set_vertexes()
 
 ###############################################################################
 
@@ -72,8 +67,8 @@ class Text(Element):
         )
 
     def _render(self):
-        # Render backgound (draw quad as two triangles)
-        self.__vao.render(mgl.TRIANGLE_STRIP)
+        # Render backgound (add the quad to the GUI batch)
+        self.app.gui.renderer.add_quad(self.__vertexes, self.__color)
 
         # Render text
         self.__text.render()
@@ -104,6 +99,7 @@ class Text(Element):
 
         # Color information
         self.__background_color = kwargs["background_color"]
+        self.__color = kwargs["background_color"]
 
         # States information
         self.__is_hovered = False
@@ -131,48 +127,6 @@ class Text(Element):
             **kwargs['text'],
         )
 
-    def _set_shader_programs(self):
-        self.__shader_programs = self.app.ctx.program(
-            vertex_shader='''
-            #version 330
-
-            layout (location = 0) in vec3 in_vert;
-
-            uniform vec3 in_colour;
-
-            out vec3 frag_color;
-
-            void main() {
-                frag_color = in_colour;
-                gl_Position = vec4(in_vert, 1.0);
-            }
-            ''',
-            fragment_shader='''
-            #version 330
-
-            in vec3 frag_color;
-
-            out vec4 f_color;
-
-            void main() {
-                f_color = vec4(frag_color, 1.0);
-            }
-            '''
-        )
-
-    def _set_vao(self):
-
-        self._set_vbo()
-
-        self.__vao = self.app.ctx.vertex_array(
-            self.__shader_programs, [(self.__vbo, '3f', 'in_vert')])
-
-    def _set_vbo(self):
-
-        self._set_vertexes()
-
-        self.__vbo = self.app.ctx.buffer(self.vertexes.tobytes())
-
     def _set_vertexes(self):
 
         # Vertex data (rectangle for the button)
@@ -230,7 +184,7 @@ class Text(Element):
 ###############################################################################
 #                                Public Methods                               #
 
-    def check_click(self, mouse_position: tuple[int, int]) -> str | None:  # noqa
+    def check_click(self, mouse_position: tuple[int, int]) -> Clicked | None:  # noqa
         """
         Check if a click has been on the button,
 
@@ -241,8 +195,8 @@ class Text(Element):
 
         Returns
         -------
-        string or None
-            UUID of the Element if clicked or None if not.
+        Clicked or None
+            Event of the Element if clicked or None if not.
 
         """
         # Cannot be clicked if is locked
@@ -252,9 +206,9 @@ class Text(Element):
         # Get mouse coordinates
         mx, my = mouse_position
 
-        # Return UUID if button is clicked
+        # Return event if button is clicked
         if self._containing(mx, my):
-            return self.uuid
+            return Clicked(self.uuid)
 
         return None
 
@@ -272,17 +226,20 @@ class Text(Element):
         None.
 
         """
-        # Cannot be hovered if is locked
-        if self.is_locked or self.is_hidden:
-            return None
-
         # Get mouse coordinates
         mx, my = mouse_position
 
-        # Update hover state
-        self.__is_hovered = self._containing(mx, my)
+        # Update hover state, lost if is locked or hidden
+        is_hovered = (
+            not (self.is_locked or self.is_hidden)
+            and self._containing(mx, my)
+        )
+
+        if is_hovered != self.__is_hovered:
+            self.__is_hovered = is_hovered
+            self.mark_dirty()
 
-    def check_motion(self, mouse_position: tuple[int, int]) -> str | None:
+    def check_motion(self, mouse_position: tuple[int, int]) -> MovedOver | None:
         """
         Check if when moving the mouse is inside the button when moved.
 
@@ -298,8 +255,8 @@ class Text(Element):
 
         Returns
         -------
-        string or None
-            UUID of the Element if moved on or None if not.
+        MovedOver or None
+            Event of the Element if moved on or None if not.
 
         """
         # Cannot be moved on if is locked
@@ -309,13 +266,13 @@ class Text(Element):
         # Get mouse coordinates
         mx, my = mouse_position
 
-        # Return UUID if button is unclicked
+        # Return event if button is unclicked
         if self._containing(mx, my):
-            return self.uuid
+            return MovedOver(self.uuid)
 
         return None
 
-    def check_unclick(self, mouse_position: tuple[int, int]) -> str | None:
+    def check_unclick(self, mouse_position: tuple[int, int]) -> Released | None:
         """
         Check if it has been unclicked on the Element.
 
@@ -326,8 +283,8 @@ class Text(Element):
 
         Returns
         -------
-        string or None
-            UUID of the Element if clicked or None if not.
+        Released or None
+            Event of the Element if clicked or None if not.
 
         """
         # Cannot be unclicked if is locked
@@ -337,9 +294,9 @@ class Text(Element):
         # Get mouse coordinates
         mx, my = mouse_position
 
-        # Return UUID if button is unclicked
+        # Return event if button is unclicked
         if self._containing(mx, my):
-            return self.uuid
+            return Released(self.uuid)
 
         return None
 
@@ -352,11 +309,7 @@ class Text(Element):
         None.
 
         """
-        self.__vbo.release()
-
-        self.__vao.release()
-
-        self.__shader_programs.release()
+        self.__text.destroy()
 
     def render(self) -> None:
         """
@@ -409,15 +362,36 @@ class Text(Element):
 
     @background_color.setter
     def background_color(self, new_background_color: tuple[float, float, float]):
-        self.__default_color = new_background_color
+        self.__background_color = new_background_color
+        self.mark_dirty()
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        """
+        Return the bounding box of the text used for hit-testing.
+
+        Returns
+        -------
+        tuple[float, float, float, float]
+            Left, top, right and bottom in window pixels.
+
+        """
+        return (
+            self.x - self.width / 2,
+            self.y - self.height / 2,
+            self.x + self.width / 2,
+            self.y + self.height / 2,
+        )
 
     @property
     def color(self):
-        return self.__shader_programs['in_colour'].value
+        return self.__color
 
     @color.setter
     def color(self, new_color):
-        self.__shader_programs['in_colour'].value = new_color
+        if new_color != self.__color:
+            self.__color = new_color
+            self.mark_dirty()
 
     @property
     def font(self) -> str:
@@ -443,7 +417,9 @@ class Text(Element):
     def height(self, new_height: int):
         self.__height = new_height
 
-        self._set_vao()
+        self._set_vertexes()
+
+        self._layout_changed()
 
     @property
     def is_hovered(self) -> bool:
@@ -457,6 +433,14 @@ class Text(Element):
     def scale_factor(self, new_scale_factor: int):
         self.__text.scale_factor = new_scale_factor
 
+    @property
+    def text(self) -> str:
+        return self.__text.text
+
+    @text.setter
+    def text(self, new_text: str):
+        self.__text.text = new_text
+
     @property
     def text_color(self) -> tuple[float, float, float]:
         return self.__text.text_color
@@ -477,7 +461,9 @@ class Text(Element):
     def width(self, new_width: int):
         self.__width = new_width
 
-        self._set_vao()
+        self._set_vertexes()
+
+        self._layout_changed()
 
     @property
     def x(self) -> int:
@@ -489,7 +475,9 @@ class Text(Element):
 
         self.__text.x = new_x
 
-        self._set_vao()
+        self._set_vertexes()
+
+        self._layout_changed()
 
     @property
     def y(self) -> int:
@@ -501,6 +489,8 @@ class Text(Element):
 
         self.__text.y = new_y
 
-        self._set_vao()
+        self._set_vertexes()
+
+        self._layout_changed()
 
 ###############################################################################
@@ -11,27 +11,21 @@ if __name__ == "__main__":
         ' Execute a main instead and import the module.')
 
 
-import moderngl
-import numpy as np
-import pygame as pg
+from .element import Element
 
 
 class TextLabel():
 
     __slots__ = (
         "__app",
+        "__atlas",
         "__color",
-        "__font",
         "__font_size",
         "__height",
         "__scale_factor",
-        "__shader_programs",
         "__sys_font",
         "__text",
-        "__texture",
         "__uuid",
-        "__vao",
-        "__vbo",
         "__vertexes",
         "__width",
         "__x",
@@ -75,11 +69,11 @@ class TextLabel():
         self.__x = kwargs['x']
         self.__y = kwargs['y']
 
-        # Write the shader
-        self._set_shader_programs()
+        # Glyph atlas of the font
+        self._set_font()
 
-        # Create all ModernGL objects
-        self._set_vao()
+        # Create the geometry
+        self._set_vertexes()
 
 ###############################################################################
 
@@ -89,192 +83,60 @@ class TextLabel():
 
 
     def _set_font(self):  # noqa
-        # Load Pygame font object from system font
-        self.__font = pg.font.SysFont(
-            self.__sys_font,
-            self.__font_size * self.__scale_factor,
-        )
-
-    def _set_shader_programs(self) -> moderngl.Program:
         """
-        Generate the shader program that will render this object.
+        Set the glyph atlas of the font, shared by the GUI.
 
         Returns
         -------
-        program : moderngl Program
-            Shader Program.
+        None.
 
         """
-        self.__shader_programs = self.app.ctx.program(
-            vertex_shader='''
-            #version 330
-
-            in vec2 in_position;
-            in vec2 in_texcoord;
-
-            out vec2 v_texcoord;
-
-            void main() {
-                v_texcoord = in_texcoord;
-                gl_Position = vec4(in_position, 0.0, 1.0);
-            }
-            ''',
-            fragment_shader='''
-            #version 330
-
-            in vec2 v_texcoord;
-
-            uniform sampler2D text_texture;
-
-            out vec4 frag_color;
-
-            void main() {
-                vec4 tex_color = texture(text_texture, v_texcoord);
-                if (tex_color.a < 0.1) {
-                   discard; // Discard transparent pixels
-                }
-
-                frag_color = tex_color;
-            }
-            '''
-        )
-
-        if self.app.DEBUG:
-            print("Shader program compiled and linked successfully.")
-
-    def _set_text_texture(self):
-        # Set font
-        self._set_font()
-
-        # Render Pygame text
-        text = self.__font.render(
-            self.__text,
-            True,
-            (
-                self.__color[0] * 255,
-                self.__color[1] * 255,
-                self.__color[2] * 255,
-                255,
-            )
-        )
-
-        # Flip Pygame text vertically
-        text = pg.transform.flip(
-            text, False, True)
-
-        # Transform text into bytes
-        bytes_text = pg.image.tobytes(text, 'RGBA', True)
-
-        # Get size of the text
-        text_width, text_height = text.get_size()
-
-        # Transform into a ModernGL texture
-        texture = self.app.ctx.texture(
-            (text_width, text_height),
-            4,
-            bytes_text,
+        self.__atlas = self.app.gui.renderer.glyph_atlas(
+            self.__sys_font,
+            self.__font_size,
+            self.__scale_factor,
         )
 
-        # Use linear filtering for smoother text
-        texture.filter = (moderngl.LINEAR, moderngl.LINEAR)
-
-        texture.build_mipmaps()
-
-        # Set text texture parameters in object
-        self.__width = text_width // self.__scale_factor
-        self.__height = text_height // self.__scale_factor
-        self.__texture = texture
-
-        # Bind texture
-        self.__texture.use()
-
-        if self.app.DEBUG:
-            print(f"Rendering text: '{self.__text}'")
-            print(f"Text size: {self.__font.size(self.__text)}")
-            print(f"Text surface size: {text.get_size()}")
-            print(f"Bytes length: {len(bytes_text)}")
-
-    def _set_vao(self):
+    def _set_vertexes(self, anchor: str = "center"):
         """
-        Set the vao of the object.
+        Set the quads of the text centered at the label position.
 
-        Calls to set the vbo before it.
+        Parameters
+        ----------
+        anchor : string, optional
+            "center" if x is the center of the text or "left" if it is its
+            left edge (x is then moved to the center). The default is
+            "center".
 
         Returns
         -------
         None.
 
         """
-        self._set_vbo()
+        quads, width, height = self.__atlas.layout(self.__text)
 
-        if self.app.DEBUG:
-            print("Program attributes:",
-                  self.__shader_programs._attribute_locations)
-
-        self.__vao = self.app.ctx.simple_vertex_array(
-            self.__shader_programs,
-            self.__vbo,
-            'in_position',
-            'in_texcoord',
-        )
-
-    def _set_vbo(self):
-        """
-        Set the vbo of the object.
-
-        Calls to set the vertexes before it.
-
-        Returns
-        -------
-        None.
+        self.__width = int(width)
+        self.__height = int(height)
 
-        """
-        self._set_vertexes()
+        if anchor == "left":
+            self.__x += width / 2
 
-        bytes_vertex = self.vertexes.tobytes()
+        # Bottom-left corner of the text in window pixels
+        left = self.x - width / 2
+        bottom = self.y + height / 2
 
-        if self.app.DEBUG:
-            print(bytes_vertex)
+        # Window pixels (y up from the bottom-left corner) to NDC
+        quads[:, :, 0] = ((left + quads[:, :, 0]) / self.app.WIN_SIZE[0]) * 2 - 1
+        quads[:, :, 1] = -(((bottom - quads[:, :, 1]) /
+                            self.app.WIN_SIZE[1]) * 2 - 1)
 
-        self.__vbo = self.app.ctx.buffer(bytes_vertex)
+        self.__vertexes = quads
 
-        if self.app.DEBUG:
-            print(self.app.ctx.buffer)
-
-    def _set_vertexes(self):
-        # Set text texture
-        self._set_text_texture()
-
-        ndc_x_center = (self.x / self.app.WIN_SIZE[0]) * 2 - 1
-        ndc_y_center = -((self.y / self.app.WIN_SIZE[1]) * 2 - 1)
-
-        # Half-width and half-height in NDC
-        ndc_half_w = self.width / self.app.WIN_SIZE[0]
-        ndc_half_h = self.height / self.app.WIN_SIZE[1]
-
-        # Define quad vertices centered at (ndc_x_center, ndc_y_center)
-        self.__vertexes = np.array([
-            # Position                  # Texcoords
-            ndc_x_center - ndc_half_w, ndc_y_center - ndc_half_h,
-            0.0, 1.0,  # Bottom-left
-            ndc_x_center + ndc_half_w, ndc_y_center - ndc_half_h,
-            1.0, 1.0,  # Bottom-right
-            ndc_x_center - ndc_half_w, ndc_y_center + ndc_half_h,
-            0.0, 0.0,  # Top-left
-            ndc_x_center + ndc_half_w, ndc_y_center + ndc_half_h,
-            1.0, 0.0,  # Top-right
-        ], dtype='f4')
-
-        # self.__vertexes = np.array([
-        #     # Position        # Texcoords
-        #     -0.5, -0.5,  # 0.0, 1.0,  # Bottom-left
-        #     0.5, -0.5,  # 1.0, 1.0,  # Bottom-right
-        #     -0.5,  0.5,  # 0.0, 0.0,  # Top-left
-        #     0.5,  0.5,  # 1.0, 0.0,  # Top-right
-        # ], dtype='f4')
+        Element.mark_dirty()
 
         if self.app.DEBUG:
-            print(f"Vertices (NDC): {self.vertexes}")
+            print(f"Text: '{self.__text}'")
+            print(f"Text size: {(width, height)}")
 
 ###############################################################################
 
@@ -284,34 +146,59 @@ class TextLabel():
 
     def destroy(self):  # noqa
         """
-        Destroy moderngl object to free memory when deleting.
+        Text label owns no OpenGL object, the glyph atlas is shared.
 
         Returns
         -------
         None.
 
         """
-        self.__texture.release()
+        return None
+
+    def place(
+            self,
+            new_text: str,
+            new_x: float,
+            new_y: float,
+            anchor: str = "center",
+    ):
+        """
+        Set the text and the position of the label, laying it out once.
+
+        Parameters
+        ----------
+        new_text : string
+            New text.
+        new_x : float
+            New x in window pixels, of the center or the left edge.
+        new_y : float
+            New y of the center in window pixels.
+        anchor : string, optional
+            "center" if new_x is the center of the text or "left" if it is its
+            left edge. The default is "center".
 
-        self.__vbo.release()
+        Returns
+        -------
+        None.
 
-        self.__vao.release()
+        """
+        self.__text = new_text
+        self.__x = new_x
+        self.__y = new_y
 
-        self.__shader_programs.release()
+        self._set_vertexes(anchor)
 
     def render(self):
         """
-        Render the vao.
+        Add the text quad to the GUI batch.
 
         Returns
         -------
         None.
 
         """
-        # Bind texture
-        self.__texture.use()
-
-        self.__vao.render(moderngl.TRIANGLE_STRIP)
+        self.app.gui.renderer.add_text_quads(
+            self.__atlas.texture, self.__vertexes, self.__color)
 
 ###############################################################################
 
@@ -339,7 +226,8 @@ class TextLabel():
     @font.setter
     def font(self, new_font: str):
         self.__sys_font = new_font
-        self._set_vao()
+        self._set_font()
+        self._set_vertexes()
 
     @property
     def font_size(self) -> int:
@@ -348,7 +236,8 @@ class TextLabel():
     @font_size.setter
     def font_size(self, new_font_size: int):
         self.__font_size = new_font_size
-        self._set_vao()
+        self._set_font()
+        self._set_vertexes()
 
     @property
     def height(self) -> int:
@@ -361,7 +250,8 @@ class TextLabel():
     @scale_factor.setter
     def scale_factor(self, new_scale_factor: int):
         self.__scale_factor = new_scale_factor
-        self._set_vao()
+        self._set_font()
+        self._set_vertexes()
 
     @property
     def text_color(self) -> tuple[float, float, float]:
@@ -370,7 +260,16 @@ class TextLabel():
     @text_color.setter
     def text_color(self, new_color: tuple[float, float, float]):
         self.__color = new_color
-        self._set_vao()
+        Element.mark_dirty()
+
+    @property
+    def text(self) -> str:
+        return self.__text
+
+    @text.setter
+    def text(self, new_text: str):
+        self.__text = new_text
+        self._set_vertexes()
 
     @property
     def uuid(self) -> str:
@@ -401,7 +300,7 @@ class TextLabel():
     def x(self, new_x: int):
         self.__x = new_x
 
-        self._set_vao()
+        self._set_vertexes()
 
     @property
     def y(self) -> int:
@@ -411,6 +310,6 @@ class TextLabel():
     def y(self, new_y: int):
         self.__y = new_y
 
-        self._set_vao()
+        self._set_vertexes()
 
 ###############################################################################
@@ -0,0 +1,76 @@
+import numpy as np
+
+### VARIABLES GLOBALS ###
+# Nombre de frames dels quals es guarda el temps (gràfica del HUD de rendiment)
+FRAME_HISTORY = 120
+
+
+class Metrics:
+    """Registre de mètriques de rendiment. Cada frame només es guarda el seu temps en un buffer
+    circular; la resta de valors (draw calls, instàncies, memòria...) es registren com a funcions
+    que només es criden quan algú els consulta (sample), de manera que sense el HUD visible el cost
+    és d'una escriptura a un array per frame
+    """
+    __slots__ = (
+        "frame_times",
+        "frames",
+        "sources",
+    )
+
+    def __init__(self, history=FRAME_HISTORY):
+        """Inicialització de la classe Metrics
+
+        Args:
+            history (int, optional): Nombre de frames guardats. Defaults to FRAME_HISTORY.
+        """
+        # Temps de cada frame en ms (buffer circular)
+        self.frame_times = np.zeros(history, dtype='f4')
+        self.frames = 0
+        # nom: funció sense arguments que retorna el valor actual
+        self.sources = {}
+
+    def register(self, name, source):
+        """Registrar una mètrica
+
+        Args:
+            name (str): Nom de la mètrica
+            source (callable): Funció sense arguments que en retorna el valor
+        """
+        self.sources[name] = source
+
+    def record_frame(self, milliseconds):
+        """Guardar el temps d'un frame
+
+        Args:
+            milliseconds (float): Temps del frame en ms
+        """
+        self.frame_times[self.frames % len(self.frame_times)] = milliseconds
+        self.frames += 1
+
+    def history(self):
+        """Temps dels últims frames, del més antic al més recent
+
+        Returns:
+            np.ndarray: Temps en ms (menys de FRAME_HISTORY si encara no s'han fet prou frames)
+        """
+        if self.frames < len(self.frame_times):
+            return self.frame_times[:self.frames].copy()
+        return np.roll(self.frame_times, -(self.frames % len(self.frame_times)))
+
+    def fps(self):
+        """Frames per segon mitjans dels últims frames
+
+        Returns:
+            float: FPS (0 si encara no hi ha cap frame)
+        """
+        times = self.history()
+        mean = float(times.mean()) if len(times) else 0.0
+        return 1000 / mean if mean > 0 else 0.0
+
+    def sample(self):
+        """Valor actual de totes les mètriques registrades
+
+        Returns:
+            dict: nom: valor
+        """
+        return {name: source() for name, source in self.sources.items()}
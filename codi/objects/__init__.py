@@ -1,8 +1,12 @@
 from .asteroid import AsteroidBatch
-from .orbit import Orbit
+from .orbit import OrbitBatch, ORBIT_COLOR
 from .planet import Planet
 from .satellite import Satellite
 from .star import StarBatch
 from .sun import Sun
 from .ring import RingBatch
-from .object import Object
\ No newline at end of file
+from .object import Object
+from .resource_cache import ResourceCache
+from .body import BodyBatch
+from .texture_array import TextureArray, TEXTURE_ARRAY_SIZE, TEXTURE_TIERS, TEXTURE_QUALITY
+from .texture_cache import TextureCache, TEXTURE_CACHE_DIR
@@ -2,6 +2,7 @@ import random
 import numpy as np
 import glm
 from objects.object import Object
+from objects.instance_buffer import InstanceBuffer
 from scipy.spatial import KDTree
 import math
 
@@ -19,9 +20,12 @@ class AsteroidBatch(Object):
                "y_asteroids",
                "instance_matrices",
                "instance_buffer",
+               "drawn_matrices",
                "type",
                "positions",
+               "bounding_radii",
                "collision_adjustments",
+               "collision_pairs",
                "enabled")
     
     def __init__(self, app, shader, texture, info, num_asteroids, distance1, distance2, velocity, eccentricity, type, enable_collision=False):
@@ -46,19 +50,28 @@ class AsteroidBatch(Object):
 
         # Generate instance-specific transformation matrices
         self.instance_matrices = self.generate_instance_matrices()
-        self.instance_buffer = self.ctx.buffer(self.instance_matrices.astype('f4').tobytes())
+        # Ring buffer de matrius: update() omple la còpia 'back' i upload() fixa la 'front' que es dibuixa.
+        # L'escalat i l'altura no canvien, només s'actualitzen les columnes x i z cada frame
+        self.instance_buffer = InstanceBuffer(self.ctx, (self.num_asteroids, 16), initial=self.instance_matrices)
+        self.drawn_matrices = self.instance_buffer.front
+        # Radi de l'esfera contenidora de cada asteroide (frustum culling per instància)
+        self.bounding_radii = self.scales * self.radius
         
         # Update the VAO to include the instance buffer
-        self.vao = self.ctx.vertex_array(
-            self.shader,
+        self.vao.release()
+        self.vao = self.get_vertex_array(
             [
                 (self.vbo, '3f 3f 2f', 'in_norm', 'in_position', 'in_tex_coord'),
-                (self.instance_buffer, '16f/i', 'instance_model'),
+                (self.instance_buffer.buffer, '16f/i', 'instance_model'),
             ],
+            self.vbo,
+            self.ibo,
         )
 
         self.positions = self.initial_positions()
         self.collision_adjustments = {}
+        # Parelles d'asteroides en col·lisió a l'últim update (mètriques de rendiment)
+        self.collision_pairs = 0
         self.enabled = enable_collision
 
     def on_init(self):
@@ -72,7 +85,6 @@ class AsteroidBatch(Object):
         self.shader['light.Is'].write(self.app.light.Is)
 
         # Essential for viewing
-        self.shader['m_proj'].write(self.app.camera.m_proj)
         self.shader['m_view'].write(self.app.camera.m_view)      
 
     def generate_instance_matrices(self):
@@ -129,52 +141,45 @@ class AsteroidBatch(Object):
             model = glm.scale(model, glm.vec3(scale_factor, scale_factor, scale_factor))
 
             matrices.append(np.array(model).T)  # Transpose for column-major order
+
+        # Arrays de numpy per actualitzar les òrbites de forma vectoritzada
+        self.distances = np.array(self.distances)
+        self.scales = np.array(self.scales)
+        self.angles = np.array(self.angles)
+        self.velocity_asteroids = np.array(self.velocity_asteroids)
+        self.y_asteroids = np.array(self.y_asteroids)
         
         return np.array(matrices, dtype='f4')
         
     def update_orbit(self):
         """Actualitzar l'òrbita dels asteroides
         """
-        updated_matrices = []
-        new_positions = []
-        for i in range(self.num_asteroids):
-            # Retrieve current asteroid distance 
-            distance = self.distances[i]
+        # Semieixos i angle de cada asteroide (vectoritzat per a tots els asteroides)
+        a = self.distances
+        b = a * (1 - self.eccentricity ** 2) ** 0.5
+        angles = self.angles + self.velocity_asteroids * self.app.time * 0.055
+        focal_distance = a * self.eccentricity
+
+        # Matrius model (translació * escalat) en ordre column-major a la còpia 'back'
+        matrices = self.instance_buffer.back
+        x, z = matrices[:, 12], matrices[:, 14]
+        np.cos(angles, out=x)
+        x *= a
+        x -= focal_distance
+        np.sin(angles, out=z)
+        z *= b
+        self.instance_buffer.swap()
 
-            # Calculate semi-major and semi-minor axes
-            a = distance  # Semi-major axis
-            b = a * (1 - self.eccentricity ** 2) ** 0.5  # Semi-minor axis
-            angle = self.angles[i]
-            # Increment the angle based on velocity and time
-            angle += self.velocity_asteroids[i] * self.app.time * 0.055  # Use velocity and time for orbit speed
-            # angle %= 2*np.pi 
-            focal_distance = a * self.eccentricity 
-            # Update position based on the new angle
-            x = float(a * np.cos(angle)) - focal_distance
-            z = float(b * np.sin(angle))
-            y = float(self.y_asteroids[i])  # You can adjust this if needed
-
-            new_positions.append([x, y, z])  # Store the new position
-
-            # Create the new transformation matrix
-            model = glm.mat4(1.0)
-            model = glm.translate(model, glm.vec3(x, y, z))  # Position in orbit
-            scale_factor = self.scales[i]  # Use the stored scale factor
-            model = glm.scale(model, glm.vec3(scale_factor, scale_factor, scale_factor))
-
-            updated_matrices.append(np.array(model).T)
-
-        # Update the instance buffer with the new matrices
-        self.instance_buffer.write(np.array(updated_matrices, dtype='f4').tobytes())
         # Update the positions array with the new positions
-        self.positions = new_positions
-        
-    def move(self):
+        self.positions = matrices[:, 12:15].tolist()
+
+    def update(self):
         """Actualitzar l'orbitació dels asteroides, comprovant si succeeix una col·lisió
         """
         if self.enabled:
             if (self.type == "Belt"):
                 collisions = self.check_collisions_optimized()
+                self.collision_pairs = len(collisions)
                 if len(collisions) > 0:
                     #print(f"Collisions detected: {collisions}, number of collisions:{len(collisions)}")
                     self.apply_collision(collisions)
@@ -182,11 +187,43 @@ class AsteroidBatch(Object):
             self.smooth_angle_adjustments()
         self.update_orbit()
 
-    def render(self):
-        """Renderització del VAO
+    def upload(self):
+        """Fixar les últimes matrius calculades com les del frame que es dibuixarà. Es pugen a enqueue(),
+        un sol cop i només les visibles, mentre el fil de simulació ja omple la còpia següent
+        """
+        self.drawn_matrices = self.instance_buffer.front
+
+    def destroy(self):
+        """Neteja de les variables després d'acabar l'execució del programa
+        """
+        super().destroy()
+        self.instance_buffer.release()
+
+    def enqueue(self, queue):
+        """Afegir el cinturó a la cua de renderització. Només es dibuixen els asteroides dins del frustum de la càmera
+
+        Args:
+            queue (RenderQueue): Cua de renderització del frame
+        """
+        matrices = self.drawn_matrices
+        visible = self.app.frustum.spheres_visible(matrices[:, 12:15], self.bounding_radii)
+        instances = int(np.count_nonzero(visible))
+        self.app.culling.instances_drawn += instances
+        self.app.culling.instances_culled += self.num_asteroids - instances
+        if instances == 0:
+            return
+        # Una sola pujada per frame: totes les matrius, o les visibles compactades al principi del buffer
+        self.instance_buffer.upload(visible if instances < self.num_asteroids else None, matrices)
+
+        queue.submit(self.shader, self.texture, self.vao, instances=instances)
+
+    def bounding_sphere(self):
+        """El cinturó es descarta per instàncies dins de render()
+
+        Returns:
+            None: L'objecte no es descarta sencer
         """
-        self.texture.use()
-        self.vao.render(instances=self.num_asteroids)
+        return None
 
     def get_data(self):
         """Genera esfera (asteroides)"""
@@ -0,0 +1,173 @@
+import glm
+import moderngl as mgl
+import numpy as np
+from objects.object import Object
+from objects.lod import LevelOfDetail, LOD_FACTORS
+
+### VARIABLES GLOBALS ###
+# Texels RGBA32F per cos a la textura de dades: matriu model (4), matriu normal (3) i extres (1)
+BODY_TEXELS = 8
+
+
+class BodyBatch(Object):
+    """Classe filla d'Objecte. Dibuixa el Sol, els planetes i els satèl·lits amb unes poques crides instanciades.
+    Totes les esferes (de radi 1, amb tots els nivells de detall) comparteixen un sol VBO/IBO, i les dades de
+    cada cos (matriu model, matriu normal...) es pugen cada frame en una textura de dades que el vertex shader
+    llegeix amb texelFetch. Les textures estan empaquetades en un TextureArray (cada cos en guarda la capa),
+    de manera que els cossos amb la mateixa malla es dibuixen en una sola crida. La capa que el TextureArray
+    té carregada a resolució completa es mostra amb aquesta textura
+    """
+    __slots__ = (
+        "bodies",
+        "members",
+        "meshes",
+        "entries",
+        "body_data",
+        "body_texture",
+        "textures",
+        "draws",
+    )
+
+    def __init__(self, app, shader, bodies, textures):
+        """Inicialització de la classe BodyBatch
+
+        Args:
+            bodies (list): Objectes esfèrics (Sun, Planet, Satellite) que dibuixa el batch
+            textures (TextureArray): Textures dels cossos (cada cos en guarda la capa). El batch n'és el propietari
+        """
+        self.bodies = list(bodies)
+        self.members = {id(body) for body in self.bodies}
+        # (lat, lon): (primer índex, nombre d'índexs) de cada malla dins del pool
+        self.meshes = {}
+        # Cossos afegits aquest frame: (malla, cos)
+        self.entries = []
+        self.textures = textures
+        super().__init__(app, shader, None, [1.0, 0, 0])
+
+        self.body_data = np.zeros((len(self.bodies), BODY_TEXELS, 4), dtype='f4')
+        self.body_texture = self.ctx.texture((BODY_TEXELS, len(self.bodies)), 4, dtype='f4')
+        self.body_texture.filter = (mgl.NEAREST, mgl.NEAREST)
+        # Registres de dibuix: primer índex, nombre d'índexs, primer cos, nombre de cossos
+        self.draws = np.zeros((len(self.bodies), 4), dtype='i4')
+
+    def __contains__(self, body):
+        """Comprovar si un objecte es dibuixa amb aquest batch
+
+        Args:
+            body (Object): Objecte a comprovar
+
+        Returns:
+            bool: True si l'objecte és un dels cossos del batch
+        """
+        return id(body) in self.members
+
+    def on_init(self):
+        """Post-inicialització de la classe BodyBatch
+        """
+        # Related to lighting
+        self.shader['light.position'].write(self.app.light.position)
+        self.shader['view_pos'].write(self.app.camera.position)
+        self.shader['light.Ia'].write(self.app.light.Ia)
+        self.shader['light.Id'].write(self.app.light.Id)
+        self.shader['light.Is'].write(self.app.light.Is)
+
+        # Essential for viewing
+        self.shader['m_view'].write(self.app.camera.m_view)
+
+        # Textures dels cossos a la unitat 0, dades dels cossos a la unitat 1 i textura a resolució completa a la 2
+        self.shader['texture0'].value = 0
+        self.shader['bodies'].value = 1
+        self.shader['detail'].value = 2
+
+    def get_data(self):
+        """Pool de geometria: esferes unitàries de totes les subdivisions que poden fer servir els cossos
+
+        Returns:
+            (np.array, np.array): Vèrtexs i índexs de totes les malles concatenades
+        """
+        vertices = []
+        indices = []
+        vertex_count = 0
+        index_count = 0
+        for body in self.bodies:
+            for level in range(len(LOD_FACTORS)):
+                segments = LevelOfDetail.segments(body.lat, body.lon, level)
+                if segments in self.meshes:
+                    continue
+                mesh_vertices, mesh_indices = self.create_sphere(False, *segments)
+                self.meshes[segments] = (index_count, len(mesh_indices))
+                vertices.append(mesh_vertices)
+                # Sense base vertex a GL 3.3: els índexs ja porten el desplaçament de la malla
+                indices.append(mesh_indices.astype('u4') + vertex_count)
+                vertex_count += len(mesh_vertices) // 8
+                index_count += len(mesh_indices)
+
+        index_type = 'u2' if self.index_element_size(vertex_count) == 2 else 'u4'
+        return np.concatenate(vertices), np.concatenate(indices).astype(index_type)
+
+    def add(self, body):
+        """Afegir un cos visible al frame actual, amb el nivell de detall que li correspon
+
+        Args:
+            body (Object): Cos a dibuixar
+        """
+        segments = LevelOfDetail.segments(body.lat, body.lon, body.select_lod())
+        self.entries.append((self.meshes[segments], body))
+
+    def enqueue(self, queue):
+        """Pujar les dades dels cossos afegits i afegir una crida instanciada per cada malla
+
+        Args:
+            queue (RenderQueue): Cua de renderització del frame
+        """
+        count = len(self.entries)
+        if count == 0:
+            return
+
+        # Els cossos de cada grup queden consecutius a la textura de dades
+        self.entries.sort(key=lambda entry: entry[0][0])
+        data = self.body_data
+        for row, (_, body) in enumerate(self.entries):
+            # Els uniforms són la còpia del fil principal (upload), no l'estat que calcula el fil de simulació
+            m_model = body.uniforms["m_model"] * glm.scale(glm.vec3(body.radius))
+            data[row, 0:4] = np.frombuffer(m_model.to_bytes(), dtype='f4').reshape(4, 4)
+            data[row, 4:7, :3] = np.frombuffer(body.uniforms["m_normal"].to_bytes(), dtype='f4').reshape(3, 3)
+            data[row, 7, 0] = -1.0 if body.inverted_normals else 1.0
+            data[row, 7, 1] = body.layer
+        self.body_texture.write(data[:count], viewport=(0, 0, BODY_TEXELS, count))
+        self.body_texture.use(location=1)
+        if self.textures.detail is not None:
+            self.textures.detail.use(location=2)
+        detail_layer = np.int32(self.textures.detail_layer)
+
+        # Registres de dibuix de cada grup
+        draws = 0
+        start = 0
+        for row in range(1, count + 1):
+            if row == count or self.entries[row][0] != self.entries[start][0]:
+                (first, indices), _ = self.entries[start]
+                self.draws[draws] = (first, indices, start, row - start)
+                draws += 1
+                start = row
+
+        for first, indices, first_body, instances in self.draws[:draws]:
+            uniforms = {"first_body": np.int32(first_body), "detail_layer": detail_layer}
+            queue.submit(self.shader, self.textures.texture, self.vao, uniforms,
+                         instances=int(instances), vertices=int(indices), first=int(first))
+
+        self.entries.clear()
+
+    def bounding_sphere(self):
+        """Els cossos es descarten individualment abans d'afegir-los al batch
+
+        Returns:
+            None: L'objecte no es descarta sencer
+        """
+        return None
+
+    def destroy(self):
+        """Neteja de les variables després d'acabar l'execució del programa
+        """
+        super().destroy()
+        self.body_texture.release()
+        self.textures.release()
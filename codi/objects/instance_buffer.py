@@ -0,0 +1,85 @@
+import numpy as np
+
+class InstanceBuffer:
+    """Buffer de dades per instància compartit pels batches (asteroides, anells).
+    Manté diverses còpies preassignades a la CPU (ring buffer) i orfena el buffer de la GPU
+    abans de cada pujada, així no es creen arrays nous cada frame ni s'espera que el driver
+    acabi de llegir les dades del frame anterior.
+    """
+    __slots__ = (
+        "ctx",
+        "buffer",
+        "data",
+        "index",
+        "compact",
+    )
+
+    def __init__(self, ctx, shape, copies=3, dtype='f4', initial=None):
+        """Inicialització de la classe InstanceBuffer
+
+        Args:
+            ctx (mgl.Context): Context de ModernGL
+            shape (tuple): Forma de les dades d'un frame, p.ex. (num_instancies, 16)
+            copies (int, optional): Nombre de còpies a la CPU. Defaults to 3 (triple buffering).
+            dtype (str, optional): Tipus de les dades. Defaults to 'f4'.
+            initial (np.array, optional): Dades inicials per a totes les còpies. Defaults to None.
+        """
+        self.ctx = ctx
+        self.data = np.zeros((copies,) + tuple(shape), dtype=dtype)
+        if initial is not None:
+            self.data[:] = np.reshape(initial, shape)
+        self.index = 0
+        # Espai per compactar les files visibles abans de pujar-les (frustum culling)
+        self.compact = np.empty_like(self.data[0])
+        self.buffer = ctx.buffer(self.data[0].tobytes())
+
+    @property
+    def back(self):
+        """Còpia on s'escriuen les dades del pròxim frame (fil de simulació)
+
+        Returns:
+            np.array: Vista modificable de la còpia
+        """
+        return self.data[self.index]
+
+    @property
+    def front(self):
+        """Última còpia completada, la que es puja a la GPU
+
+        Returns:
+            np.array: Vista de la còpia
+        """
+        return self.data[self.index - 1]
+
+    def swap(self):
+        """Marcar la còpia 'back' com completada i passar a la següent
+        """
+        self.index = (self.index + 1) % len(self.data)
+
+    def upload(self, mask=None, data=None):
+        """Pujar la còpia 'front' a la GPU orfenant el buffer anterior
+
+        Args:
+            mask (np.array, optional): Màscara booleana de les files a pujar. Les files seleccionades
+                s'escriuen compactades al principi del buffer. Defaults to None (totes les files).
+            data (np.array, optional): Còpia a pujar. Defaults to None (la còpia 'front').
+
+        Returns:
+            int: Nombre de files pujades
+        """
+        if data is None:
+            data = self.front
+        self.buffer.orphan()
+        if mask is None:
+            self.buffer.write(data)
+            return len(data)
+
+        count = int(np.count_nonzero(mask))
+        np.compress(mask, data, axis=0, out=self.compact[:count])
+        self.buffer.write(self.compact[:count])
+        return count
+
+    def release(self):
+        """Alliberar el buffer de la GPU
+        """
+        self.buffer.release()
@@ -0,0 +1,75 @@
+import glm
+
+### VARIABLES GLOBALS ###
+# Factor de subdivisió de cada nivell respecte la [lat, lon] de l'objecte (el nivell 1 és l'original)
+LOD_FACTORS = (0.5, 1, 2, 4)
+# Radi projectat (en píxels) a partir del qual es passa al nivell següent
+LOD_THRESHOLDS = (6, 40, 160)
+# Mínim de paral·lels i meridians d'una esfera
+LOD_MIN_SEGMENTS = 6
+
+
+class LevelOfDetail:
+    """Selecció del nivell de detall d'una esfera segons el radi que ocupa a la pantalla.
+    Té histèresi per evitar que el nivell salti endavant i enrere en el llindar
+    """
+    __slots__ = ("thresholds", "hysteresis", "level")
+
+    def __init__(self, thresholds=LOD_THRESHOLDS, hysteresis=0.25, level=1):
+        """Inicialització de la classe LevelOfDetail
+
+        Args:
+            thresholds (tuple, optional): Llindars en píxels entre nivells consecutius. Defaults to LOD_THRESHOLDS.
+            hysteresis (float, optional): Marge relatiu que cal superar per canviar de nivell. Defaults to 0.25.
+            level (int, optional): Nivell inicial. Defaults to 1.
+        """
+        self.thresholds = thresholds
+        self.hysteresis = hysteresis
+        self.level = level
+
+    @staticmethod
+    def segments(lat, lon, level):
+        """Paral·lels i meridians de l'esfera d'un nivell
+
+        Args:
+            lat (int): Paral·lels del nivell original
+            lon (int): Meridians del nivell original
+            level (int): Nivell de detall
+
+        Returns:
+            (int, int): Paral·lels i meridians del nivell
+        """
+        factor = LOD_FACTORS[level]
+        return max(LOD_MIN_SEGMENTS, round(lat * factor)), max(LOD_MIN_SEGMENTS, round(lon * factor))
+
+    @staticmethod
+    def screen_radius(center, radius, camera, height):
+        """Radi aproximat en píxels d'una esfera projectada a la pantalla
+
+        Args:
+            center (glm.vec3): Centre de l'esfera
+            radius (float): Radi de l'esfera
+            camera (Camera): Càmera activa
+            height (int): Alçada de la finestra en píxels
+
+        Returns:
+            float: Radi projectat en píxels
+        """
+        distance = max(glm.length(center - camera.position), 1e-6)
+        # m_proj[1][1] = 1 / tan(fov / 2)
+        return radius * camera.m_proj[1][1] * height / (2 * distance)
+
+    def select(self, pixels):
+        """Escollir el nivell de detall pel radi projectat
+
+        Args:
+            pixels (float): Radi projectat en píxels
+
+        Returns:
+            int: Nivell de detall (0 és el més simple)
+        """
+        while self.level < len(self.thresholds) and pixels > self.thresholds[self.level] * (1 + self.hysteresis):
+            self.level += 1
+        while self.level > 0 and pixels < self.thresholds[self.level - 1] * (1 - self.hysteresis):
+            self.level -= 1
+        return self.level
@@ -1,7 +1,8 @@
 import glm
 import numpy as np
 import moderngl as mgl
-from PIL import Image
+from objects.lod import LevelOfDetail
+from render_queue import RenderQueue
 
 class Object:
     """Classe per crear un objecte dintre del Sistema Solar (classe pare)
@@ -18,8 +19,15 @@ class Object:
         "shader",
         "vao",
         "m_model",
+        "m_normal",
         "radius",
+        "ibo",
+        "uniforms",
+        "lod",
+        "layer",
     )
+    # Les esferes amb normals cap a dins (el Sol) ho indiquen a la subclasse
+    inverted_normals = False
     
     def __init__(self, app, shader, texture, info):
         """Inicialització de la classe Object
@@ -27,7 +35,7 @@ class Object:
         Args:
             app (GraphicsEngine()): Instància de la classe GraphicsEngine()
             shader (list): Llista que conté el vertex_shader i fragment_shader a utilitzar 
-            texture (str): Path de l'imatge que texturitzarem l'objecte
+            texture (str | int): Path de l'imatge que texturitzarem l'objecte, o capa del TextureArray dels cossos
             info (list, optional): Informació per crear les esferes (en cas de planetes i sol). Defaults to ["octahedron", 3].
         """
         #App variables
@@ -40,11 +48,27 @@ class Object:
         self.lon = info[2]
 
         # Object variables
-        self.texture = self.load_texture(texture)
-        self.vbo = self.get_vbo()
-        self.shader = self.get_shader_program(shader)
-        self.vao = self.get_vao()
+        # Els cossos que es dibuixen en batch només guarden la capa de la seva imatge dins del TextureArray
+        self.layer = texture if isinstance(texture, int) else None
+        # Les textures es comparteixen entre objectes amb la mateixa imatge i el mateix load_texture()
+        self.texture = None if not isinstance(texture, str) else self.app.resources.get(
+            ("texture", texture, type(self).load_texture), lambda: self.load_texture(texture))
+        self.ibo = None
+        self.uniforms = None
+        if self.layer is None:
+            self.vbo = self.get_vbo()
+            self.shader = self.get_shader_program(shader)
+            self.vao = self.get_vao()
+        else:
+            # El BodyBatch dibuixa el cos amb la seva geometria i el seu programa
+            self.vbo = None
+            self.shader = None
+            self.vao = None
         self.m_model = self.get_model_matrix()
+        self.m_normal = self.get_normal_matrix()
+
+        # Nivell de detall (només per a les esferes que criden enable_lod())
+        self.lod = None
 
         #Shader initialization
         self.on_init()
@@ -52,6 +76,10 @@ class Object:
     def on_init(self):
         """Pos-inicialització de la classe Object. Establiment dels paràmetres del shader 
         """
+        self.uniforms = {"m_model": self.m_model, "m_normal": self.m_normal}
+        if self.shader is None:
+            return
+
         # Related to lighting
         self.shader['light.position'].write(self.app.light.position)
         self.shader['view_pos'].write(self.app.camera.position)
@@ -60,9 +88,9 @@ class Object:
         self.shader['light.Is'].write(self.app.light.Is)
 
         # Essential for viewing
-        self.shader['m_proj'].write(self.app.camera.m_proj)
         self.shader['m_view'].write(self.app.camera.m_view)
         self.shader['m_model'].write(self.m_model)
+        self.shader['m_normal'].write(self.m_normal)
 
     def load_texture(self, filepath):
         """Carregar la textura d'entrada 
@@ -73,8 +101,9 @@ class Object:
         Returns:
             mgl.texture: Textura
         """
-        image = Image.open(filepath).transpose(Image.FLIP_TOP_BOTTOM).transpose(Image.FLIP_LEFT_RIGHT)
-        texture = self.ctx.texture(image.size, 3, image.tobytes())
+        # Píxels ja girats, de la memòria cau de textures (mmap) o decodificats el primer cop
+        pixels = self.app.texture_cache.load(filepath, 3)
+        texture = self.ctx.texture((pixels.shape[1], pixels.shape[0]), 3, pixels)
         texture.filter = (mgl.LINEAR_MIPMAP_LINEAR, mgl.LINEAR)
         texture.build_mipmaps()
         texture.repeat_x = False
@@ -82,22 +111,53 @@ class Object:
         return texture
 
     def get_vbo(self):
-        """Obtenció del VBO 
+        """Obtenció del VBO. Si get_data() retorna també índexs, es crea l'IBO (self.ibo)
 
         Returns:
             moderngl.VertexArray: Array VBO
         """
-        data = self.get_data()
-        vbo = self.ctx.buffer(data)
+        vbo, self.ibo = self.create_buffers(self.get_data())
         return vbo
+
+    def create_buffers(self, data):
+        """Creació dels buffers de la GPU a partir de les dades de get_data()
+
+        Args:
+            data (np.array | tuple): Vèrtexs, o tupla (vèrtexs, índexs) per a geometria indexada
+
+        Returns:
+            (moderngl.Buffer, moderngl.Buffer | None): VBO i IBO (None si no hi ha índexs)
+        """
+        if isinstance(data, tuple):
+            vertices, indices = data
+            return self.ctx.buffer(vertices), self.ctx.buffer(indices)
+        return self.ctx.buffer(data), None
+
+    @staticmethod
+    def index_element_size(vertex_count):
+        """Mida dels índexs necessària per adreçar tots els vèrtexs
+
+        Args:
+            vertex_count (int): Nombre de vèrtexs de la malla
+
+        Returns:
+            int: 2 (uint16) o 4 (uint32) bytes
+        """
+        return 2 if vertex_count <= 65536 else 4
     
     def destroy(self):
         """Neteja de les variables després d'acabar l'execució del programa
         """
+        if self.texture is not None:
+            self.app.resources.release(self.texture)
+        if self.vao is None:
+            # Cos del BodyBatch: no té recursos de GL propis
+            return
+        if self.ibo is not None:
+            self.ibo.release()
         self.vbo.release()
-        self.shader.release()
-        self.texture.release()
-        self.vao.release()    
+        self.app.resources.release(self.shader)
+        self.vao.release()
 
     def get_vao(self):
         """Obtenció del VAO 
@@ -105,75 +165,82 @@ class Object:
         Returns:
             moderngl.VertexArray: Array VAO
         """
-        vao = self.ctx.vertex_array(self.shader,[(self.vbo, '3f 3f 2f', 'in_norm', 'in_position', 'in_tex_coord')])
-        return vao
+        return self.get_vertex_array([(self.vbo, '3f 3f 2f', 'in_norm', 'in_position', 'in_tex_coord')],
+                                     self.vbo, self.ibo)
 
-    def create_sphere(self, sun):
-        """Crear esfera per coordenades esfèriques
+    def get_vertex_array(self, content, vbo, ibo):
+        """Creació d'un VAO amb o sense buffer d'índexs
+
+        Args:
+            content (list): Buffers i formats dels atributs
+            vbo (moderngl.Buffer): Buffer de vèrtexs (format '3f 3f 2f')
+            ibo (moderngl.Buffer | None): Buffer d'índexs
 
         Returns:
-            np.array: Vector de coordenades (normal, position, texture)
+            moderngl.VertexArray: Array VAO
         """
-        data = []
-        vertices = []
-        indices = []
-        
-        # Latitude and longitude angles in radians
-        for lat in range(self.lat + 1):
-            theta = np.pi * lat / self.lat
-            for lon in range(self.lon + 1):  # Increase by 1 to close the loop
-                phi = 2 * np.pi * lon / self.lon
-                
-                # Spherical to Cartesian conversion
-                x = self.radius * np.sin(theta) * np.cos(phi)
-                y = self.radius * np.cos(theta)
-                z = self.radius * np.sin(theta) * np.sin(phi)
-                
-                # Calculate texture coordinates with improved wrap handling
-                s = lon / self.lon
-                t = 1 - (lat / self.lat)
-                
-                vertices.append((x, y, z, s, t))
-        
-        # Create faces (triangles) between vertices (latitude-longitude stripes)
-        for lat in range(self.lat):
-            for lon in range(self.lon):
-                current = lat * (self.lon + 1) + lon
-                next = current + self.lon + 1
-                
-                # Triangles for the quad strip
-                indices.append((current, next, current + 1))
-                indices.append((current + 1, next, next + 1))
-
-        for face in indices:
-            for idx in face:
-                x, y, z, s, t = vertices[idx]
-                vertex = glm.vec3(x, y, z)
-                normalized_v = self.normalize(vertex)
-                
-                # Add vertex data
-                #data.extend([self.color.x, self.color.y, self.color.z])  # in_color
-                if sun:
-                    data.extend([-normalized_v.x, -normalized_v.y, -normalized_v.z])  # Case: Sun
-                else:
-                    data.extend([normalized_v.x, normalized_v.y, normalized_v.z])  # Case: Others
-                data.extend([vertex.x, vertex.y, vertex.z])  # in_position
-                data.extend([s, t])  # Texture coordinates
-
-        return np.array(data, dtype='f4')
+        if ibo is None:
+            return self.ctx.vertex_array(self.shader, content)
+        return self.ctx.vertex_array(self.shader, content, index_buffer=ibo,
+                                     index_element_size=self.index_element_size(vbo.size // 32))
 
-    @staticmethod
-    def normalize(v):
-        """Normalitza un vèrtex 
+    def enable_lod(self):
+        """Activar els nivells de detall de l'esfera. El cos només guarda la selecció del nivell: les malles
+        de tots els nivells són al pool de geometria del BodyBatch, que el dibuixa
+        """
+        self.lod = LevelOfDetail()
+
+    def select_lod(self):
+        """Escollir el nivell de detall segons el radi que ocupa l'objecte a la pantalla
+
+        Returns:
+            int: Nivell de detall
+        """
+        center, radius = self.bounding_sphere()
+        pixels = LevelOfDetail.screen_radius(center, radius, self.app.camera, self.app.WIN_SIZE[1])
+        return self.lod.select(pixels)
+
+    def create_sphere(self, sun, lat=None, lon=None):
+        """Crear esfera per coordenades esfèriques
 
         Args:
-            v (list): Vèrtex amb valors (x,y,z)
+            sun (bool): Si es True, les normals apunten cap a dins (il·luminació del sol)
+            lat (int, optional): Nombre de paral·lels. Defaults to None (self.lat).
+            lon (int, optional): Nombre de meridians. Defaults to None (self.lon).
 
         Returns:
-            list: Vèrtex normalitzat en cada posició
+            (np.array, np.array): Vèrtexs únics (normal, position, texture) i índexs dels triangles
         """
-        norm = np.linalg.norm(v)
-        return v / norm
+        lat = self.lat if lat is None else lat
+        lon = self.lon if lon is None else lon
+
+        # Latitude and longitude angles in radians (lon + 1 to close the loop)
+        lat_index, lon_index = np.meshgrid(np.arange(lat + 1), np.arange(lon + 1), indexing='ij')
+        theta = np.pi * lat_index / lat
+        phi = 2 * np.pi * lon_index / lon
+
+        # Spherical to Cartesian conversion
+        positions = np.empty((lat + 1, lon + 1, 3))
+        positions[..., 0] = self.radius * np.sin(theta) * np.cos(phi)
+        positions[..., 1] = self.radius * np.cos(theta)
+        positions[..., 2] = self.radius * np.sin(theta) * np.sin(phi)
+        positions = positions.reshape(-1, 3)
+
+        normals = positions / np.linalg.norm(positions, axis=1, keepdims=True)
+        if sun:
+            normals = -normals  # Case: Sun
+
+        # Texture coordinates
+        tex_coords = np.stack((lon_index / lon, 1 - lat_index / lat), axis=-1).reshape(-1, 2)
+        vertices = np.hstack((normals, positions, tex_coords)).astype('f4')
+
+        # Create faces (triangles) between vertices (latitude-longitude stripes)
+        current = (np.arange(lat)[:, None] * (lon + 1) + np.arange(lon)[None, :]).ravel()
+        next = current + lon + 1
+        indices = np.stack((current, next, current + 1, current + 1, next, next + 1), axis=1).ravel()
+        index_type = 'u2' if self.index_element_size(len(vertices)) == 2 else 'u4'
+
+        return vertices.ravel(), indices.astype(index_type)
 
     def get_shader_program(self, shader):
         """Obtenció del shader program 
@@ -184,7 +251,8 @@ class Object:
         Returns:
             moderngl.Program: Programa que establim com serà el procediment del vertex shader i fragment shader 
         """
-        program = self.ctx.program(vertex_shader= shader[0], fragment_shader= shader[1])
+        # Els objectes amb els mateixos shaders comparteixen el programa
+        program = self.app.resources.program(shader[0], shader[1])
         return program
     
     def get_model_matrix(self):
@@ -194,6 +262,55 @@ class Object:
         """
         m_model = glm.rotate(glm.mat4(), glm.radians(0), glm.vec3(0, 1, 0))
         return m_model 
+
+    def get_normal_matrix(self):
+        """Obtenció de la matriu normal (es calcula un cop per frame a la CPU, no per vèrtex al shader)
+
+        Returns:
+            glm.mat3: Transposada de la inversa de la part 3x3 de la matriu model
+        """
+        return glm.transpose(glm.inverse(glm.mat3(self.m_model)))
     
-    def move(self):
+    def update(self):
+        """Actualització de l'estat de l'objecte a la CPU. No pot fer crides a OpenGL,
+        ja que s'executa en el fil de simulació mentre el fil principal renderitza
+        """
         pass
+
+    def upload(self):
+        """Pujada a la GPU de l'estat calculat per update(). S'executa en el fil principal
+        """
+        pass
+
+    def enqueue(self, queue):
+        """Afegir les crides de dibuix de l'objecte a la cua de renderització
+
+        Args:
+            queue (RenderQueue): Cua de renderització del frame
+        """
+        queue.submit(self.shader, self.texture, self.vao, self.uniforms)
+
+    def render(self):
+        """Renderització immediata del VAO, sense passar per la cua de l'engine
+        """
+        queue = RenderQueue()
+        self.enqueue(queue)
+        queue.flush()
+
+    def move(self):
+        """Actualitzar l'objecte i pujar el nou estat a la GPU (de forma seqüencial)
+        """
+        self.update()
+        self.upload()
+
+    def bounding_sphere(self):
+        """Esfera contenidora de l'objecte en coordenades de món, per al frustum culling
+
+        Returns:
+            (glm.vec3, float) | None: Centre i radi de l'esfera, o None si l'objecte no es pot descartar
+        """
+        # La còpia del frame que es dibuixa (upload): el fil de simulació ja calcula self.m_model del següent
+        m_model = self.uniforms["m_model"]
+        # L'escalat més gran de la matriu model determina el radi de l'esfera
+        scale = max(glm.length(glm.vec3(m_model[0])), glm.length(glm.vec3(m_model[1])), glm.length(glm.vec3(m_model[2])))
+        return glm.vec3(m_model[3]), self.radius * scale
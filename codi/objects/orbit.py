@@ -1,64 +1,81 @@
-import glm
 import moderngl as mgl
 import numpy as np
 from objects.object import Object
 
-class Orbit(Object):
-    __slots__=["position", "eccentricity"]
+### VARIABLES GLOBALS ###
+ORBIT_COLOR = (1.0, 1.0, 1.0)  # RGB blanc
+# Longitud aproximada (en píxels) de cada segment de l'el·lipse a la pantalla
+ORBIT_SEGMENT_PIXELS = 8
+# Límits de punts per òrbita
+ORBIT_MIN_POINTS = 64
+ORBIT_MAX_POINTS = 4096
 
-    """Classe filla d'Objecte. Crea les òrbites dels planetes (traça el·lipses del seu moviment).
+class OrbitBatch(Object):
+    """Classe filla d'Objecte. Traça les òrbites (el·lipses) de tots els planetes amb una sola crida instanciada.
+    Cada instància és una òrbita (a, e, color) i els punts es generen al vertex shader a partir de gl_VertexID
     """
-    def __init__(self, app, shader, texture, info, position, eccentricity):
-        """Inicialització de la classe Orbit
+    __slots__ = ("orbits",)
+
+    def __init__(self, app, shader, orbits):
+        """Inicialització de la classe OrbitBatch
 
         Args:
-            position (glm.vec3): Posició del planeta
-            eccentricity (float): Excentritat de l'el·lipse
+            orbits (list): Llista de tuples (semieix major, excentricitat, color RGB) de cada òrbita
         """
-        self.position = position
-        self.eccentricity = eccentricity
-        super().__init__(app, shader, texture, info)
+        self.orbits = np.array([(a, e, *color) for a, e, color in orbits], dtype='f4')
+        super().__init__(app, shader, None, [0, 0, 0])
 
     def on_init(self):
-        """Post-inicialització de la classe Orbit.
+        """Post-inicialització de la classe OrbitBatch.
         """
-        self.shader['m_proj'].write(self.app.camera.m_proj)
         self.shader['m_view'].write(self.app.camera.m_view)
         self.shader['m_model'].write(self.m_model)
-        orbit_color = glm.vec3(1.0, 1.0, 1.0)  # RGB blanc
-        self.shader['orbit_color'].write(orbit_color)
 
-    def get_vao(self):
-        """Obtenció VAO òrbites
+    def get_data(self):
+        """Dades per instància de les òrbites
+
+        Returns:
+            np.array: Semieix major, excentricitat i color de cada òrbita
         """
-        return self.ctx.vertex_array(self.shader, [(self.vbo, '3f', 'in_position')])
-    
-    def render(self):
-        """Renderització del VAO
+        return self.orbits
+
+    def get_vao(self):
+        """Obtenció VAO òrbites. No té atributs per vèrtex, només per instància
         """
-        self.vao.render(mgl.LINE_LOOP) 
+        return self.ctx.vertex_array(self.shader, [(self.vbo, '2f 3f/i', 'in_orbit', 'in_color')])
+
+    def point_count(self):
+        """Nombre de punts per òrbita segons la mida a la pantalla de l'òrbita més gran.
+        S'arrodoneix a una potència de 2 perquè no canviï a cada frame
 
-    def get_data(self, num_points = 200):
-        """Genera els punts de la òrbita del planeta al voltant del sol.
-    
-        Args:
-            num_points (int): Nombre de punts a traçar l'el·lipse
-        
         Returns:
-            np.array: Array amb els punts de la òrbita
+            int: Punts de cada el·lipse
         """
-        # Paràmetres de la òrbita
-        a = glm.length(glm.vec2(self.position.x, self.position.z))  # Semieix major
-        b = a * (1 - self.eccentricity ** 2) ** 0.5  # Semieix menor
+        camera = self.app.camera
+        a = self.orbits[:, 0]
+        e = self.orbits[:, 1]
+        # Distància aproximada de la càmera a l'el·lipse (centrada a -a*e sobre l'eix X)
+        horizontal = np.hypot(camera.position.x + a * e, camera.position.z)
+        distance = np.maximum(np.hypot(horizontal - a, camera.position.y), 1e-3)
+        pixels = a * camera.m_proj[1][1] * self.app.WIN_SIZE[1] / (2 * distance)
+        points = 2 * np.pi * pixels.max() / ORBIT_SEGMENT_PIXELS
+        points = 2 ** int(np.ceil(np.log2(max(points, 1))))
+        return int(np.clip(points, ORBIT_MIN_POINTS, ORBIT_MAX_POINTS))
+
+    def enqueue(self, queue):
+        """Afegir totes les òrbites a la cua de renderització (no utilitzen textura)
 
-        focal_distance = a * self.eccentricity  # Distancia del centro al foco
-        orbit_points = []
+        Args:
+            queue (RenderQueue): Cua de renderització del frame
+        """
+        points = self.point_count()
+        queue.submit(self.shader, None, self.vao, {"points": np.int32(points)}, mgl.LINE_LOOP,
+                     instances=len(self.orbits), vertices=points)
 
-        for i in range(num_points):
-            theta = 2 * np.pi * i / num_points  # Ángulo en radianes
-            x = a * np.cos(theta) - focal_distance
-            z = b * np.sin(theta)
-            orbit_points.append((x, 0, z))
+    def bounding_sphere(self):
+        """Les òrbites envolten el sol, no es descarten
 
-        return np.array(orbit_points, dtype='f4')
-    
\ No newline at end of file
+        Returns:
+            None: L'objecte no es pot descartar
+        """
+        return None
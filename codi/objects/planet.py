@@ -10,7 +10,8 @@ class Planet(Object):
                "actual_pos",
                "velocity",
                "inclination",
-               "eccentricity")
+               "eccentricity",
+               "ephemeris_key")
     def __init__(self, app, shader, texture, info, size, position, velocity, inclination, eccentricity):
         """Inicialització de la classe Planet. Tindrà els atributs de Object i els següents
 
@@ -27,7 +28,9 @@ class Planet(Object):
         self.velocity = velocity
         self.inclination = inclination
         self.eccentricity = eccentricity
+        self.ephemeris_key = None
         super().__init__(app, shader, texture, info)
+        self.enable_lod()
         
     def get_model_matrix(self):
         """Obtenció de la model matrix
@@ -39,26 +42,42 @@ class Planet(Object):
         m_model = glm.translate(m_model, self.original_pos)   
         return m_model
             
-    def get_data(self):
+    def get_data(self, lat=None, lon=None):
         """Obtenció de les dades per crear l'esfera
 
+        Args:
+            lat (int, optional): Nombre de paral·lels. Defaults to None (self.lat).
+            lon (int, optional): Nombre de meridians. Defaults to None (self.lon).
+
         Returns:
             np.darray: Posicions dels vèrtex i coordenades textura de l'esfera
         """
-        return self.create_sphere(False)
+        return self.create_sphere(False, lat, lon)
     
-    def move(self):
+    def update(self):
         """Actualitzar l'òrbita dels planetes
         """
         self.rotate_sun()
         self.rotate_self()
-        
-    def render(self):
-        """Renderització del VAO i rotació dels planetes
+        self.m_normal = self.get_normal_matrix()
+
+    def upload(self):
+        """Preparar la matriu model i la matriu normal per a la cua de renderització.
+        El programa és compartit, els uniforms s'escriuen just abans de dibuixar l'objecte
         """
-        self.texture.use()
-        self.vao.render()    
+        self.uniforms = {"m_model": self.m_model, "m_normal": self.m_normal}
+
+    def register_ephemeris(self, ephemeris, key):
+        """Registrar l'òrbita del planeta a les efemèrides
 
+        Args:
+            ephemeris (Ephemeris): Efemèrides de l'aplicació
+            key (str): Identificador del planeta dins les efemèrides
+        """
+        a = glm.length(glm.vec2(self.original_pos.x, self.original_pos.z))
+        ephemeris.add_orbit(key, a, self.eccentricity, self.velocity * 0.055, self.original_pos.y)
+        self.ephemeris_key = key
+        
     def rotate_self(self):
         """Rotació del planeta sobre sí mateix.
         """        
@@ -70,7 +89,6 @@ class Planet(Object):
         inclined_axis = glm.normalize(inclined_axis)
 
         self.m_model = glm.rotate(self.m_model, self.app.time*self.velocity*20, inclined_axis)
-        self.shader['m_model'].write(self.m_model)
         
     def rotate_sun(self):
         """Rotació del planeta sobre el sol.
@@ -78,6 +96,15 @@ class Planet(Object):
         # Crear una matriz de transformación inicial (identidad)
         m_model = glm.mat4()
 
+        # Posició precalculada a les efemèrides (si el temps està cobert)
+        if self.ephemeris_key is not None:
+            new_position = self.app.ephemeris.position(self.ephemeris_key, self.app.time)
+            if new_position is not None:
+                self.actual_pos = new_position
+                m_model = glm.translate(m_model, new_position)
+                self.m_model = glm.scale(m_model, self.size)
+                return
+
         # Semieje mayor y menor basados en la distancia inicial del planeta al Sol
         a = glm.length(glm.vec2(self.original_pos.x, self.original_pos.z))  # La magnitud en XZ como semieje mayor
         b = a * (1 - self.eccentricity ** 2) ** 0.5 # Semieje menor (ajústalo según el grado de excentricidad que desees)
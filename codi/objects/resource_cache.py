@@ -0,0 +1,75 @@
+from projection import Projection
+
+
+class ResourceCache:
+    """Programes i textures compartits entre objectes, amb comptador de referències.
+    Els objectes amb els mateixos shaders o la mateixa imatge reutilitzen el mateix recurs de la GPU,
+    així la cua de renderització pot agrupar-los i estalviar canvis d'estat
+    """
+    __slots__ = (
+        "ctx",
+        "resources",
+        "keys",
+    )
+
+    def __init__(self, ctx):
+        """Inicialització de la classe ResourceCache
+
+        Args:
+            ctx (mgl.Context): Context de ModernGL
+        """
+        self.ctx = ctx
+        # clau: [recurs, referències]
+        self.resources = {}
+        # id(recurs): clau
+        self.keys = {}
+
+    def get(self, key, create):
+        """Obtenir un recurs compartit, creant-lo si encara no existeix
+
+        Args:
+            key (tuple): Clau que identifica el recurs
+            create (callable): Funció sense arguments que crea el recurs
+
+        Returns:
+            mgl.Program | mgl.Texture: Recurs compartit
+        """
+        entry = self.resources.get(key)
+        if entry is None:
+            entry = self.resources[key] = [create(), 0]
+            self.keys[id(entry[0])] = key
+        entry[1] += 1
+        return entry[0]
+
+    def program(self, vertex_shader, fragment_shader):
+        """Obtenir un programa compartit
+
+        Args:
+            vertex_shader (str): Codi del vertex shader
+            fragment_shader (str): Codi del fragment shader
+
+        Returns:
+            mgl.Program: Programa compartit
+        """
+        # El bloc Projection (matriu de projecció) s'enllaça amb el uniform buffer compartit
+        return self.get(("program", vertex_shader, fragment_shader),
+                        lambda: Projection.bind(self.ctx.program(vertex_shader=vertex_shader,
+                                                                 fragment_shader=fragment_shader)))
+
+    def release(self, resource):
+        """Alliberar una referència d'un recurs. El recurs s'allibera quan ningú més l'utilitza.
+        Els recursos que no són de la memòria cau s'alliberen directament
+
+        Args:
+            resource (mgl.Program | mgl.Texture): Recurs a alliberar
+        """
+        key = self.keys.get(id(resource))
+        if key is None:
+            resource.release()
+            return
+        entry = self.resources[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self.resources[key]
+            del self.keys[id(resource)]
+            resource.release()
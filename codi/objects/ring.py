@@ -1,8 +1,8 @@
 import numpy as np
 import moderngl as mgl
 from objects.object import Object
+from objects.instance_buffer import InstanceBuffer
 import glm
-from PIL import Image
 
 class RingBatch(Object):
     """Classe que crea els anells de Saturn, heretat de la classe Objecte
@@ -48,8 +48,8 @@ class RingBatch(Object):
         """Post-inicialització de la classe
         """
         self.shader['m_model'].write(self.m_model)
+        self.uniforms = {"m_model": self.m_model}
         self.shader['m_view'].write(self.app.camera.m_view)
-        self.shader['m_proj'].write(self.app.camera.m_proj)
 
     def get_data(self):
         """Obtenció de les dades dels anells 
@@ -86,7 +86,9 @@ class RingBatch(Object):
         self.velocity_rings = np.linspace(self.velocity_planet, self.velocity_planet/100, self.num_instances).astype('f4')
         self.instance_ids = np.arange(self.num_instances, dtype='f4')
         # Crear un buffer para instancias
-        self.model_matrix_buffer = self.ctx.buffer(reserve=self.num_instances * 64)
+        # Ring buffer de matrius de rotació (identitat inicial, només canvien les columnes de cos i sin)
+        self.model_matrix_buffer = InstanceBuffer(self.ctx, (self.num_instances, 16),
+                                                  initial=np.tile(np.eye(4, dtype='f4').flatten(), self.num_instances))
         self.instance_buffer = self.ctx.buffer(self.radii.tobytes())
         self.instance_id_buffer = self.ctx.buffer(self.instance_ids.tobytes())  # Buffer para identificadores de instancia
 
@@ -95,7 +97,7 @@ class RingBatch(Object):
             [(self.vbo, '3f 2f', 'in_position', 'in_texcoord'),
              (self.instance_buffer, '1f/i', 'instance_radius'),
              (self.instance_id_buffer, '1f/i', 'instance_id'),
-             (self.model_matrix_buffer, '16f/i', 'model_matrix')]
+             (self.model_matrix_buffer.buffer, '16f/i', 'model_matrix')]
         )
 
     def load_texture(self, filepath):
@@ -107,25 +109,50 @@ class RingBatch(Object):
         Returns:
             mgl.texture: Textura
         """
-        image = Image.open(filepath).transpose(Image.FLIP_TOP_BOTTOM)
-        texture = self.ctx.texture(image.size, 4, image.tobytes())
+        pixels = self.app.texture_cache.load(filepath, 4, mirror=False)
+        texture = self.ctx.texture((pixels.shape[1], pixels.shape[0]), 4, pixels)
         texture.filter = (mgl.LINEAR_MIPMAP_LINEAR, mgl.LINEAR)
         texture.build_mipmaps()
         texture.repeat_x = False
         texture.repeat_y = False
         return texture
     
-    def move(self):
+    def update(self):
         """Actualitzar l'òrbita dels anells
         """
         self.rotate_sun()
         self.rotate_ring()
+
+    def upload(self):
+        """Pujar les matrius de rotació dels anells a la GPU i preparar la matriu model per a la cua
+        """
+        self.uniforms = {"m_model": self.m_model}
+        self.model_matrix_buffer.upload()
+
+    def destroy(self):
+        """Neteja de les variables després d'acabar l'execució del programa
+        """
+        super().destroy()
+        self.model_matrix_buffer.release()
+        self.instance_buffer.release()
+        self.instance_id_buffer.release()
         
-    def render(self):
-        """Renderització del VAO
+    def enqueue(self, queue):
+        """Afegir els anells a la cua de renderització
+
+        Args:
+            queue (RenderQueue): Cua de renderització del frame
         """
-        self.texture.use()
-        self.vao.render(mgl.LINES, instances = self.num_instances)
+        queue.submit(self.shader, self.texture, self.vao, self.uniforms, mgl.LINES, self.num_instances)
+
+    def bounding_sphere(self):
+        """Esfera contenidora dels anells, centrada al planeta
+
+        Returns:
+            (glm.vec3, float): Centre i radi de l'esfera
+        """
+        # La còpia del frame que es dibuixa (upload), no la que calcula el fil de simulació
+        return glm.vec3(self.uniforms["m_model"][3]), float(np.abs(self.radii).max())
 
     def rotate_sun(self):
         """Rotació dels anells respecte el Sol
@@ -148,22 +175,17 @@ class RingBatch(Object):
         m_model = glm.translate(m_model, glm.vec3(x, 0, z))
         m_model = glm.rotate(m_model, glm.radians(27), glm.vec3(0, 0, 1))
         self.m_model = m_model
-        self.shader['m_model'].write(self.m_model)
 
     def rotate_ring(self):
         """Rotació dels anells sobre ells mateixos
         """
-        # Crear un array para almacenar las matrices de modelo de cada anillo
-        model_matrices = np.zeros((self.num_instances, 16), dtype='f4')
-
-        for i in range(self.num_instances):
-            # Calcular el ángulo de rotación basado en el tiempo y la velocidad del anillo
-            angle = self.app.time * self.velocity_rings[i]
-
-            # Crear una matriz de rotación para este anillo
-            rotation_matrix = glm.rotate(glm.mat4(), angle, glm.vec3(0, 1, 0))
-
-            # Convertir la matriz glm a un array numpy y almacenarla
-            model_matrices[i] = np.array(rotation_matrix).flatten()
-
-        self.model_matrix_buffer.write(model_matrices.tobytes())
\ No newline at end of file
+        # Angle de rotació de cada anell segons el temps i la seva velocitat
+        angles = self.app.time * self.velocity_rings
+
+        # Matrius de rotació respecte l'eix Y (mateixa disposició que np.array(glm.rotate(...)).flatten())
+        model_matrices = self.model_matrix_buffer.back
+        np.cos(angles, out=model_matrices[:, 0])
+        np.sin(angles, out=model_matrices[:, 2])
+        np.negative(model_matrices[:, 2], out=model_matrices[:, 8])
+        model_matrices[:, 10] = model_matrices[:, 0]
+        self.model_matrix_buffer.swap()
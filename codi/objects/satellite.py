@@ -5,7 +5,7 @@ from objects.object import Object
 class Satellite(Object):
     """Classe filla d'Objecte. Crea els Satèl·lits naturals.
     """
-    __slots__=["size", "position_planet", "position_satellite", "velocity_planet", "velocity_satellite", "inclination", "eccentricity"]
+    __slots__=["size", "position_planet", "position_satellite", "velocity_planet", "velocity_satellite", "inclination", "eccentricity", "ephemeris_key", "planet_ephemeris_key"]
     
     def __init__(self, app, shader, texture, info, size, position_planet, position_satellite, velocity_planet, velocity_satellite, inclination, eccentricity):
         """Inicialització de la classe Planet. Tindrà els atributs de Object i els següents
@@ -27,7 +27,10 @@ class Satellite(Object):
         self.velocity_satellite = velocity_satellite
         self.inclination = inclination
         self.eccentricity = eccentricity
+        self.ephemeris_key = None
+        self.planet_ephemeris_key = None
         super().__init__(app, shader, texture, info)
+        self.enable_lod()
         
     def get_model_matrix(self):
         """Obtenció de la model matrix
@@ -39,25 +42,46 @@ class Satellite(Object):
         m_model = glm.translate(m_model, self.position_satellite)   
         return m_model
             
-    def get_data(self):
+    def get_data(self, lat=None, lon=None):
         """Obtenció de les dades per crear l'esfera
+        Args:
+            lat (int, optional): Nombre de paral·lels. Defaults to None (self.lat).
+            lon (int, optional): Nombre de meridians. Defaults to None (self.lon).
+
         Returns:
             np.darray: Posicions i coordenades textura de l'esfera
         """
-        return self.create_sphere(False)
+        return self.create_sphere(False, lat, lon)
     
-    def move(self):
+    def update(self):
         """Actualitzar la posició del satèl·lit 
         """
         planet_position = self.rotate_sun()
         self.rotate_planet(planet_position)
         self.rotate_self()
+        self.m_normal = self.get_normal_matrix()
+
+    def upload(self):
+        """Preparar la matriu model i la matriu normal per a la cua de renderització.
+        El programa és compartit, els uniforms s'escriuen just abans de dibuixar l'objecte
+        """
+        self.uniforms = {"m_model": self.m_model, "m_normal": self.m_normal}
+
+    def register_ephemeris(self, ephemeris, key, planet_key):
+        """Registrar l'òrbita del satèl·lit respecte el planeta a les efemèrides. L'òrbita respecte el Sol
+        és la del planeta, que ja hi està registrada
 
-    def render(self):
-        """Renderització del VAO i rotació dels planetes
+        Args:
+            ephemeris (Ephemeris): Efemèrides de l'aplicació
+            key (str): Identificador del satèl·lit dins les efemèrides
+            planet_key (str): Identificador del seu planeta dins les efemèrides
         """
-        self.texture.use()
-        self.vao.render()    
+        self.planet_ephemeris_key = planet_key
+
+        distance = self.position_satellite - self.position_planet
+        a_planet = glm.length(glm.vec2(distance.x, distance.z))
+        ephemeris.add_orbit(key, a_planet, self.eccentricity, self.velocity_satellite)
+        self.ephemeris_key = key
 
     def rotate_self(self):
         """Rotació del satèl·lit sobre sí mateix.
@@ -70,11 +94,18 @@ class Satellite(Object):
         inclined_axis = glm.normalize(inclined_axis)
 
         self.m_model = glm.rotate(self.m_model, self.app.time*self.velocity_planet*20, inclined_axis)
-        self.shader['m_model'].write(self.m_model)
     
     def rotate_planet(self, planet_position):
         """Rotació del satèl·lit sobre el planeta.
         """
+        # Posició precalculada a les efemèrides (si el temps està cobert)
+        if self.ephemeris_key is not None:
+            relative_position = self.app.ephemeris.position(self.ephemeris_key, self.app.time)
+            if relative_position is not None:
+                self.m_model = glm.translate(glm.mat4(), relative_position + planet_position)
+                self.m_model = glm.scale(self.m_model, self.size)
+                return
+
         distance = self.position_satellite - self.position_planet
         a = glm.length(glm.vec2(distance.x, distance.z))
         b = a * (1 - self.eccentricity ** 2) ** 0.5  # Excentricidad de la órbita del satélite
@@ -98,6 +129,12 @@ class Satellite(Object):
         Returns: 
             glm.vec3: Posició del satèl·lit en coordenades 3D, després de rotar respecte el Sol
         """
+        # Posició precalculada a les efemèrides (si el temps està cobert)
+        if self.planet_ephemeris_key is not None:
+            planet_position = self.app.ephemeris.position(self.planet_ephemeris_key, self.app.time)
+            if planet_position is not None:
+                return planet_position
+
         a = glm.length(glm.vec2(self.position_planet.x, self.position_planet.z))
         b = a * (1 - self.eccentricity ** 2) ** 0.5
         theta = self.app.time * self.velocity_planet * 0.055 # Ajusta la velocidad de la órbita
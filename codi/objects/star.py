@@ -3,6 +3,7 @@ import moderngl as mgl
 import numpy as np
 
 from objects.object import Object
+from projection import Projection
 
 class StarBatch(Object):
     """Classe filla d'Objecte. Crea les estrelles que envoltarà tot el Sistema Solar.
@@ -11,6 +12,7 @@ class StarBatch(Object):
         "positions",
         "constellations",
         "constellations_shader",
+        "constellations_vbo",
         "constellations_vao",
     )
     def __init__(self, app, shader, texture, info, positions, constellations=True, **kwargs):
@@ -25,6 +27,7 @@ class StarBatch(Object):
         self.positions = positions
         self.constellations = constellations
         self.constellations_shader = None
+        self.constellations_vbo = None
         self.constellations_vao = None
         super().__init__(app, shader, texture, info)
         
@@ -34,10 +37,10 @@ class StarBatch(Object):
                 "ERROR: Bad argument format provided for shaders constellation correct is List[vertex: str, fragment: str]"
             assert len(kwargs["constellations_shaders"]) == 2, "ERRORt: too many/few arguments is shaders list"
         
-        self.constellations_shader = self.ctx.program(
+        self.constellations_shader = Projection.bind(self.ctx.program(
             kwargs["constellations_shaders"][0], #vertex_shader
             kwargs["constellations_shaders"][1], #fragment_shader
-        )
+        ))
 
         assert self.constellations_shader , "FATAL ERROR"
 
@@ -58,7 +61,6 @@ class StarBatch(Object):
         """Post-inicialització de la classe StarBatch
         """
         # Essential for viewing
-        self.shader['m_proj'].write(self.app.camera.m_proj)
         self.shader['m_view'].write(self.app.camera.m_view)
         self.shader['m_model'].write(self.m_model)
 
@@ -73,7 +75,6 @@ class StarBatch(Object):
     def on_init_2(self):
         """Post-Post-inicialització de la classe StarBatch
         """
-        self.constellations_shader['m_proj'].write(self.app.camera.m_proj)
         self.constellations_shader['m_view'].write(self.app.camera.m_view)
         self.constellations_shader['m_model'].write(self.m_model)
     
@@ -119,6 +120,15 @@ class StarBatch(Object):
             self.texture.use()
             self.constellations_vao.render(mgl.TRIANGLES)
 
+    def destroy(self):
+        """Neteja de les variables després d'acabar l'execució del programa
+        """
+        super().destroy()
+        if self.constellations_vao is not None:
+            self.constellations_vao.release()
+            self.constellations_vbo.release()
+        self.constellations_shader.release()
+
     def get_constellations_vao(self):
         """ 
         Crea un nou vao que conté les estrelles que formen constelacions
@@ -167,11 +177,12 @@ class StarBatch(Object):
             indices.append((i,   i+1, i+2))
             indices.append((i+2, i+3, i+1))
         
-        consts_vbo = self.ctx.buffer(np.array([vertices[i] for idx in indices for i in idx], dtype='f4').tobytes())
+        self.constellations_vbo = self.ctx.buffer(
+            np.array([vertices[i] for idx in indices for i in idx], dtype='f4').tobytes())
 
         return self.ctx.vertex_array(
             self.constellations_shader,
-            [(consts_vbo, '3f 2f', 'in_position', 'in_texcoords')]
+            [(self.constellations_vbo, '3f 2f', 'in_position', 'in_texcoords')]
         )
 
     def get_data(self):
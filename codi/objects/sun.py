@@ -3,16 +3,22 @@ from objects.object import Object
 class Sun(Object): 
     """Classe filla d'Objecte. Crea el Sol. Es caracteritza per tenir les normals invertides de signe (per termes d'il·luminació)
     """
-    def render(self):
-        """Renderització del VAO
+    inverted_normals = True
+
+    def __init__(self, app, shader, texture, info):
+        """Inicialització de la classe Sun, amb nivells de detall segons la distància
         """
-        self.texture.use()
-        self.vao.render()
+        super().__init__(app, shader, texture, info)
+        self.enable_lod()
 
-    def get_data(self):
+    def get_data(self, lat=None, lon=None):
         """Obtenció de les dades que generen el sol 
 
+        Args:
+            lat (int, optional): Nombre de paral·lels. Defaults to None (self.lat).
+            lon (int, optional): Nombre de meridians. Defaults to None (self.lon).
+
         Returns:
             np.darray: Posicions dels vèrtexs i coordenades textures
         """
-        return self.create_sphere(True)
\ No newline at end of file
+        return self.create_sphere(self.inverted_normals, lat, lon)
@@ -0,0 +1,159 @@
+import moderngl as mgl
+from PIL import Image
+
+### VARIABLES GLOBALS ###
+# Qualitat de les textures: mida comuna (amplada, alçada) de les capes i si la textura del cos que segueix
+# la FollowCamera es carrega a resolució completa. Les textures equirectangulars són 2:1
+TEXTURE_TIERS = {
+    "low": ((512, 256), False),
+    "medium": ((1024, 512), False),
+    "high": ((2048, 1024), True),
+}
+TEXTURE_QUALITY = "high"
+TEXTURE_ARRAY_SIZE = TEXTURE_TIERS[TEXTURE_QUALITY][0]
+
+
+class TextureArray:
+    """Empaquetat de les textures dels cossos en un sol sampler2DArray, amb una capa per imatge.
+    Totes les capes tenen la mateixa mida i mipmaps, així els cossos es poden dibuixar amb una sola textura
+    lligada i cada cos només guarda l'índex de la seva capa. Les capes es pugen d'una en una (load_layer)
+    perquè la càrrega es pugui repartir entre frames, i els mipmaps es generen al final (build).
+    Les capes són variants reduïdes de les imatges (la memòria cau en desa una per mida). Si es demana
+    (stream), la imatge d'una capa es carrega a resolució completa en una textura a part (detail)
+    """
+    __slots__ = (
+        "ctx",
+        "size",
+        "layers",
+        "texture",
+        "detail",
+        "detail_layer",
+        "requested",
+    )
+
+    def __init__(self, ctx, paths, size=TEXTURE_ARRAY_SIZE):
+        """Inicialització de la classe TextureArray. Reserva les capes, encara buides
+
+        Args:
+            ctx (mgl.Context): Context de ModernGL
+            paths (list): Paths de les imatges (els repetits comparteixen capa)
+            size (tuple, optional): Mida de cada capa en píxels. Defaults to TEXTURE_ARRAY_SIZE.
+        """
+        self.ctx = ctx
+        self.size = tuple(size)
+        # path: índex de la capa
+        self.layers = {}
+        for path in paths:
+            self.layers.setdefault(path, len(self.layers))
+
+        self.texture = self.ctx.texture_array((*self.size, max(len(self.layers), 1)), 3)
+        # Textura a resolució completa d'una capa (-1 si no n'hi ha cap) i (capa, path) que s'està carregant
+        self.detail = None
+        self.detail_layer = -1
+        self.requested = None
+
+    def load_layer(self, cache, path):
+        """Pujar una capa directament des de la memòria cau de textures (mmap), ja girada i escalada
+
+        Args:
+            cache (TextureCache): Memòria cau de textures
+            path (str): Path de la imatge
+        """
+        self.texture.write(cache.load(path, 3, self.size), viewport=(0, 0, self.layers[path], *self.size, 1))
+
+    def build(self):
+        """Generar els mipmaps i els paràmetres de mostreig un cop pujades totes les capes
+        """
+        self.texture.filter = (mgl.LINEAR_MIPMAP_LINEAR, mgl.LINEAR)
+        self.texture.build_mipmaps()
+        self.texture.repeat_x = False
+        self.texture.repeat_y = False
+
+    def stream(self, cache, pool, layer):
+        """Demanar la imatge d'una capa a resolució completa. Es decodifica en un fil de treball i
+        update() la puja quan està llesta; mentrestant la capa es continua dibuixant amb la variant reduïda
+
+        Args:
+            cache (TextureCache): Memòria cau de textures
+            pool (ThreadPoolExecutor): Fils de treball
+            layer (int | None): Capa a carregar a resolució completa. None allibera la textura actual
+        """
+        if self.requested is not None:
+            if self.requested[0] == layer:
+                return
+            # La capa demanada abans ja no cal
+            cache.discard(self.requested[1], 3)
+            self.requested = None
+        if layer == self.detail_layer:
+            return
+
+        self.release_detail()
+        if layer is None:
+            return
+
+        path = next(path for path, index in self.layers.items() if index == layer)
+        # Només val la pena si la imatge és més gran que la capa (llegeix només la capçalera)
+        with Image.open(path) as image:
+            if image.size[0] <= self.size[0]:
+                return
+        cache.prefetch(pool, path, 3)
+        self.requested = (layer, path)
+
+    def update(self, cache):
+        """Pujar la textura a resolució completa demanada amb stream() si el fil de treball ja l'ha carregat
+
+        Args:
+            cache (TextureCache): Memòria cau de textures
+
+        Returns:
+            bool: True si s'ha pujat una textura nova
+        """
+        if self.requested is None:
+            return False
+        layer, path = self.requested
+        if not cache.ready(path, 3):
+            return False
+
+        pixels = cache.load(path, 3)
+        self.release_detail()
+        self.detail = self.ctx.texture((pixels.shape[1], pixels.shape[0]), 3, pixels)
+        self.detail.filter = (mgl.LINEAR_MIPMAP_LINEAR, mgl.LINEAR)
+        self.detail.build_mipmaps()
+        self.detail.repeat_x = False
+        self.detail.repeat_y = False
+        self.detail_layer = layer
+        self.requested = None
+        return True
+
+    def release_detail(self):
+        """Alliberar la textura a resolució completa
+        """
+        if self.detail is not None:
+            self.detail.release()
+        self.detail = None
+        self.detail_layer = -1
+
+    def layer(self, path):
+        """Índex de la capa d'una imatge
+
+        Args:
+            path (str): Path de la imatge
+
+        Returns:
+            int: Capa de la imatge dins de l'array
+        """
+        return self.layers[path]
+
+    def __len__(self):
+        """Nombre de capes
+
+        Returns:
+            int: Imatges diferents empaquetades
+        """
+        return len(self.layers)
+
+    def release(self):
+        """Alliberar les textures de la GPU
+        """
+        self.texture.release()
+        self.release_detail()
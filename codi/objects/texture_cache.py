@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+import re
+import threading
+
+import numpy as np
+from PIL import Image
+
+### VARIABLES GLOBALS ###
+# Directori on es desen les textures ja decodificades (es genera la primera execució)
+TEXTURE_CACHE_DIR = "textures/cache"
+
+
+class TextureCache:
+    """Memòria cau de textures decodificades. La primera vegada es decodifica la imatge amb PIL, es gira
+    i s'escala, i es desa en un fitxer .npy amb els píxels en l'ordre que espera OpenGL. Les execucions
+    següents obren el fitxer amb mmap i el pugen directament, sense descomprimir el JPEG.
+    Les textures es poden avançar (prefetch) en fils de treball mentre el fil principal continua.
+    En desar una entrada nova s'esborren les de la mateixa imatge que no s'han fet servir en aquesta execució
+    """
+    __slots__ = (
+        "directory",
+        "hits",
+        "misses",
+        "pending",
+        "used",
+        "lock",
+    )
+
+    def __init__(self, directory=TEXTURE_CACHE_DIR):
+        """Inicialització de la classe TextureCache
+
+        Args:
+            directory (str, optional): Directori de la memòria cau. Defaults to TEXTURE_CACHE_DIR (None per desactivar-la).
+        """
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        # (path, canals, mida, gir): Future amb els píxels que s'estan carregant en un fil de treball
+        self.pending = {}
+        # Fitxers de la memòria cau llegits o desats en aquesta execució (no s'esborren)
+        self.used = set()
+        # read() s'executa als fils de treball: protegeix els comptadors i self.used
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def decode(filepath, components=3, size=None, mirror=True):
+        """Decodificar una imatge amb l'orientació de les textures de l'engine
+
+        Args:
+            filepath (str): Path de la imatge
+            components (int, optional): Canals de la textura (3 RGB o 4 RGBA). Defaults to 3.
+            size (tuple, optional): Mida final en píxels. Defaults to None (la de la imatge).
+            mirror (bool, optional): Si es True, també es gira horitzontalment (esferes). Defaults to True.
+
+        Returns:
+            np.array: Píxels (alçada, amplada, canals) en uint8
+        """
+        with Image.open(filepath) as image:
+            image = image.convert("RGBA" if components == 4 else "RGB")
+        if size is not None and image.size != tuple(size):
+            image = image.resize(tuple(size), Image.LANCZOS)
+        image = image.transpose(Image.FLIP_TOP_BOTTOM)
+        if mirror:
+            image = image.transpose(Image.FLIP_LEFT_RIGHT)
+        return np.asarray(image, dtype='u1')
+
+    def signature(self, filepath, components, size, mirror):
+        """Signatura de la imatge d'origen i dels paràmetres, per invalidar la memòria cau
+
+        Args:
+            filepath (str): Path de la imatge
+            components (int): Canals de la textura
+            size (tuple | None): Mida final en píxels
+            mirror (bool): Gir horitzontal
+
+        Returns:
+            str: Hash del path, la data de modificació, la mida del fitxer i els paràmetres
+        """
+        stat = os.stat(filepath)
+        meta = [os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size, components,
+                None if size is None else list(size), mirror]
+        return hashlib.sha1(json.dumps(meta).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def source_name(filepath):
+        """Prefix dels fitxers de la memòria cau d'una imatge: el nom i un hash del path, per distingir
+        imatges amb el mateix nom en directoris diferents
+
+        Args:
+            filepath (str): Path de la imatge
+
+        Returns:
+            str: Prefix dels fitxers .npy
+        """
+        name = os.path.splitext(os.path.basename(filepath))[0]
+        return f"{name}-{hashlib.sha1(os.path.abspath(filepath).encode()).hexdigest()[:8]}"
+
+    def cache_path(self, filepath, components=3, size=None, mirror=True):
+        """Path del fitxer de la memòria cau d'una imatge
+
+        Args:
+            filepath (str): Path de la imatge
+            components (int, optional): Canals de la textura. Defaults to 3.
+            size (tuple, optional): Mida final en píxels. Defaults to None.
+            mirror (bool, optional): Gir horitzontal. Defaults to True.
+
+        Returns:
+            str: Path del fitxer .npy
+        """
+        signature = self.signature(filepath, components, size, mirror)
+        return os.path.join(self.directory, f"{self.source_name(filepath)}-{signature}.npy")
+
+    def prune(self, filepath):
+        """Esborrar les entrades d'una imatge que no s'han fet servir en aquesta execució: versions anteriors
+        de la imatge, paràmetres que ja no es demanen i fitxers amb el format antic (nom-signatura.npy)
+
+        Args:
+            filepath (str): Path de la imatge
+        """
+        prefix = f"{self.source_name(filepath)}-"
+        name = os.path.splitext(os.path.basename(filepath))[0]
+        legacy = re.compile(rf"{re.escape(name)}-[0-9a-f]{{16}}\.npy")
+        with self.lock:
+            used = set(self.used)
+        for entry in os.listdir(self.directory):
+            path = os.path.join(self.directory, entry)
+            stale = (entry.startswith(prefix) and entry.endswith(".npy")) or legacy.fullmatch(entry)
+            if stale and path not in used:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass  # Ja l'ha esborrat un altre fil de treball
+
+    def prefetch(self, pool, filepath, components=3, size=None, mirror=True):
+        """Començar a carregar una textura en un fil de treball. El load() següent amb els mateixos
+        paràmetres n'esperarà el resultat en lloc de tornar-la a decodificar
+
+        Args:
+            pool (ThreadPoolExecutor): Fils de treball
+            filepath (str): Path de la imatge
+            components (int, optional): Canals de la textura (3 RGB o 4 RGBA). Defaults to 3.
+            size (tuple, optional): Mida final en píxels. Defaults to None (la de la imatge).
+            mirror (bool, optional): Si es True, també es gira horitzontalment (esferes). Defaults to True.
+        """
+        key = (filepath, components, None if size is None else tuple(size), mirror)
+        if key not in self.pending:
+            self.pending[key] = pool.submit(self.read, filepath, components, size, mirror)
+
+    def ready(self, filepath, components=3, size=None, mirror=True):
+        """Comprovar si load() pot retornar la textura sense esperar un fil de treball
+
+        Args:
+            filepath (str): Path de la imatge
+            components (int, optional): Canals de la textura. Defaults to 3.
+            size (tuple, optional): Mida final en píxels. Defaults to None.
+            mirror (bool, optional): Gir horitzontal. Defaults to True.
+
+        Returns:
+            bool: False si la textura s'està carregant encara en un fil de treball
+        """
+        future = self.pending.get((filepath, components, None if size is None else tuple(size), mirror))
+        return future is None or future.done()
+
+    def discard(self, filepath, components=3, size=None, mirror=True):
+        """Descartar una textura avançada amb prefetch() que ja no es farà servir
+
+        Args:
+            filepath (str): Path de la imatge
+            components (int, optional): Canals de la textura. Defaults to 3.
+            size (tuple, optional): Mida final en píxels. Defaults to None.
+            mirror (bool, optional): Gir horitzontal. Defaults to True.
+        """
+        future = self.pending.pop((filepath, components, None if size is None else tuple(size), mirror), None)
+        if future is not None:
+            future.cancel()
+
+    def load(self, filepath, components=3, size=None, mirror=True):
+        """Obtenir els píxels d'una textura, de la memòria cau si existeix o decodificant la imatge i desant-la
+
+        Args:
+            filepath (str): Path de la imatge
+            components (int, optional): Canals de la textura (3 RGB o 4 RGBA). Defaults to 3.
+            size (tuple, optional): Mida final en píxels. Defaults to None (la de la imatge).
+            mirror (bool, optional): Si es True, també es gira horitzontalment (esferes). Defaults to True.
+
+        Returns:
+            np.array: Píxels (alçada, amplada, canals), projectats en memòria (mmap) si venen de la memòria cau
+        """
+        future = self.pending.pop((filepath, components, None if size is None else tuple(size), mirror), None)
+        if future is not None:
+            return future.result()
+        return self.read(filepath, components, size, mirror)
+
+    def read(self, filepath, components=3, size=None, mirror=True):
+        """Llegir els píxels de la memòria cau o decodificar la imatge i desar-la. No fa crides a OpenGL,
+        així que es pot executar en un fil de treball
+
+        Args:
+            filepath (str): Path de la imatge
+            components (int, optional): Canals de la textura (3 RGB o 4 RGBA). Defaults to 3.
+            size (tuple, optional): Mida final en píxels. Defaults to None (la de la imatge).
+            mirror (bool, optional): Si es True, també es gira horitzontalment (esferes). Defaults to True.
+
+        Returns:
+            np.array: Píxels (alçada, amplada, canals)
+        """
+        if self.directory is None:
+            return self.decode(filepath, components, size, mirror)
+
+        path = self.cache_path(filepath, components, size, mirror)
+        with self.lock:
+            self.used.add(path)
+        if os.path.exists(path):
+            try:
+                pixels = np.load(path, mmap_mode='r', allow_pickle=False)
+                with self.lock:
+                    self.hits += 1
+                return pixels
+            except (OSError, ValueError):
+                pass  # Fitxer incomplet o corrupte: es torna a generar
+
+        pixels = self.decode(filepath, components, size, mirror)
+        os.makedirs(self.directory, exist_ok=True)
+        # S'escriu a un fitxer temporal perquè una execució interrompuda no deixi un fitxer a mitges
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            np.save(file, pixels, allow_pickle=False)
+        os.replace(temporary, path)
+        self.prune(filepath)
+        with self.lock:
+            self.misses += 1
+        return pixels
+
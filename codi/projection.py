@@ -0,0 +1,51 @@
+### VARIABLES GLOBALS ###
+# Punt d'enllaç del uniform buffer amb la matriu de projecció
+PROJECTION_BINDING = 0
+# Nom del bloc de uniforms als shaders: layout (std140) uniform Projection { mat4 m_proj; };
+PROJECTION_BLOCK = "Projection"
+
+
+class Projection:
+    """Matriu de projecció compartida per tots els programes en un uniform buffer (bloc Projection
+    dels shaders). Quan canvia (per exemple, en redimensionar la finestra) només s'escriu un cop
+    """
+    __slots__ = (
+        "buffer",
+    )
+
+    def __init__(self, ctx, m_proj):
+        """Inicialització de la classe Projection
+
+        Args:
+            ctx (mgl.Context): Context de ModernGL
+            m_proj (glm.mat4): Matriu de projecció inicial
+        """
+        self.buffer = ctx.buffer(m_proj)
+        self.buffer.bind_to_uniform_block(PROJECTION_BINDING)
+
+    @staticmethod
+    def bind(program):
+        """Enllaçar el bloc Projection d'un programa amb el uniform buffer
+
+        Args:
+            program (mgl.Program): Programa (pot no tenir el bloc)
+
+        Returns:
+            mgl.Program: El mateix programa
+        """
+        if PROJECTION_BLOCK in program:
+            program[PROJECTION_BLOCK].binding = PROJECTION_BINDING
+        return program
+
+    def write(self, m_proj):
+        """Actualitzar la matriu de projecció de tots els programes
+
+        Args:
+            m_proj (glm.mat4): Matriu de projecció
+        """
+        self.buffer.write(m_proj)
+
+    def release(self):
+        """Alliberar el uniform buffer
+        """
+        self.buffer.release()
@@ -0,0 +1,74 @@
+class RenderQueue:
+    """Cua de renderització. Els objectes hi afegeixen les seves crides de dibuix i la cua les
+    ordena per (programa, textura, VAO) per fer el mínim de canvis d'estat
+    """
+    __slots__ = (
+        "items",
+        "program_binds",
+        "texture_binds",
+        "uniform_writes",
+        "draws",
+    )
+
+    def __init__(self):
+        """Inicialització de la classe RenderQueue
+        """
+        self.items = []
+        self.reset()
+
+    def submit(self, program, texture, vao, uniforms=None, mode=None, instances=-1, vertices=-1, first=0):
+        """Afegir una crida de dibuix a la cua
+
+        Args:
+            program (mgl.Program): Programa amb què es dibuixa el VAO
+            texture (mgl.Texture | None): Textura a la unitat 0
+            vao (mgl.VertexArray): VAO a dibuixar
+            uniforms (dict, optional): Uniforms propis de l'objecte (nom: valor). Defaults to None.
+            mode (int, optional): Primitiva de ModernGL. Defaults to None (la del VAO).
+            instances (int, optional): Nombre d'instàncies. Defaults to -1 (sense instancing).
+            vertices (int, optional): Nombre de vèrtexs. Defaults to -1 (tots els del VAO).
+            first (int, optional): Primer vèrtex (o índex) a dibuixar. Defaults to 0.
+        """
+        key = (program.glo, texture.glo if texture is not None else 0, vao.glo)
+        self.items.append((key, program, texture, vao, uniforms, mode, instances, vertices, first))
+
+    def reset(self):
+        """Reiniciar els comptadors (a l'inici de cada frame)
+        """
+        self.program_binds = 0
+        self.texture_binds = 0
+        self.uniform_writes = 0
+        self.draws = 0
+
+    def flush(self):
+        """Ordenar i dibuixar totes les crides de la cua, i buidar-la
+        """
+        current_program = None
+        current_texture = None
+        self.items.sort(key=lambda item: item[0])
+        for _, program, texture, vao, uniforms, mode, instances, vertices, first in self.items:
+            # ModernGL activa el programa a cada render(); comptem els canvis reals de programa
+            if program is not current_program:
+                current_program = program
+                self.program_binds += 1
+            if texture is not None and texture is not current_texture:
+                texture.use()
+                current_texture = texture
+                self.texture_binds += 1
+            if uniforms:
+                for name, value in uniforms.items():
+                    program[name].write(value)
+                self.uniform_writes += len(uniforms)
+            vao.render(mode, vertices, first, instances)
+            self.draws += 1
+
+        self.items.clear()
+
+    def __str__(self):
+        """Resum dels comptadors del darrer frame
+
+        Returns:
+            str: Canvis de programa i textura, uniforms escrits i crides de dibuix
+        """
+        return (f"Programes: {self.program_binds} | Textures: {self.texture_binds} | "
+                f"Uniforms: {self.uniform_writes} | Draws: {self.draws}")
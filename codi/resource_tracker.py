@@ -0,0 +1,197 @@
+import os
+import sys
+
+import moderngl as mgl
+
+### VARIABLES GLOBALS ###
+# Mètodes del context que creen recursos de la GPU: tipus de recurs
+TRACKED_METHODS = {
+    "buffer": "buffer",
+    "texture": "texture",
+    "texture_array": "texture",
+    "depth_texture": "texture",
+    "renderbuffer": "texture",
+    "depth_renderbuffer": "texture",
+    "program": "program",
+    "vertex_array": "vao",
+    "simple_vertex_array": "vao",
+    "framebuffer": "framebuffer",
+}
+# Classes que creen recursos per compte d'un altre objecte: el propietari és qui les crida
+TRACKER_HELPERS = ("TrackedContext", "ResourceCache", "InstanceBuffer")
+# Bytes per component de cada dtype de ModernGL
+DTYPE_BYTES = {"f1": 1, "u1": 1, "i1": 1, "f2": 2, "u2": 2, "i2": 2, "f4": 4, "u4": 4, "i4": 4}
+MIPMAP_FILTERS = (mgl.LINEAR_MIPMAP_LINEAR, mgl.LINEAR_MIPMAP_NEAREST,
+                  mgl.NEAREST_MIPMAP_LINEAR, mgl.NEAREST_MIPMAP_NEAREST)
+
+
+class ResourceTracker:
+    """Registre dels recursos de la GPU (buffers, textures, programes, VAOs i framebuffers) creats a través
+    del TrackedContext, amb el propietari (la classe que l'ha creat) i el lloc del codi on s'ha creat.
+    Els recursos alliberats (release) deixen de comptar; els que continuen vius en tancar l'aplicació són fuites
+    """
+    __slots__ = (
+        "resources",
+    )
+
+    def __init__(self):
+        """Inicialització de la classe ResourceTracker
+        """
+        # id(recurs): (tipus, recurs, propietari, lloc)
+        self.resources = {}
+
+    def track(self, kind, resource, owner, site):
+        """Registrar un recurs nou
+
+        Args:
+            kind (str): Tipus de recurs ("buffer", "texture", "program", "vao" o "framebuffer")
+            resource (mgl.Buffer | mgl.Texture | ...): Recurs de ModernGL
+            owner (str): Classe que l'ha creat
+            site (str): Fitxer i línia on s'ha creat
+
+        Returns:
+            mgl.Buffer | mgl.Texture | ...: El mateix recurs
+        """
+        self.resources[id(resource)] = (kind, resource, owner, site)
+        return resource
+
+    @staticmethod
+    def nbytes(resource):
+        """Memòria de la GPU que ocupa un recurs. Els programes i els VAOs no en tenen de pròpia
+
+        Args:
+            resource (mgl.Buffer | mgl.Texture | ...): Recurs de ModernGL
+
+        Returns:
+            int: Bytes (amb la cadena de mipmaps si la textura la fa servir)
+        """
+        if isinstance(resource, mgl.Buffer):
+            return resource.size
+        if isinstance(resource, (mgl.Texture, mgl.TextureArray, mgl.Renderbuffer)):
+            width, height, *layers = resource.size
+            size = width * height * (layers[0] if layers else 1) * resource.components
+            size *= 4 if getattr(resource, "depth", False) else DTYPE_BYTES.get(resource.dtype, 4)
+            if not isinstance(resource, mgl.Renderbuffer) and resource.filter[0] in MIPMAP_FILTERS:
+                size = size * 4 // 3
+            return size
+        return 0
+
+    def live(self):
+        """Recursos que encara no s'han alliberat. Els alliberats s'esborren del registre
+
+        Returns:
+            list: (tipus, recurs, propietari, lloc) de cada recurs viu
+        """
+        self.resources = {key: entry for key, entry in self.resources.items()
+                          if not isinstance(entry[1].mglo, mgl.InvalidObject)}
+        return list(self.resources.values())
+
+    def totals(self):
+        """Recursos vius i memòria per tipus
+
+        Returns:
+            dict: tipus: [nombre de recursos, bytes]
+        """
+        totals = {}
+        for kind, resource, _, _ in self.live():
+            entry = totals.setdefault(kind, [0, 0])
+            entry[0] += 1
+            entry[1] += self.nbytes(resource)
+        return totals
+
+    def report(self, title="Recursos de la GPU"):
+        """Informe dels recursos vius agrupats per propietari i lloc de creació
+
+        Args:
+            title (str, optional): Capçalera de l'informe. Defaults to "Recursos de la GPU".
+
+        Returns:
+            str: Una línia per grup (propietari, lloc, recursos de cada tipus i memòria) i el total
+        """
+        groups = {}
+        for kind, resource, owner, site in self.live():
+            group = groups.setdefault((owner, site), {})
+            entry = group.setdefault(kind, [0, 0])
+            entry[0] += 1
+            entry[1] += self.nbytes(resource)
+
+        lines = [f"{title}: {self}"]
+        for (owner, site), group in sorted(groups.items(), key=lambda item: -sum(n for _, n in item[1].values())):
+            kinds = ", ".join(f"{count} {kind}" for kind, (count, _) in sorted(group.items()))
+            memory = sum(size for _, size in group.values())
+            lines.append(f"\t{owner} ({site}): {kinds} | {memory / 2**20:.2f} MB")
+        return "\n".join(lines)
+
+    def __str__(self):
+        """Resum dels recursos vius
+
+        Returns:
+            str: Memòria total i recursos de cada tipus
+        """
+        totals = self.totals()
+        memory = sum(size for _, size in totals.values())
+        kinds = ", ".join(f"{count} {kind}" for kind, (count, _) in sorted(totals.items()))
+        return f"GPU: {memory / 2**20:.1f} MB ({kinds or 'cap recurs'})"
+
+
+class TrackedContext:
+    """Context de ModernGL que registra al ResourceTracker cada recurs que s'hi crea.
+    La resta d'atributs i mètodes (enable, clear, point_size...) passen directament al context original
+    """
+    __slots__ = (
+        "ctx",
+        "tracker",
+    )
+
+    def __init__(self, ctx, tracker=None):
+        """Inicialització de la classe TrackedContext
+
+        Args:
+            ctx (mgl.Context): Context de ModernGL
+            tracker (ResourceTracker, optional): Registre de recursos. Defaults to None (se'n crea un de nou).
+        """
+        object.__setattr__(self, "ctx", ctx)
+        object.__setattr__(self, "tracker", ResourceTracker() if tracker is None else tracker)
+
+    @staticmethod
+    def caller():
+        """Propietari del recurs que s'està creant: el primer objecte de la pila que no és un ajudant
+        (ResourceCache, InstanceBuffer...) i la línia on el crea
+
+        Returns:
+            (str, str): Classe del propietari i lloc (fitxer:línia)
+        """
+        frame = sys._getframe(2)
+        while frame is not None:
+            owner = frame.f_locals.get("self")
+            if owner is not None and type(owner).__name__ not in TRACKER_HELPERS:
+                return type(owner).__name__, f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno}"
+            frame = frame.f_back
+        return "?", "?"
+
+    def __getattr__(self, name):
+        """Atributs del context original. Els mètodes que creen recursos es registren
+
+        Args:
+            name (str): Nom de l'atribut
+
+        Returns:
+            Any: Atribut del context
+        """
+        attribute = getattr(self.ctx, name)
+        kind = TRACKED_METHODS.get(name)
+        if kind is None:
+            return attribute
+
+        def create(*args, **kwargs):
+            return self.tracker.track(kind, attribute(*args, **kwargs), *self.caller())
+        return create
+
+    def __setattr__(self, name, value):
+        """Els atributs d'estat (point_size, line_width...) s'escriuen al context original
+
+        Args:
+            name (str): Nom de l'atribut
+            value (Any): Valor nou
+        """
+        setattr(self.ctx, name, value)
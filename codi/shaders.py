@@ -8,13 +8,14 @@ vertex_shader_SUN ='''
                 out vec3 v_frag_pos;
                 out vec2 v_tex_coord; 
 
-                uniform mat4 m_proj;
+                layout (std140) uniform Projection { mat4 m_proj; };
                 uniform mat4 m_view;
                 uniform mat4 m_model;
+                uniform mat3 m_normal; // transpose(inverse(mat3(m_model))), calculada a la CPU
 
                 void main() {
                     vec3 frag_pos = vec3(m_model * vec4(in_position, 1.0));
-                    v_norm = normalize(mat3(transpose(inverse(m_model))) * in_norm);
+                    v_norm = normalize(m_normal * in_norm);
                     v_frag_pos = frag_pos;
                     v_tex_coord = in_tex_coord;
                     gl_Position = m_proj * m_view * m_model * vec4(in_position, 1.0);
@@ -74,13 +75,14 @@ vertex_shader_PLANET ='''
                 out vec3 v_frag_pos;
                 out vec2 v_tex_coord;
 
-                uniform mat4 m_proj;
+                layout (std140) uniform Projection { mat4 m_proj; };
                 uniform mat4 m_view;
                 uniform mat4 m_model;
+                uniform mat3 m_normal; // transpose(inverse(mat3(m_model))), calculada a la CPU
 
                 void main() {
                     vec3 frag_pos = vec3(m_model * vec4(in_position, 1.0));
-                    v_norm = normalize(mat3(transpose(inverse(m_model))) * in_norm);
+                    v_norm = normalize(m_normal * in_norm);
                     v_frag_pos = frag_pos;
                     v_tex_coord = in_tex_coord;
                     gl_Position = m_proj * m_view * m_model * vec4(in_position, 1.0);
@@ -129,13 +131,101 @@ fragment_shader_PLANET = '''
                 }
             '''
 
+vertex_shader_BODY ='''
+                #version 330
+                layout(location = 0) in vec3 in_norm;
+                layout(location = 1) in vec3 in_position;
+                layout(location = 2) in vec2 in_tex_coord;
+
+                out vec3 v_norm;
+                out vec3 v_frag_pos;
+                out vec2 v_tex_coord;
+                flat out float v_layer;
+
+                layout (std140) uniform Projection { mat4 m_proj; };
+                uniform mat4 m_view;
+
+                // Dades per cos (8 texels RGBA32F per fila): matriu model amb el radi (0-3),
+                // matriu normal (4-6) i (signe de les normals, capa de textura, -, -) (7)
+                uniform sampler2D bodies;
+                uniform int first_body;
+
+                void main() {
+                    int body = first_body + gl_InstanceID;
+                    mat4 m_model = mat4(texelFetch(bodies, ivec2(0, body), 0),
+                                        texelFetch(bodies, ivec2(1, body), 0),
+                                        texelFetch(bodies, ivec2(2, body), 0),
+                                        texelFetch(bodies, ivec2(3, body), 0));
+                    mat3 m_normal = mat3(texelFetch(bodies, ivec2(4, body), 0).xyz,
+                                         texelFetch(bodies, ivec2(5, body), 0).xyz,
+                                         texelFetch(bodies, ivec2(6, body), 0).xyz);
+                    vec4 extra = texelFetch(bodies, ivec2(7, body), 0);
+
+                    vec3 frag_pos = vec3(m_model * vec4(in_position, 1.0));
+                    v_norm = normalize(m_normal * in_norm) * extra.x;
+                    v_frag_pos = frag_pos;
+                    v_tex_coord = in_tex_coord;
+                    v_layer = extra.y;
+                    gl_Position = m_proj * m_view * vec4(frag_pos, 1.0);
+                }
+            '''
+fragment_shader_BODY = '''
+                #version 330
+                in vec3 v_norm;
+                in vec3 v_frag_pos;
+                in vec2 v_tex_coord;
+                flat in float v_layer;
+
+                out vec4 fragColor;
+                struct Light {
+                    vec3 position;
+                    vec3 Ia;
+                    vec3 Id;
+                    vec3 Is;
+                };
+
+                uniform Light light;
+                uniform vec3 view_pos;
+
+                // Textures de tots els cossos, una capa per imatge
+                uniform sampler2DArray texture0;
+                // Textura a resolució completa que substitueix una capa (detail_layer, -1 si no n'hi ha)
+                uniform sampler2D detail;
+                uniform int detail_layer;
+
+                void main() {
+                    vec3 norm = normalize(v_norm);
+                    vec3 light_dir = normalize(light.position - v_frag_pos);
+                    
+                    // Ambient component
+                    vec3 ambient = light.Ia;
+                    
+                    // Diffuse component
+                    vec3 diffuse = light.Id * max(dot(norm, light_dir), 0.0);
+                    
+                    // Specular component
+                    vec3 view_dir = normalize(view_pos - v_frag_pos);
+                    vec3 reflect_dir = reflect(-light_dir, norm);
+                    float spec = pow(max(dot(view_dir, reflect_dir), 0.0), 32.0);  // Shininess = 32
+                    vec3 specular = light.Is * spec;
+
+                    vec4 tex_color = int(v_layer + 0.5) == detail_layer
+                        ? texture(detail, v_tex_coord)
+                        : texture(texture0, vec3(v_tex_coord, v_layer));
+
+                    // Combine all components
+                    vec3 result = ambient + diffuse + specular;
+                    fragColor = tex_color * vec4(result, 1.0);
+                }
+            '''
+
 vertex_shader_STAR = '''
     #version 330
 
     layout(location = 0) in vec3 in_color;     // Color of the star (passed from VAO)
     layout(location = 1) in vec3 in_position;  // Position of the star
 
-    uniform mat4 m_proj;
+    layout (std140) uniform Projection { mat4 m_proj; };
     uniform mat4 m_view;
     uniform mat4 m_model;
 
@@ -176,7 +266,7 @@ vertex_shader_CONSTELLATION = '''
     layout(location = 0) in vec3 in_position;
     layout(location = 1) in vec2 in_texcoords;
 
-    uniform mat4 m_proj;
+    layout (std140) uniform Projection { mat4 m_proj; };
     uniform mat4 m_view;
     uniform mat4 m_model;
 
@@ -204,27 +294,38 @@ fragment_shader_CONSTELLATION = '''
 vertex_shader_ELLIPSE = '''
         #version 330 core
 
-        layout(location = 0) in vec3 in_position;
+        layout(location = 0) in vec2 in_orbit;  // Per instància: semieix major i excentricitat
+        layout(location = 1) in vec3 in_color;  // Per instància: color de l'òrbita
 
-        uniform mat4 m_proj;   // Matriz de proyección
+        out vec3 v_color;
+
+        layout (std140) uniform Projection { mat4 m_proj; };   // Matriz de proyección
         uniform mat4 m_view;   // Matriz de vista
         uniform mat4 m_model;  // Matriz del modelo, que aquí sería la identidad
+        uniform int points;    // Punts de cada el·lipse (gl_VertexID va de 0 a points - 1)
 
         void main() {
-            // Transformación del vértice
-            gl_Position = m_proj * m_view * m_model * vec4(in_position, 1.0);
+            // Punt de l'el·lipse amb el focus a l'origen (el Sol)
+            float theta = 6.28318530718 * float(gl_VertexID) / float(points);
+            float a = in_orbit.x;
+            float e = in_orbit.y;
+            float b = a * sqrt(1.0 - e * e);
+            vec3 position = vec3(a * cos(theta) - a * e, 0.0, b * sin(theta));
+
+            v_color = in_color;
+            gl_Position = m_proj * m_view * m_model * vec4(position, 1.0);
         }
     '''
 fragment_shader_ELLIPSE = '''
         #version 330 core
 
-        out vec4 FragColor;
+        in vec3 v_color;  // Color de la órbita, como un vector RGB
 
-        uniform vec3 orbit_color;  // Color de la órbita, como un vector RGB
+        out vec4 FragColor;
 
         void main() {
             // Define el color de la órbita
-            FragColor = vec4(orbit_color, 1.0);  // Alpha de 1.0 para opacidad completa
+            FragColor = vec4(v_color, 1.0);  // Alpha de 1.0 para opacidad completa
         }
 
     '''
@@ -240,13 +341,14 @@ vertex_shader_ASTEROID ='''
             out vec3 v_frag_pos;
             out vec2 v_tex_coord;
 
-            uniform mat4 m_proj;
+            layout (std140) uniform Projection { mat4 m_proj; };
             uniform mat4 m_view;
 
             void main() {
                 mat4 model = instance_model; // Use instance-specific model matrix
                 vec3 frag_pos = vec3(model * vec4(in_position, 1.0));
-                v_norm = normalize(mat3(transpose(inverse(model))) * in_norm);
+                // Translació i escalat uniforme: la matriu normal és mat3(model) a escala
+                v_norm = normalize(mat3(model) * in_norm);
                 v_frag_pos = frag_pos;
                 v_tex_coord = in_tex_coord;
                 gl_Position = m_proj * m_view * model * vec4(in_position, 1.0);
@@ -307,7 +409,7 @@ vertex_shader_RING = '''
 
     out vec2 v_texcoord;
 
-    uniform mat4 m_proj;
+    layout (std140) uniform Projection { mat4 m_proj; };
     uniform mat4 m_view;
     uniform mat4 m_model;
 
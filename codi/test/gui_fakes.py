@@ -0,0 +1,85 @@
+import sys
+import os
+
+import moderngl as mgl
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from gui import GUIManager
+from resource_tracker import TrackedContext
+
+class FakeResource:
+    """Recurs de GL mínim: accepta les crides de la GUI, compta les pujades de dades
+    i release() l'invalida com fa ModernGL
+    """
+    __slots__ = ('mglo', 'filter', 'size', 'components', 'writes')
+    def __init__(self, size=None, components=None, data=None):
+        self.mglo = object()
+        self.size = size
+        self.components = components
+        self.writes = 0 if data is None else 1
+
+    def write(self, data):
+        self.writes += 1
+
+    def orphan(self, size):
+        pass
+
+    def build_mipmaps(self):
+        pass
+
+    def use(self, location=0):
+        pass
+
+    def clear(self, *color):
+        pass
+
+    def render(self, mode=None, vertices=-1, first=0):
+        pass
+
+    def release(self):
+        self.mglo = mgl.InvalidObject()
+
+class FakeContext:
+    """Context mínim amb els mètodes que fa servir la GUI. Guarda les textures creades
+    i l'atribut d'estat point_size
+    """
+    __slots__ = ('fbo', 'textures', 'point_size')
+    def __init__(self):
+        self.fbo = FakeResource()
+        self.textures = []
+        self.point_size = 1
+
+    def buffer(self, data=None, reserve=0, dynamic=False):
+        return FakeResource()
+
+    def program(self, vertex_shader=None, fragment_shader=None):
+        return FakeResource()
+
+    def vertex_array(self, program, content):
+        return FakeResource()
+
+    def texture(self, size, components, data=None):
+        texture = FakeResource(size, components, data)
+        self.textures.append(texture)
+        return texture
+
+    def framebuffer(self, color_attachments=()):
+        return FakeResource()
+
+class FakeApp:
+    """Aplicació mínima amb una GUI sobre el context fals
+
+    Args:
+        win_size (tuple, optional): Mida de la finestra. Defaults to (1200, 800).
+        tracked (bool, optional): Registrar els recursos creats amb un TrackedContext. Defaults to False.
+    """
+    __slots__ = ('ctx', 'gui', 'DEBUG', 'WIN_SIZE')
+    def __init__(self, win_size=(1200, 800), tracked=False):
+        self.ctx = TrackedContext(FakeContext()) if tracked else FakeContext()
+        self.DEBUG = False
+        self.WIN_SIZE = win_size
+        self.gui = GUIManager(self)
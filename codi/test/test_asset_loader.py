@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+import asset_loader
+from asset_loader import AssetLoader
+
+class FakeClock:
+    """Rellotge fals per al mòdul time de l'AssetLoader: el temps només avança quan es demana
+    """
+    __slots__ = ('now', 'sleeps')
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = 0
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps += 1
+        self.now += seconds
+
+class TestAssetLoader(unittest.TestCase):
+    __slots__ = ('clock', 'time', 'loader', 'resumed', 'ready')
+    def setUp(self):
+        """Crea un carregador amb un fil de treball i substitueix el rellotge pel fals
+        """
+        self.clock = FakeClock()
+        self.time = asset_loader.time
+        asset_loader.time = self.clock
+        self.loader = AssetLoader(workers=1)
+        self.resumed = 0
+        self.ready = False
+
+    def tearDown(self):
+        asset_loader.time = self.time
+        self.loader.shutdown()
+
+    def steps(self, count, seconds, wait_at=None, ready=None):
+        """Generador de passos fals: cada pas triga 'seconds' i, al pas 'wait_at', espera fins que
+        ready() (per defecte self.ready) és cert
+        """
+        ready = ready or (lambda: self.ready)
+        for step in range(count):
+            self.resumed += 1
+            if step == wait_at:
+                while not ready():
+                    yield None
+                    self.resumed += 1
+            self.clock.now += seconds
+            yield (step + 1) / count
+
+    def test_budget(self):
+        """1. Test del pressupost: s'executen passos fins que s'esgota, com a mínim un per frame
+        """
+        self.loader.load(self.steps(10, 0.004))
+        self.assertFalse(self.loader.update(0.01))
+        self.assertEqual(self.resumed, 3)
+        self.assertAlmostEqual(self.loader.progress, 0.3)
+
+        self.assertFalse(self.loader.update(0.001))
+        self.assertEqual(self.resumed, 4)
+
+        self.assertTrue(self.loader.update(1.0))
+        self.assertTrue(self.loader.finished)
+        self.assertEqual(self.resumed, 10)
+        self.assertEqual(self.loader.progress, 1.0)
+
+    def test_waiting(self):
+        """2. Test d'un pas que espera un fil de treball: el frame acaba sense tornar-lo a provar
+        """
+        self.loader.load(self.steps(4, 0.001, wait_at=1))
+        for frame in range(1, 6):
+            self.assertFalse(self.loader.update(1.0))
+            self.assertEqual(self.resumed, frame + 1)
+        self.assertAlmostEqual(self.loader.progress, 0.25)
+
+        self.ready = True
+        self.assertTrue(self.loader.update(1.0))
+        self.assertEqual(self.loader.progress, 1.0)
+
+    def test_finish(self):
+        """3. Test de la càrrega síncrona: s'executen tots els passos, esperant els fils de treball
+        """
+        self.loader.load(self.steps(6, 0.1, wait_at=2, ready=lambda: self.clock.sleeps >= 3))
+        self.loader.finish()
+        self.assertTrue(self.loader.finished)
+        self.assertEqual(self.clock.sleeps, 3)
+        self.assertEqual(self.loader.progress, 1.0)
+        self.assertTrue(self.loader.update())
+
+    def test_shutdown(self):
+        """4. Test dels fils de treball: executen la feina enviada i no n'accepten després d'aturar-los
+        """
+        future = self.loader.submit(sum, (1, 2, 3))
+        self.assertEqual(future.result(), 6)
+        self.loader.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.loader.submit(sum, (1, 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,7 @@ sys.path.insert(0, parent_dir)
 from engine import GraphicsEngine
 import shaders as sh
 from objects import *
+from render_queue import RenderQueue
 
 class TestAsteroids(unittest.TestCase):
     __slots__ = ('object')
@@ -68,6 +69,26 @@ class TestAsteroids(unittest.TestCase):
 
         self.assertNotEqual(test1_positions, test2_positions) 
 
+    def test_double_buffer(self):
+        """3. Test del ring buffer de matrius (update a la CPU, una sola pujada a la GPU a enqueue)
+        """
+        previous = self.object.instance_buffer.buffer.read()
+        self.object.app.time += 1
+        self.object.update()
+        # update() no pot escriure a la GPU, només omple el buffer de la CPU
+        self.assertEqual(self.object.instance_buffer.buffer.read(), previous)
+
+        # upload() només fixa la còpia del frame, que es puja en afegir el cinturó a la cua
+        self.object.upload()
+        self.assertEqual(self.object.instance_buffer.buffer.read(), previous)
+        self.object.enqueue(RenderQueue())
+
+        positions = np.array(self.object.positions)
+        visible = self.object.app.frustum.spheres_visible(positions, self.object.bounding_radii)
+        count = int(np.count_nonzero(visible))
+        uploaded = np.frombuffer(self.object.instance_buffer.buffer.read(), dtype='f4').reshape(-1, 16)
+        np.testing.assert_allclose(uploaded[:count, 12:15], positions[visible], rtol=1e-5)
+
     # def test_collisions_time(self):
     #     """3. Comparativa de temps entre mètodes per trobar col·lisions
     #     """
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+
+import numpy as np
+import pygame as pg
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from gui.circular_button import CircularButton, unit_circle
+from gui_fakes import FakeApp
+
+class TestCircularButton(unittest.TestCase):
+    __slots__ = ('app', 'button')
+    def setUp(self):
+        """Crea un botó circular de radi 40 centrat a (300, 200)
+        """
+        pg.font.init()
+        self.app = FakeApp()
+        self.button = CircularButton(self.app, "button", x=300, y=200, radius=40)
+
+    def to_pixels(self, vertexes):
+        """Passa els vèrtexs de NDC a píxels de la finestra
+        """
+        width, height = self.app.WIN_SIZE
+        return np.stack(((vertexes[:, 0] + 1) * width / 2, (1 - vertexes[:, 1]) * height / 2), axis=1)
+
+    def test_unit_circle(self):
+        """1. Test del cercle unitari: un ventall de triangles compartit per nombre de segments
+        """
+        triangles = unit_circle(20)
+        self.assertIs(unit_circle(20), triangles)
+        self.assertFalse(triangles.flags.writeable)
+        self.assertEqual(triangles.shape, (60, 2))
+
+        centres = triangles[0::3]
+        np.testing.assert_array_equal(centres, np.zeros((20, 2)))
+        circumference = np.delete(triangles, np.s_[0::3], axis=0)
+        np.testing.assert_allclose(np.hypot(*circumference.T), 1)
+
+    def test_vertexes(self):
+        """2. Test de la geometria: el cercle unitari escalat pel radi i centrat al botó
+        """
+        pixels = self.to_pixels(self.button.vertexes.astype('f8'))
+        np.testing.assert_allclose(pixels[0::3], [[300, 200]] * (len(pixels) // 3), atol=1e-3)
+        distances = np.hypot(*(np.delete(pixels, np.s_[0::3], axis=0) - (300, 200)).T)
+        np.testing.assert_allclose(distances, 40, atol=1e-3)
+
+    def test_move(self):
+        """3. Test del moviment: els vèrtexs segueixen el botó i el radi
+        """
+        self.button.x = 500
+        self.button.radius = 80
+        pixels = self.to_pixels(self.button.vertexes.astype('f8'))
+        np.testing.assert_allclose(pixels[0], (500, 200), atol=1e-3)
+        np.testing.assert_allclose(np.hypot(*(pixels[1] - (500, 200))), 80, atol=1e-3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime
+
+import numpy as np
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from ephemeris import Ephemeris
+
+class TestEphemeris(unittest.TestCase):
+    __slots__ = ('ephemeris')
+    def setUp(self):
+        """Crea una instància de Ephemeris amb un planeta i un satèl·lit
+        """
+        self.ephemeris = Ephemeris(datetime(2000, 1, 1), datetime(2001, 1, 1))
+        self.ephemeris.add_orbit("Earth", 150.0, 0.0167, 0.0137, 0.0)
+        self.ephemeris.add_orbit("Moon", 3.0, 0.0167, 0.113, 0.0)
+        self.ephemeris.fit()
+
+    def test_dates(self):
+        """1. Test de conversió entre dates i temps de l'engine
+        """
+        date = datetime(2000, 6, 1)
+        time = self.ephemeris.date_to_time(date)
+        self.assertAlmostEqual((self.ephemeris.time_to_date(time) - date).total_seconds(), 0, places=3)
+        self.assertEqual(self.ephemeris.time_to_date(0), self.ephemeris.epoch)
+
+    def test_positions(self):
+        """2. Test de precisió de les posicions interpolades
+        """
+        start = self.ephemeris.date_to_time(datetime(2000, 1, 1))
+        end = self.ephemeris.date_to_time(datetime(2001, 1, 1))
+        for key in ("Earth", "Moon"):
+            for time in np.linspace(start, end, 50, endpoint=False):
+                position = self.ephemeris.position(key, time)
+                expected = Ephemeris.orbit(self.ephemeris.elements[key], time)
+                self.assertTrue(np.allclose(list(position), expected, atol=1e-4))
+
+    def test_out_of_range(self):
+        """3. Test de temps i cossos no coberts
+        """
+        self.assertIsNone(self.ephemeris.position("Earth", self.ephemeris.date_to_time(datetime(1990, 1, 1))))
+        self.assertIsNone(self.ephemeris.position("Mars", 0))
+
+    def test_cache(self):
+        """4. Test de la memòria cau binària
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ephemeris.npz")
+            self.ephemeris.save(path)
+
+            loaded = Ephemeris(datetime(2000, 1, 1), datetime(2001, 1, 1))
+            loaded.add_orbit("Earth", 150.0, 0.0167, 0.0137, 0.0)
+            loaded.add_orbit("Moon", 3.0, 0.0167, 0.113, 0.0)
+            self.assertTrue(loaded.load(path))
+            self.assertEqual(loaded.position("Moon", 10.0), self.ephemeris.position("Moon", 10.0))
+
+            # Si els elements orbitals canvien, la memòria cau no és vàlida
+            loaded.add_orbit("Moon", 4.0, 0.0167, 0.113, 0.0)
+            self.assertFalse(loaded.load(path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import sys
+import os
+import json
+
+import pygame as pg
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from event_bus import EventBus
+from gui import SliderChanged, Toggled
+from gui_fakes import FakeApp
+
+class TestEventBus(unittest.TestCase):
+    __slots__ = ('bus', 'received')
+    def setUp(self):
+        """Crea un bus amb un registre dels events rebuts
+        """
+        self.bus = EventBus()
+        self.received = []
+
+    def test_gui_events(self):
+        """1. Test dels events de la GUI: cada handler rep els del seu tipus i element
+        """
+        self.bus.subscribe(Toggled, self.received.append, "elipses")
+        self.bus.subscribe(SliderChanged, lambda event: self.received.append(event.value))
+
+        self.assertTrue(self.bus.emit(Toggled("elipses", True)))
+        self.assertFalse(self.bus.emit(Toggled("escala", True)))
+        self.assertTrue(self.bus.emit(SliderChanged("time", 4.0)))
+        self.assertFalse(self.bus.emit(None))
+        self.assertEqual(self.received, [Toggled("elipses", True), 4.0])
+
+    def test_keys(self):
+        """2. Test de les tecles: handler per tecla amb condició i registre de les mantingudes
+        """
+        enabled = [False]
+        self.bus.on_key(pg.K_p, lambda: self.received.append("p"))
+        self.bus.on_key(pg.K_1, lambda: self.received.append("1"), when=lambda: enabled[0])
+
+        self.bus.press(pg.K_p)
+        self.bus.press(pg.K_1)
+        enabled[0] = True
+        self.bus.press(pg.K_1)
+        self.bus.press(pg.K_w)
+        self.assertEqual(self.received, ["p", "1"])
+        self.assertEqual(self.bus.held, {pg.K_p, pg.K_1, pg.K_w})
+
+        self.bus.release(pg.K_p)
+        self.assertEqual(self.bus.held, {pg.K_1, pg.K_w})
+        self.bus.release_all()
+        self.assertEqual(self.bus.held, set())
+
+    def test_hover_still_mouse(self):
+        """3. Test del hover amb el ratolí quiet: segueix els elements amagats o mostrats des del teclat
+        """
+        pg.font.init()
+        gui = FakeApp().gui
+        with open(os.path.join(parent_dir, "gui_layout.json"), "r") as file:
+            gui.batch_add_elements(json.load(file))
+        button = gui["escala"]
+        gui.check_hover((button.x, button.y))
+        self.assertTrue(button.is_hovered)
+
+        button.hide()
+        gui.update_hover()
+        self.assertFalse(button.is_hovered)
+        button.unhide()
+        gui.update_hover()
+        self.assertTrue(button.is_hovered)
+
+        # Un element del menú de planetes amagat en tancar el menú
+        menu = gui["planet_menu"]
+        menu.unhide()
+        menu.visualize()
+        item = menu["Earth"]
+        gui.check_hover((item.x, item.y))
+        self.assertTrue(item.is_hovered)
+        menu.unvisualize()
+        gui.update_hover()
+        self.assertFalse(item.is_hovered)
+
+if __name__ == '__main__':
+    unittest.main()
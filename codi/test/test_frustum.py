@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+
+import glm
+import numpy as np
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from frustum import Frustum, CullingStats
+
+class TestFrustum(unittest.TestCase):
+    __slots__ = ('frustum')
+    def setUp(self):
+        """Crea un frustum amb la càmera a l'origen mirant cap a -Z
+        """
+        m_proj = glm.perspective(glm.radians(45), 1.5, 0.1, 1000)
+        m_view = glm.lookAt(glm.vec3(0, 0, 0), glm.vec3(0, 0, -1), glm.vec3(0, 1, 0))
+        self.frustum = Frustum(m_proj, m_view)
+
+    def test_sphere_visible(self):
+        """1. Test d'esferes individuals dins i fora del frustum
+        """
+        self.assertTrue(self.frustum.sphere_visible(glm.vec3(0, 0, -10), 1))
+        # Darrere de la càmera i més enllà del pla far
+        self.assertFalse(self.frustum.sphere_visible(glm.vec3(0, 0, 10), 1))
+        self.assertFalse(self.frustum.sphere_visible(glm.vec3(0, 0, -1100), 1))
+        # Fora pel lateral, però visible si el radi creua el pla
+        self.assertFalse(self.frustum.sphere_visible(glm.vec3(100, 0, -10), 1))
+        self.assertTrue(self.frustum.sphere_visible(glm.vec3(100, 0, -10), 100))
+
+    def test_spheres_visible(self):
+        """2. Test vectoritzat amb el mateix resultat que el test individual
+        """
+        rng = np.random.default_rng(0)
+        centers = rng.uniform(-50, 50, (200, 3))
+        radii = rng.uniform(0.1, 5, 200)
+        mask = self.frustum.spheres_visible(centers, radii)
+        expected = [self.frustum.sphere_visible(glm.vec3(*c), r) for c, r in zip(centers, radii)]
+        self.assertEqual(mask.tolist(), expected)
+        self.assertTrue(0 < np.count_nonzero(mask) < len(mask))
+
+    def test_stats(self):
+        """3. Test del reinici de les estadístiques
+        """
+        stats = CullingStats()
+        stats.objects_culled += 3
+        stats.instances_drawn += 10
+        stats.reset()
+        self.assertEqual((stats.objects_drawn, stats.objects_culled, stats.instances_drawn, stats.instances_culled), (0, 0, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
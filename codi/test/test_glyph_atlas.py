@@ -0,0 +1,53 @@
+import unittest
+import sys
+import os
+
+import pygame as pg
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from gui.glyph_atlas import GlyphAtlas
+from gui_fakes import FakeApp
+
+class TestGlyphAtlas(unittest.TestCase):
+    __slots__ = ('app', 'atlas', 'textures')
+    def setUp(self):
+        """Crea un atlas amb la font per defecte de Pygame
+        """
+        pg.font.init()
+        self.app = FakeApp()
+        self.atlas = GlyphAtlas(self.app, None, 12, 2)
+        self.textures = len(self.app.ctx.textures)
+
+    def test_layout(self):
+        """1. Test de la geometria: un quad per caràcter, seguits i amb l'amplada del text
+        """
+        quads, width, height = self.atlas.layout("FPS: 60")
+        self.assertEqual(quads.shape, (7, 4, 4))
+        self.assertAlmostEqual(quads[0, 0, 0], 0.0)
+        self.assertAlmostEqual(quads[-1, 1, 0], width)
+        self.assertTrue((quads[1:, 0, 0] == quads[:-1, 1, 0]).all())
+        self.assertAlmostEqual(quads[0, 2, 1], height)
+        self.assertEqual(self.atlas.layout("")[0].shape, (0, 4, 4))
+
+    def test_same_texture(self):
+        """2. Test del canvi de text: no es crea ni es puja cap textura
+        """
+        for fps in range(100):
+            self.atlas.layout(f"FPS: {fps}")
+        self.assertEqual(len(self.app.ctx.textures), self.textures)
+        self.assertEqual(self.atlas.texture.writes, 1)
+
+    def test_missing_glyph(self):
+        """3. Test d'un caràcter fora de l'ASCII: s'afegeix a l'atlas una sola vegada
+        """
+        self.atlas.layout("Càrrega")
+        self.atlas.layout("àà")
+        self.assertEqual(self.atlas.texture.writes, 2)
+        self.assertEqual(len(self.app.ctx.textures), self.textures)
+
+if __name__ == '__main__':
+    unittest.main()
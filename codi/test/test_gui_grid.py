@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+import json
+
+import pygame as pg
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from gui import MovedOver
+from gui_fakes import FakeApp
+
+class TestGUIGrid(unittest.TestCase):
+    __slots__ = ('app', 'gui', 'elements')
+    def setUp(self):
+        """Crea la GUI de l'aplicació amb el menú de planetes obert
+        """
+        pg.font.init()
+        self.app = FakeApp()
+        self.gui = self.app.gui
+        with open(os.path.join(parent_dir, "gui_layout.json"), "r") as file:
+            layout = json.load(file)
+        self.gui.batch_add_elements(layout)
+        self.gui["planet_menu"].unhide()
+        self.gui["planet_menu"].visualize()
+        self.elements = [self.gui[uuid] for uuid in layout]
+
+    def brute_force(self, position):
+        """Resultat de recórrer tots els elements, com abans de la graella
+        """
+        for element in self.elements:
+            motion = element.check_motion(position)
+            if motion:
+                return motion
+        return None
+
+    def test_same_hits(self):
+        """1. Test dels candidats: el mateix resultat que recórrer tots els elements
+        """
+        hits = 0
+        for x in range(0, 1200, 10):
+            for y in range(0, 800, 10):
+                expected = self.brute_force((x, y))
+                self.assertEqual(self.gui.check_motion((x, y)), expected, (x, y))
+                hits += expected is not None
+        self.assertGreater(hits, 0)
+
+    def test_hover(self):
+        """2. Test del hover: l'element deixa d'estar en hover en sortir-ne encara que no sigui candidat
+        """
+        button = self.gui["escala"]
+        self.gui.check_hover((button.x, button.y))
+        self.assertTrue(button.is_hovered)
+        self.gui.check_hover((1100, 400))
+        self.assertFalse(button.is_hovered)
+
+    def test_layout_changes(self):
+        """3. Test de la reconstrucció: amagar i moure un element canvia els candidats
+        """
+        button = self.gui["escala"]
+        position = (button.x, button.y)
+        self.assertEqual(self.gui.check_motion(position), MovedOver("escala"))
+
+        button.hide()
+        self.assertIsNone(self.gui.check_motion(position))
+        button.unhide()
+
+        button.x = 600
+        button.y = 400
+        self.assertIsNone(self.gui.check_motion(position))
+        self.assertEqual(self.gui.check_motion((600, 400)), MovedOver("escala"))
+
+if __name__ == '__main__':
+    unittest.main()
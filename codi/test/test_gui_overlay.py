@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+import json
+
+import pygame as pg
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from gui_fakes import FakeApp
+
+class TestGUIOverlay(unittest.TestCase):
+    __slots__ = ('app', 'gui')
+    def setUp(self):
+        """Crea la GUI de l'aplicació i en dibuixa el primer frame
+        """
+        pg.font.init()
+        self.app = FakeApp()
+        self.gui = self.app.gui
+        with open(os.path.join(parent_dir, "gui_layout.json"), "r") as file:
+            self.gui.batch_add_elements(json.load(file))
+        self.gui.render()
+
+    def redrawn(self):
+        """Dibuixa un frame i diu si s'ha redibuixat la GUI o només s'ha compost la textura
+        """
+        self.gui.render()
+        return self.gui.renderer.draw_calls > 1
+
+    def test_cached(self):
+        """1. Test dels frames sense canvis: només es compon la textura
+        """
+        for _ in range(10):
+            self.gui.check_hover((1100, 400))
+            self.assertFalse(self.redrawn())
+
+    def test_dirty(self):
+        """2. Test dels canvis d'estat: hover, toggle, amagar i progrés redibuixen una sola vegada
+        """
+        button = self.gui["escala"]
+        self.gui.check_hover((button.x, button.y))
+        self.assertTrue(self.redrawn())
+        self.assertFalse(self.redrawn())
+
+        button.toggle()
+        self.assertTrue(self.redrawn())
+        self.assertFalse(self.redrawn())
+
+        button.hide()
+        self.assertTrue(self.redrawn())
+
+        self.gui["loading"].progress = 0.5
+        self.assertTrue(self.redrawn())
+        self.gui["loading"].progress = 0.5
+        self.assertFalse(self.redrawn())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+import pygame as pg
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from gui_fakes import FakeApp
+
+class TestLayoutCache(unittest.TestCase):
+    __slots__ = ('directory', 'layout')
+    def setUp(self):
+        """Crea un directori temporal per als layouts compilats
+        """
+        pg.font.init()
+        self.directory = tempfile.TemporaryDirectory()
+        self.layout = os.path.join(parent_dir, "gui_layout.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load(self, win_size=(1200, 800)):
+        """Crea una GUI nova amb el layout de l'aplicació
+        """
+        app = FakeApp(win_size)
+        cached = app.gui.load_layout(self.layout, self.directory.name)
+        return app.gui, cached
+
+    def test_same_gui(self):
+        """1. Test del layout compilat: la mateixa GUI i els mateixos glifs que compilant-lo
+        """
+        compiled, cached = self.load()
+        self.assertFalse(cached)
+        loaded, cached = self.load()
+        self.assertTrue(cached)
+
+        for uuid in ("escala", "elipses", "time", "loading"):
+            self.assertEqual(loaded[uuid].bounds, compiled[uuid].bounds)
+        self.assertEqual(loaded["planet_menu"]["Mars"].bounds, compiled["planet_menu"]["Mars"].bounds)
+
+        atlases = compiled.renderer.glyph_atlases
+        self.assertEqual(loaded.renderer.glyph_atlases.keys(), atlases.keys())
+        for key, atlas in loaded.renderer.glyph_atlases.items():
+            for name, array in atlas.state.items():
+                np.testing.assert_array_equal(array, atlases[key].state[name])
+
+    def test_window_size(self):
+        """2. Test d'una altra mida de finestra: es compila un altre layout
+        """
+        self.load()
+        gui, cached = self.load((800, 600))
+        self.assertFalse(cached)
+        self.assertEqual(len(os.listdir(self.directory.name)), 2)
+        self.assertTrue(self.load((800, 600))[1])
+
+    def test_disabled(self):
+        """3. Test sense memòria cau: no es desa cap fitxer
+        """
+        app = FakeApp()
+        self.assertFalse(app.gui.load_layout(self.layout, None))
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_fit_window(self):
+        """4. Test del redimensionat: els elements tenen la geometria de la nova mida i conserven l'estat
+        """
+        gui, _ = self.load()
+        gui["planet_menu"]["Mars"].toggle()
+        gui["loading"].hide()
+
+        gui.app.WIN_SIZE = (800, 600)
+        gui.fit_window()
+        # La nova mida només es compila en memòria
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
+        expected, _ = self.load((800, 600))
+
+        for uuid in ("escala", "elipses", "time", "loading"):
+            self.assertEqual(gui[uuid].bounds, expected[uuid].bounds)
+        self.assertEqual(gui["planet_menu"]["Mars"].bounds, expected["planet_menu"]["Mars"].bounds)
+        self.assertTrue(gui["planet_menu"]["Mars"].is_toggled)
+        self.assertTrue(gui["loading"].is_hidden)
+
+if __name__ == '__main__':
+    unittest.main()
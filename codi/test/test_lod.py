@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+
+import glm
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from objects.lod import LevelOfDetail, LOD_THRESHOLDS, LOD_MIN_SEGMENTS
+
+class FakeCamera:
+    """Càmera mínima amb posició i matriu de projecció
+    """
+    __slots__ = ('position', 'm_proj')
+    def __init__(self):
+        self.position = glm.vec3(0, 0, 0)
+        self.m_proj = glm.perspective(glm.radians(45), 1.5, 0.1, 1000)
+
+class TestLevelOfDetail(unittest.TestCase):
+    __slots__ = ('lod')
+    def setUp(self):
+        """Crea una instància de LevelOfDetail al nivell original
+        """
+        self.lod = LevelOfDetail()
+
+    def test_select(self):
+        """1. Test de la selecció de nivell segons els píxels
+        """
+        self.assertEqual(self.lod.select(1), 0)
+        self.assertEqual(self.lod.select(LOD_THRESHOLDS[-1] * 10), len(LOD_THRESHOLDS))
+
+    def test_hysteresis(self):
+        """2. Test de l'histèresi: valors just al voltant del llindar no canvien el nivell
+        """
+        threshold = LOD_THRESHOLDS[1]
+        self.lod.select(threshold * 0.5)
+        self.assertEqual(self.lod.level, 1)
+        self.assertEqual(self.lod.select(threshold * 1.1), 1)
+        self.assertEqual(self.lod.select(threshold * 1.5), 2)
+        self.assertEqual(self.lod.select(threshold * 0.9), 2)
+        self.assertEqual(self.lod.select(threshold * 0.5), 1)
+
+    def test_segments_and_radius(self):
+        """3. Test de les subdivisions i del radi projectat
+        """
+        self.assertEqual(LevelOfDetail.segments(20, 20, 1), (20, 20))
+        self.assertEqual(LevelOfDetail.segments(20, 20, 3), (80, 80))
+        self.assertEqual(LevelOfDetail.segments(8, 8, 0), (LOD_MIN_SEGMENTS, LOD_MIN_SEGMENTS))
+
+        camera = FakeCamera()
+        near = LevelOfDetail.screen_radius(glm.vec3(0, 0, -10), 1, camera, 800)
+        far = LevelOfDetail.screen_radius(glm.vec3(0, 0, -20), 1, camera, 800)
+        self.assertAlmostEqual(near, 2 * far, places=4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+import numpy as np
+import pygame as pg
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from gui.performance_hud import HUD_LINES
+from metrics import Metrics
+from gui_fakes import FakeApp
+
+class TestMetrics(unittest.TestCase):
+    __slots__ = ('metrics', 'samples', 'app', 'hud')
+    def setUp(self):
+        """Crea un registre de mètriques que compta quantes vegades es consulten i un HUD amagat
+        """
+        pg.font.init()
+        self.metrics = Metrics(history=4)
+        self.samples = 0
+        for name in ("draw_calls", "instances_drawn", "instances_culled", "collision_pairs", "gpu_memory"):
+            self.metrics.register(name, self.source)
+
+        self.app = FakeApp()
+        self.app.gui.add_element("performance_hud", "performance", {
+            "x": 0.86, "y": 0.15, "width": 0.34, "height": 0.26, "refresh": 60, "hidden": True,
+            "text": {"font_size": 16}})
+        self.hud = self.app.gui["performance"]
+
+    def source(self):
+        """Mètrica que compta les consultes
+        """
+        self.samples += 1
+        return self.samples
+
+    def test_history(self):
+        """1. Test del buffer circular: els últims temps en ordre i els FPS mitjans
+        """
+        self.assertEqual(len(self.metrics.history()), 0)
+        self.assertEqual(self.metrics.fps(), 0.0)
+        for milliseconds in (10, 20, 30, 40, 50, 60):
+            self.metrics.record_frame(milliseconds)
+        np.testing.assert_array_equal(self.metrics.history(), [30, 40, 50, 60])
+        self.assertAlmostEqual(self.metrics.fps(), 1000 / 45)
+
+    def test_hidden(self):
+        """2. Test del HUD amagat: no es consulta cap mètrica ni es redibuixa la GUI
+        """
+        self.metrics.record_frame(16)
+        version = self.hud.render_version
+        for _ in range(10):
+            self.hud.update(self.metrics)
+        self.assertEqual(self.samples, 0)
+        self.assertIsNone(self.hud.values)
+        self.assertEqual(self.hud.render_version, version)
+
+    def test_refresh(self):
+        """3. Test del HUD visible: es consulten les mètriques un cop per interval de refresc
+        """
+        self.metrics.record_frame(16)
+        self.hud.unhide()
+        version = self.hud.render_version
+        for _ in range(10):
+            self.hud.update(self.metrics)
+        self.assertEqual(self.samples, 5)
+        # Cada línia es composa un sol cop, més el redibuixat del HUD
+        self.assertEqual(self.hud.render_version - version, len(HUD_LINES) + 1)
+        self.assertEqual(self.hud.values["draw_calls"], 1)
+        self.assertAlmostEqual(self.hud.values["fps"], 1000 / 16)
+
+        # En tornar-lo a mostrar es consulten de nou
+        self.hud.hide()
+        self.hud.unhide()
+        self.hud.update(self.metrics)
+        self.assertEqual(self.samples, 10)
+
+    def test_narrow_window(self):
+        """4. Test d'una finestra estreta: després de redimensionar-la el HUD queda dins de la finestra
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            layout = os.path.join(directory, "layout.json")
+            with open(layout, "w") as file:
+                json.dump({"performance": {"class": "performance_hud", "kwargs": {
+                    "x": 0.86, "y": 0.15, "width": 0.34, "height": 0.26}}}, file)
+            app = FakeApp()
+            app.gui.load_layout(layout, None)
+
+        app.WIN_SIZE = (600, 900)
+        app.gui.fit_window()
+        left, _, right, _ = app.gui["performance"].bounds
+        self.assertAlmostEqual(right, 600)
+        self.assertAlmostEqual(right - left, 0.34 * 600)
+
+if __name__ == '__main__':
+    unittest.main()
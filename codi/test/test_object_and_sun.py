@@ -3,6 +3,7 @@ import sys
 import os
 import moderngl as mgl
 import glm
+import numpy as np
 
 # Add the parent directory to the Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -42,8 +43,14 @@ class TestObject(unittest.TestCase):
     def test_sphere_creation(self):
         """2. Test de la creació de les esferes
         """
-        sphere = self.object.create_sphere(False)
-        self.assertEqual(len(sphere), 4800)
+        sphere, indices = self.object.create_sphere(False)
+        # Vèrtexs únics (11x11) i 6 índexs per cada quadrat (10x10)
+        self.assertEqual(len(sphere), 968)
+        self.assertEqual(len(indices), 600)
+        self.assertEqual(indices.dtype, np.uint16)
+        self.assertLess(indices.max(), 121)
+        # Expandint els índexs s'obté la mateixa malla de triangles (4800 valors)
+        self.assertEqual(sphere.reshape(-1, 8)[indices].size, 4800)
         self.assertGreaterEqual(sphere[6], 0)
         self.assertLessEqual(sphere[6], 1)
         self.assertGreaterEqual(sphere[7], 0)
@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from render_queue import RenderQueue
+
+class FakeResource:
+    """Recurs de GL mínim que enregistra les crides en un registre compartit
+    """
+    __slots__ = ('glo', 'log', 'uniforms')
+    def __init__(self, glo, log):
+        self.glo = glo
+        self.log = log
+        self.uniforms = {}
+
+    def use(self):
+        self.log.append(("use", self.glo))
+
+    def render(self, mode=None, vertices=-1, first=0, instances=-1):
+        self.log.append(("render", self.glo))
+
+    def __getitem__(self, name):
+        resource = self
+        class Uniform:
+            def write(self, value):
+                resource.uniforms[name] = value
+        return Uniform()
+
+class TestRenderQueue(unittest.TestCase):
+    __slots__ = ('queue', 'log')
+    def setUp(self):
+        """Crea una cua de renderització buida
+        """
+        self.queue = RenderQueue()
+        self.log = []
+
+    def test_sorting(self):
+        """1. Test de l'ordenació per programa i textura i dels comptadors
+        """
+        programs = [FakeResource(1, self.log), FakeResource(2, self.log)]
+        textures = [FakeResource(10, self.log), FakeResource(11, self.log)]
+        vaos = [FakeResource(100 + i, self.log) for i in range(8)]
+        # Crides intercalades: cada combinació de programa i textura apareix dos cops
+        for i, vao in enumerate(vaos):
+            self.queue.submit(programs[i % 2], textures[(i // 2) % 2], vao, {"m_model": i})
+        self.queue.flush()
+
+        self.assertEqual(self.queue.draws, 8)
+        self.assertEqual(self.queue.program_binds, 2)
+        self.assertEqual(self.queue.texture_binds, 4)
+        self.assertEqual(self.queue.uniform_writes, 8)
+        self.assertEqual(self.queue.items, [])
+        rendered = [glo for call, glo in self.log if call == "render"]
+        self.assertEqual(rendered, [100, 104, 102, 106, 101, 105, 103, 107])
+
+    def test_reset(self):
+        """2. Test del reinici dels comptadors
+        """
+        self.queue.submit(FakeResource(1, self.log), None, FakeResource(2, self.log))
+        self.queue.flush()
+        self.assertEqual((self.queue.draws, self.queue.texture_binds), (1, 0))
+        self.queue.reset()
+        self.assertEqual(self.queue.draws, 0)
+
+if __name__ == '__main__':
+    unittest.main()
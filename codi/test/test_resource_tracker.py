@@ -0,0 +1,66 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from resource_tracker import TrackedContext
+from gui_fakes import FakeContext
+
+class Owner:
+    """Objecte que crea recursos, com ho fan els objectes de l'escena
+    """
+    __slots__ = ('ctx', 'vbo', 'shader')
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.vbo = self.ctx.buffer(b"")
+        self.shader = self.ctx.program()
+
+    def destroy(self):
+        self.vbo.release()
+        self.shader.release()
+
+class TestResourceTracker(unittest.TestCase):
+    __slots__ = ('ctx',)
+    def setUp(self):
+        """Crea un context registrat sobre un context fals
+        """
+        self.ctx = TrackedContext(FakeContext())
+
+    def test_owner(self):
+        """1. Test del propietari: la classe que crea el recurs
+        """
+        Owner(self.ctx)
+        owners = {(kind, owner) for kind, _, owner, _ in self.ctx.tracker.live()}
+        self.assertEqual(owners, {("buffer", "Owner"), ("program", "Owner")})
+
+    def test_release(self):
+        """2. Test dels recursos alliberats: deixen de comptar
+        """
+        owner = Owner(self.ctx)
+        self.assertEqual(self.ctx.tracker.totals(), {"buffer": [1, 0], "program": [1, 0]})
+        owner.destroy()
+        self.assertEqual(self.ctx.tracker.live(), [])
+
+    def test_leak(self):
+        """3. Test d'una fuita: el recurs que no s'allibera surt a l'informe amb el lloc on s'ha creat
+        """
+        owner = Owner(self.ctx)
+        owner.shader.release()
+        report = self.ctx.tracker.report()
+        self.assertIn("Owner (test_resource_tracker.py:", report)
+        self.assertIn("1 buffer", report)
+        self.assertNotIn("program", report)
+
+    def test_forward(self):
+        """4. Test dels atributs d'estat: s'escriuen al context original
+        """
+        self.ctx.point_size = 4
+        self.assertEqual(self.ctx.ctx.point_size, 4)
+        self.assertEqual(self.ctx.point_size, 4)
+
+if __name__ == '__main__':
+    unittest.main()
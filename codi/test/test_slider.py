@@ -0,0 +1,50 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from gui import Released, SliderChanged
+from gui.slider import Slider
+from gui_fakes import FakeApp
+
+class TestSlider(unittest.TestCase):
+    __slots__ = ('app', 'slider')
+    def setUp(self):
+        """Crea un lliscador de 7 posicions (0-6) de 360 píxels centrat a (600, 720)
+        """
+        self.app = FakeApp(tracked=True)
+        self.slider = Slider(self.app, "slider", x=600, y=720, width=360, height=24,
+                             min_value=0, max_value=6, slices=7)
+
+    def test_slice(self):
+        """1. Test de la posició: la més propera al ratolí, com la cerca lineal
+        """
+        values = [i * 6 / 6 for i in range(7)]
+        for mouse_x in range(380, 821, 5):
+            value = (mouse_x - 420) / 360 * 6
+            expected = min(range(7), key=lambda i: abs(values[i] - value))
+            self.assertEqual(self.slider.update_value(mouse_x), values[expected])
+
+    def test_drag(self):
+        """2. Test d'un arrossegament: no es crea cap objecte de GL
+        """
+        self.slider.render()
+        self.app.gui.renderer.flush()
+        before = self.app.ctx.tracker.totals()
+
+        self.slider.check_click((600, 720))
+        for mouse_x in list(range(420, 780)) + list(range(780, 420, -1)):
+            event = self.slider.check_motion((mouse_x, 720))
+            self.assertEqual(event, SliderChanged("slider", self.slider.update_value(mouse_x)))
+            self.slider.render()
+            self.app.gui.renderer.flush()
+        self.assertEqual(self.slider.check_unclick((420, 720)), Released("slider"))
+
+        self.assertEqual(self.app.ctx.tracker.totals(), before)
+
+if __name__ == '__main__':
+    unittest.main()
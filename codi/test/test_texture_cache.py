@@ -0,0 +1,101 @@
+import unittest
+import sys
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+# Add the parent directory to the Python path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from objects.texture_cache import TextureCache
+
+class TestTextureCache(unittest.TestCase):
+    __slots__ = ('directory', 'path', 'pixels', 'cache')
+    def setUp(self):
+        """Crea una imatge 4x2 amb un píxel de cada color i una memòria cau buida
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.pixels = np.arange(4 * 2 * 3, dtype='u1').reshape(2, 4, 3)
+        self.path = os.path.join(self.directory.name, "image.png")
+        Image.fromarray(self.pixels).save(self.path)
+        self.cache = TextureCache(os.path.join(self.directory.name, "cache"))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_orientation(self):
+        """1. Test de l'orientació dels píxels (la de Object.load_texture)
+        """
+        np.testing.assert_array_equal(TextureCache.decode(self.path), self.pixels[::-1, ::-1])
+        np.testing.assert_array_equal(TextureCache.decode(self.path, mirror=False), self.pixels[::-1])
+        self.assertEqual(TextureCache.decode(self.path, 4).shape, (2, 4, 4))
+
+    def test_resize(self):
+        """2. Test de l'escalat a la mida demanada
+        """
+        self.assertEqual(TextureCache.decode(self.path, size=(8, 4)).shape, (4, 8, 3))
+
+    def test_hit(self):
+        """3. Test de la segona càrrega: es llegeix el fitxer amb mmap
+        """
+        first = self.cache.load(self.path)
+        second = self.cache.load(self.path)
+        self.assertEqual((self.cache.misses, self.cache.hits), (1, 1))
+        self.assertIsInstance(second, np.memmap)
+        np.testing.assert_array_equal(first, second)
+
+    def test_invalidation(self):
+        """4. Test de la invalidació quan canvia la imatge o els paràmetres
+        """
+        self.cache.load(self.path)
+        self.cache.load(self.path, size=(8, 4))
+        Image.fromarray(255 - self.pixels).save(self.path)
+        os.utime(self.path, ns=(0, 1))
+        pixels = self.cache.load(self.path)
+        self.assertEqual((self.cache.misses, self.cache.hits), (3, 0))
+        np.testing.assert_array_equal(pixels, (255 - self.pixels)[::-1, ::-1])
+
+    def test_disabled(self):
+        """5. Test sense directori: no es desa res
+        """
+        self.cache.directory = None
+        self.cache.load(self.path)
+        self.assertEqual((self.cache.misses, self.cache.hits), (0, 0))
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "cache")))
+
+    def test_prefetch(self):
+        """6. Test de les variants avançades en un fil de treball: cada mida és una entrada diferent
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            self.cache.prefetch(pool, self.path, size=(2, 1))
+            self.cache.prefetch(pool, self.path)
+            self.assertEqual(self.cache.load(self.path, size=(2, 1)).shape, (1, 2, 3))
+            self.cache.discard(self.path)
+        self.assertEqual(self.cache.pending, {})
+        self.assertTrue(self.cache.ready(self.path))
+
+    def test_prune(self):
+        """7. Test de les entrades antigues: en desar-ne una de nova s'esborren les de la mateixa imatge
+        que no s'han fet servir en aquesta execució
+        """
+        other = os.path.join(self.directory.name, "other.png")
+        Image.fromarray(self.pixels).save(other)
+        self.cache.load(other)
+        self.cache.load(self.path)
+        self.cache.load(self.path, size=(8, 4))
+        self.assertEqual(len(os.listdir(self.cache.directory)), 3)
+
+        Image.fromarray(255 - self.pixels).save(self.path)
+        os.utime(self.path, ns=(0, 1))
+        cache = TextureCache(self.cache.directory)
+        cache.load(self.path)
+        self.assertEqual(sorted(os.listdir(cache.directory)),
+                         sorted(os.path.basename(cache.cache_path(path)) for path in (self.path, other)))
+
+if __name__ == '__main__':
+    unittest.main()
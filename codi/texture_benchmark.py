@@ -0,0 +1,49 @@
+"""Benchmark d'arrencada de les textures: decodificació i pujada a la GPU de totes les imatges de textures/,
+primer amb la memòria cau buida (fred) i després llegint-la amb mmap (calent).
+
+Ús (des de codi/): python texture_benchmark.py [backend]   (p. ex. "egl" en un servidor sense pantalla)
+"""
+import os
+import sys
+import tempfile
+import time
+
+import moderngl as mgl
+
+from objects.texture_cache import TextureCache
+
+
+def upload_all(ctx, cache, paths):
+    """Carregar i pujar totes les textures com ho fa Object.load_texture()
+
+    Args:
+        ctx (mgl.Context): Context de ModernGL
+        cache (TextureCache): Memòria cau de textures
+        paths (list): Paths de les imatges
+
+    Returns:
+        float: Temps total en segons
+    """
+    start = time.perf_counter()
+    for path in paths:
+        pixels = cache.load(path, 3)
+        texture = ctx.texture((pixels.shape[1], pixels.shape[0]), 3, pixels)
+        texture.build_mipmaps()
+        texture.release()
+    ctx.finish()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    backend = {"backend": sys.argv[1]} if len(sys.argv) > 1 else {}
+    ctx = mgl.create_standalone_context(**backend)
+    paths = sorted(os.path.join("textures", name) for name in os.listdir("textures")
+                   if name.lower().endswith((".jpg", ".png")))
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TextureCache(directory)
+        cold = upload_all(ctx, cache, paths)
+        warm = upload_all(ctx, cache, paths)
+
+    print(f"{len(paths)} textures | fred: {cold * 1000:.0f} ms | calent: {warm * 1000:.0f} ms "
+          f"({cold / warm:.1f}x)")